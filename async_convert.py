@@ -0,0 +1,318 @@
+"""
+Async Conversion API
+Converts Word documents from asyncio code without blocking the event loop.
+
+A converter keeps a pool of worker threads, each COM-initialized with its own
+warm Word instance (see parallel_batch.start_workers). Coroutines wait for a
+free worker instead of piling documents onto Word, so the number of
+conversions in progress never exceeds the number of workers:
+
+    async with AsyncConverter(workers=4) as converter:
+        pdf = await converter.convert('report.docx')
+        async for result in converter.iter_converted(paths, output_folder='pdfs'):
+            print(result.input_file, result.error or 'ok')
+
+For one-off batches, convert_many() and iter_converted() create and close a
+converter themselves.
+"""
+
+import asyncio
+import queue
+from functools import partial
+from pathlib import Path
+
+from conversion_backends import get_backend_factory, DEFAULT_BACKEND
+from conversion_watchdog import Watchdog, DEFAULT_TIMEOUT_SECONDS, DEFAULT_TIMEOUT_PER_MB
+from export_profiles import export_options, DEFAULT_PROFILE
+from parallel_batch import BatchResult, start_workers, stop_workers
+from word_pool import DEFAULT_MAX_DOCUMENTS, DEFAULT_MAX_MEMORY_MB
+
+
+DEFAULT_CONCURRENCY = 2
+
+# Documents read ahead from `paths` per worker by iter_converted(), so the
+# next document is ready when a worker frees up without reading every path
+PREFETCH_PER_WORKER = 2
+
+
+class ConversionResult:
+    """Outcome of one document converted by an AsyncConverter."""
+
+    def __init__(self, input_file, output_file, error=None, duration=None):
+        self.input_file = input_file
+        self.output_file = output_file
+        self.error = error
+        self.duration = duration
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = 'ok' if self.ok else f'failed: {self.error}'
+        return f"ConversionResult({self.input_file.name!r}, {status})"
+
+
+def _export(session, input_file, output_file, options):
+    """Export one document on a worker's Word session."""
+    session.convert(input_file.resolve(), output_file.resolve(), options)
+
+
+def _output_path(input_file, output_path=None, output_folder=None):
+    if output_path is not None:
+        return Path(output_path)
+    if output_folder is not None:
+        return Path(output_folder) / input_file.with_suffix('.pdf').name
+    return input_file.with_suffix('.pdf')
+
+
+class AsyncConverter:
+    """
+    Pool of conversion workers driven from an asyncio event loop.
+
+    Use it as an async context manager, or call start() and close(). Each
+    worker converts one document at a time; convert() waits for a free worker
+    first, which is the backpressure: `waiting` and `running` show how much
+    work is held back and in progress.
+
+    Cancelling a convert() that is still waiting for a worker withdraws the
+    document. A document Word has already started on cannot be interrupted;
+    it finishes in the background and its worker is then free again. Stuck
+    documents are stopped by the per-document time limit, which kills that
+    worker's Word instance and fails the document with ConversionTimeout.
+
+    Args:
+        workers (int): Number of worker threads / Word instances
+        backend (str): Conversion backend name ('word', 'docx2pdf', or 'fake' for testing)
+        backend_options (dict, optional): Settings passed to the backend
+        export_profile (str): PDF settings: 'print', 'screen' or 'archive'
+        timeout (float): Stop Word and fail a document after this many seconds,
+            plus `timeout_per_mb` per MB of input (0 = no limit)
+        timeout_per_mb (float): Extra seconds allowed per MB of input
+        max_documents (int): Recycle each worker's Word after this many documents
+        max_memory_mb (float): Recycle each worker's Word above this memory use
+        cache (ConversionCache, optional): Reuse cached PDFs for unchanged documents
+        index (OutputIndex, optional): Record every produced PDF for find_pdf.py
+    """
+
+    def __init__(self, workers=DEFAULT_CONCURRENCY, backend=DEFAULT_BACKEND, backend_options=None,
+                 export_profile=DEFAULT_PROFILE, timeout=DEFAULT_TIMEOUT_SECONDS,
+                 timeout_per_mb=DEFAULT_TIMEOUT_PER_MB, max_documents=DEFAULT_MAX_DOCUMENTS,
+                 max_memory_mb=DEFAULT_MAX_MEMORY_MB, cache=None, index=None):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.backend = backend
+        self.backend_options = backend_options
+        self.export_profile = export_profile
+        self.timeout = timeout
+        self.timeout_per_mb = timeout_per_mb
+        self.max_documents = max_documents
+        self.max_memory_mb = max_memory_mb
+        self.cache = cache
+        self.index = index
+        self.result = BatchResult(on_record=self._on_record)
+        self.waiting = 0
+        self._jobs = queue.Queue()
+        self._threads = []
+        self._watchdog = None
+        self._loop = None
+        self._slots = None
+        self._futures = {}
+        self._closed = False
+
+    @property
+    def running(self):
+        """Documents being converted by a worker right now."""
+        return len(self._futures)
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False
+
+    def start(self):
+        """Start the worker threads (Word starts in each with its first document)."""
+        if self._threads:
+            return
+        if self._closed:
+            raise RuntimeError("AsyncConverter is closed")
+        self._loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._watchdog = Watchdog(self.timeout, self.timeout_per_mb)
+        options = export_options(self.export_profile)
+        self._threads = start_workers(
+            self._jobs, self.workers, self.result, partial(_export, options=options),
+            backend_factory=get_backend_factory(self.backend, self.backend_options),
+            max_documents=self.max_documents, max_memory_mb=self.max_memory_mb,
+            cache=self.cache, cache_options={'backend': self.backend, **options},
+            on_success=self.index.record if self.index is not None else None,
+            watchdog=self._watchdog, name='async'
+        )
+
+    def _on_record(self, input_file, duration, error):
+        """Called on a worker thread when a document finishes."""
+        try:
+            self._loop.call_soon_threadsafe(self._finish, input_file, duration, error)
+        except RuntimeError:
+            # The event loop was closed without closing the converter
+            pass
+
+    def _finish(self, input_file, duration, error):
+        future = self._futures.pop(input_file, None)
+        self._slots.release()
+        if future is not None and not future.done():
+            future.set_result((duration, error))
+
+    async def convert(self, input_path, output_path=None):
+        """
+        Convert one document, waiting for a free worker first.
+
+        Args:
+            input_path (str): Path to the Word document
+            output_path (str, optional): Path for the PDF (default: next to the document)
+
+        Returns:
+            str: Path to the generated PDF file
+
+        Raises:
+            Exception: The conversion error, e.g. ConversionTimeout
+        """
+        result = await self._convert(Path(input_path), output_path)
+        if result.error is not None:
+            raise result.error
+        return str(result.output_file)
+
+    async def _convert(self, input_file, output_path=None, output_folder=None):
+        """Convert one document and return its ConversionResult instead of raising."""
+        if not self._threads:
+            self.start()
+        input_file = input_file.resolve()
+        output_file = _output_path(input_file, output_path, output_folder)
+        if not input_file.exists():
+            return ConversionResult(input_file, output_file,
+                                    FileNotFoundError(f"Input file not found: {input_file}"))
+
+        self.waiting += 1
+        try:
+            while True:
+                # Results are matched to documents by input path, so the same
+                # path is not converted twice at once
+                while input_file in self._futures:
+                    await asyncio.wait([self._futures[input_file]])
+                await self._slots.acquire()
+                if input_file not in self._futures:
+                    break
+                self._slots.release()
+        finally:
+            self.waiting -= 1
+        if self._closed:
+            self._slots.release()
+            raise RuntimeError("AsyncConverter is closed")
+
+        future = self._loop.create_future()
+        self._futures[input_file] = future
+        self._jobs.put((input_file, output_file))
+        # Shield the job from cancellation of the caller: a started conversion
+        # still has to finish before its worker takes the next document
+        duration, error = await asyncio.shield(future)
+        return ConversionResult(input_file, output_file, error, duration)
+
+    async def iter_converted(self, paths, output_folder=None):
+        """
+        Convert documents, yielding each ConversionResult as soon as it finishes.
+
+        `paths` is read lazily, a few documents per worker ahead, so it can be
+        a generator over a very large folder. Failed documents are yielded
+        with their error rather than raised. Closing the iterator early
+        withdraws the documents still waiting for a worker.
+
+        Args:
+            paths (iterable): Word document paths
+            output_folder (str, optional): Folder for the PDFs (default: next to each document)
+
+        Yields:
+            ConversionResult: In the order the conversions finish
+        """
+        paths = iter(paths)
+        limit = self.workers * PREFETCH_PER_WORKER
+        pending = set()
+        try:
+            while True:
+                for path in paths:
+                    pending.add(asyncio.ensure_future(self._convert(Path(path), output_folder=output_folder)))
+                    if len(pending) >= limit:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def convert_many(self, paths, output_folder=None):
+        """
+        Convert documents and wait for all of them.
+
+        Args:
+            paths (iterable): Word document paths
+            output_folder (str, optional): Folder for the PDFs (default: next to each document)
+
+        Returns:
+            list: ConversionResult per document, in the order of `paths`
+        """
+        paths = [Path(path).resolve() for path in paths]
+        by_input = {}
+        async for result in self.iter_converted(paths, output_folder):
+            by_input.setdefault(result.input_file, []).append(result)
+        return [by_input[path].pop(0) for path in paths]
+
+    async def close(self):
+        """Finish the documents in progress and stop the workers and Word."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._threads:
+            await self._loop.run_in_executor(None, stop_workers, self._jobs, self._threads)
+            self._watchdog.close()
+
+
+async def convert_many(paths, concurrency=DEFAULT_CONCURRENCY, output_folder=None, **options):
+    """
+    Convert documents with `concurrency` Word instances and wait for all of them.
+
+    Args:
+        paths (iterable): Word document paths
+        concurrency (int): Documents converted at once
+        output_folder (str, optional): Folder for the PDFs (default: next to each document)
+        **options: Other AsyncConverter settings (backend, timeout, ...)
+
+    Returns:
+        list: ConversionResult per document, in the order of `paths`
+    """
+    async with AsyncConverter(workers=concurrency, **options) as converter:
+        return await converter.convert_many(paths, output_folder)
+
+
+async def iter_converted(paths, concurrency=DEFAULT_CONCURRENCY, output_folder=None, **options):
+    """
+    Convert documents with `concurrency` Word instances, yielding each
+    ConversionResult as soon as it finishes.
+
+    Args:
+        paths (iterable): Word document paths
+        concurrency (int): Documents converted at once
+        output_folder (str, optional): Folder for the PDFs (default: next to each document)
+        **options: Other AsyncConverter settings (backend, timeout, ...)
+
+    Yields:
+        ConversionResult: In the order the conversions finish
+    """
+    async with AsyncConverter(workers=concurrency, **options) as converter:
+        async for result in converter.iter_converted(paths, output_folder):
+            yield result
@@ -0,0 +1,122 @@
+"""
+Batch Deduplication
+Converts byte-identical documents in a batch only once. Shares often hold
+many copies of the same .docx in different folders; each copy's PDF is
+placed from the first copy's PDF instead of exporting it again.
+
+Documents are grouped by size as they stream in, and only documents whose
+size matches an earlier one are hashed, so a batch without duplicates costs
+one stat per document.
+"""
+
+import threading
+import time
+from pathlib import Path
+from conversion_cache import hash_file, link_or_copy
+
+
+class BatchDeduplicator:
+    """
+    Holds back duplicate documents and gives them the PDF of their first copy.
+
+    Filter the batch jobs through pending(), pass record_result() the outcome
+    of each converted document (it fits the BatchResult on_record signature),
+    then call fan_out() once the conversions have finished.
+    """
+
+    def __init__(self):
+        self.saved = 0
+        self.copies = {}
+        self._by_size = {}
+        self._digests = {}
+        self._outcomes = {}
+        self._lock = threading.Lock()
+
+    def _digest(self, input_file):
+        if input_file not in self._digests:
+            self._digests[input_file] = hash_file(input_file)
+        return self._digests[input_file]
+
+    def _first_copy(self, input_file, output_file):
+        """
+        The earlier job with the same content as `input_file`, or None if it
+        is the first of its kind (it is then remembered for later documents).
+        """
+        try:
+            size = input_file.stat().st_size
+        except OSError:
+            # Let the conversion report the missing or unreadable document
+            return None
+        same_size = self._by_size.setdefault(size, [])
+        try:
+            if same_size:
+                digest = self._digest(input_file)
+                for job in same_size:
+                    if self._digest(job[0]) == digest:
+                        return job
+        except OSError:
+            return None
+        same_size.append((input_file, output_file))
+        return None
+
+    def pending(self, jobs):
+        """
+        Pass on the first copy of each document, holding back identical copies.
+
+        Args:
+            jobs (iterable): (input_file, output_file) pairs
+
+        Yields:
+            tuple: (input_file, output_file) pairs to convert
+        """
+        for input_file, output_file in jobs:
+            first = self._first_copy(input_file, output_file)
+            if first is None:
+                yield input_file, output_file
+            else:
+                self.copies.setdefault(first, []).append((input_file, output_file))
+
+    def record_result(self, input_file, duration, error):
+        """on_record callback for BatchResult: remember whether a document converted."""
+        with self._lock:
+            self._outcomes[input_file] = error
+
+    def fan_out(self, result, on_success=None):
+        """
+        Place each converted document's PDF at the output paths of its
+        identical copies (hardlink, reflink or copy), recording every copy in
+        `result`. Copies of documents that failed fail with them.
+
+        Args:
+            result (BatchResult): Batch outcome the copies are added to
+            on_success (callable, optional): Called as on_success(input_file,
+                output_file) for each copy given a PDF
+        """
+        for (first_input, first_output), copies in self.copies.items():
+            with self._lock:
+                converted = first_input in self._outcomes and self._outcomes[first_input] is None
+            for input_file, output_file in copies:
+                start = time.perf_counter()
+                if not converted:
+                    result.record(input_file, 0.0, RuntimeError(
+                        f"identical to {first_input.name}, which was not converted"))
+                    print(f"✗ {input_file.name}: identical to {first_input.name}, which was not converted")
+                    continue
+                try:
+                    if Path(output_file).resolve() != Path(first_output).resolve():
+                        link_or_copy(first_output, output_file)
+                except OSError as e:
+                    result.record(input_file, time.perf_counter() - start, e)
+                    print(f"✗ {input_file.name}: could not place the PDF of {first_input.name}: {e}")
+                    continue
+                if on_success is not None:
+                    on_success(input_file, output_file)
+                result.record(input_file, time.perf_counter() - start)
+                self.saved += 1
+
+
+def add_dedup_argument(parser):
+    """Add the --no-dedup option to an argparse parser."""
+    parser.add_argument('--no-dedup', action='store_true',
+                        help='Convert byte-identical documents in a batch separately instead of '
+                             'converting one copy and linking its PDF for the others')
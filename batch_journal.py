@@ -0,0 +1,195 @@
+"""
+Batch Journal
+Write-ahead log of a batch run, so a run that was interrupted by a Word
+crash, reboot or Ctrl+C can be resumed instead of started over.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+JOURNAL_NAME = '.word_to_pdf_journal.jsonl'
+JOURNAL_VERSION = 1
+
+PENDING = 'pending'
+IN_PROGRESS = 'in-progress'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class BatchJournal:
+    """
+    Append-only record of each document's state during a batch run.
+
+    Every state change (pending, in-progress, done, failed) is appended as one
+    JSON line and fsync'd before the batch moves on, so the journal survives a
+    crash at any point. When resuming, the last record of each document wins:
+    done documents are skipped, and documents that were in progress when the
+    run died are converted again after their partial PDF is deleted.
+
+    Documents are keyed on their path relative to the input folder.
+
+    Args:
+        input_dir (Path): Folder being batch converted
+        journal_dir (Path): Folder the journal file is written to
+    """
+
+    def __init__(self, input_dir, journal_dir):
+        self.input_dir = Path(input_dir).resolve()
+        self.path = Path(journal_dir) / JOURNAL_NAME
+        self.states = {}
+        self.skipped = 0
+        self.requeued = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _key(self, input_file):
+        return Path(input_file).resolve().relative_to(self.input_dir).as_posix()
+
+    def open(self, resume=False):
+        """
+        Open the journal for writing.
+
+        Args:
+            resume (bool): Continue the previous run's journal. Otherwise any
+                existing journal is replaced and every document is converted.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume:
+            self._replay()
+            self._cleanup_interrupted()
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+        if not resume or not self.states:
+            self._append({'journal': JOURNAL_VERSION, 'input': str(self.input_dir),
+                          'started': time.time()})
+        return self
+
+    def _replay(self):
+        """Load the last recorded state of every document."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            print("⚠ No journal found to resume; starting a new run")
+            return
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash can leave the final line half-written
+                continue
+            if 'file' in record:
+                self.states[record['file']] = record
+
+        done = sum(1 for record in self.states.values() if record['state'] == DONE)
+        print(f"Resuming previous run: {done} document(s) already converted")
+
+    def _cleanup_interrupted(self):
+        """Delete partial PDFs of documents that were converting when the run stopped."""
+        for key, record in self.states.items():
+            if record['state'] != IN_PROGRESS or not record.get('output'):
+                continue
+            output_file = Path(record['output'])
+            try:
+                output_file.unlink()
+                print(f"🗑 Removed partial PDF: {output_file}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"⚠ Could not remove partial PDF {output_file}: {e}")
+            print(f"↻ Re-queued interrupted document: {key}")
+            self.requeued += 1
+
+    def _append(self, record):
+        line = json.dumps(record) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def mark(self, input_file, state, output_file=None, error=None):
+        """
+        Durably record a document's new state.
+
+        Args:
+            input_file (Path): Word document
+            state (str): PENDING, IN_PROGRESS, DONE or FAILED
+            output_file (Path, optional): Its output PDF (default: as previously recorded)
+            error (Exception, optional): Failure reason
+        """
+        key = self._key(input_file)
+        with self._lock:
+            if output_file is None:
+                output = self.states.get(key, {}).get('output')
+            else:
+                output = str(Path(output_file).resolve())
+            record = {'file': key, 'output': output, 'state': state, 'time': time.time()}
+            if error is not None:
+                record['error'] = str(error)
+            self.states[key] = record
+        self._append(record)
+
+    def pending(self, jobs):
+        """
+        Journal jobs as pending, skipping documents already converted by the resumed run.
+
+        Args:
+            jobs (iterable): (input_file, output_file) pairs
+
+        Yields:
+            tuple: (input_file, output_file) pairs still to convert
+        """
+        for input_file, output_file in jobs:
+            with self._lock:
+                previous = self.states.get(self._key(input_file))
+            if previous is not None and previous['state'] == DONE and Path(output_file).exists():
+                self.skipped += 1
+                continue
+            self.mark(input_file, PENDING, output_file)
+            yield input_file, output_file
+
+    def mark_in_progress(self, input_file, output_file):
+        """on_start callback for batch workers."""
+        self.mark(input_file, IN_PROGRESS, output_file)
+
+    def record_result(self, input_file, duration, error):
+        """on_record callback for BatchResult."""
+        self.mark(input_file, DONE if error is None else FAILED, error=error)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def finish(self):
+        """
+        Close the journal of a run that went through every document. It is
+        deleted unless some documents failed, so that --resume can retry them;
+        only interrupted or partly failed runs leave a journal behind.
+
+        Returns:
+            bool: True if the journal was kept
+        """
+        self.close()
+        with self._lock:
+            failed = any(record['state'] == FAILED for record in self.states.values())
+        if failed:
+            return True
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠ Could not remove the batch journal {self.path}: {e}")
+        return False
@@ -0,0 +1,148 @@
+"""
+Batch Manifest
+Records which Word documents a batch has already converted, so incremental
+runs only convert new or changed documents.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from conversion_cache import hash_file
+
+
+MANIFEST_NAME = '.word_to_pdf_manifest.json'
+MANIFEST_VERSION = 1
+
+
+class BatchManifest:
+    """
+    Persistent record of converted inputs, stored in the batch output folder.
+
+    Each entry is keyed on the input's path relative to the input folder and
+    holds its size, mtime, SHA-256 content hash and output PDF path. A document
+    is up to date when its size and mtime are unchanged (or, if only the mtime
+    changed, its content hash is unchanged) and its PDF still exists.
+
+    Args:
+        input_dir (Path): Folder being batch converted
+        manifest_dir (Path): Folder the manifest file is written to
+    """
+
+    def __init__(self, input_dir, manifest_dir):
+        self.input_dir = Path(input_dir).resolve()
+        self.path = Path(manifest_dir) / MANIFEST_NAME
+        self.entries = {}
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    def _key(self, input_file):
+        return Path(input_file).resolve().relative_to(self.input_dir).as_posix()
+
+    def load(self):
+        """Load the manifest from disk, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+            return
+        if data.get('version') != MANIFEST_VERSION:
+            self.entries = {}
+            return
+        self.entries = data.get('entries', {})
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with self._lock:
+            data = {'version': MANIFEST_VERSION, 'entries': self.entries}
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1)
+        os.replace(temp_path, self.path)
+
+    def is_up_to_date(self, input_file, output_file):
+        """
+        Check whether a document's recorded PDF is still current.
+
+        Args:
+            input_file (Path): Word document
+            output_file (Path): Expected output PDF
+
+        Returns:
+            bool: True if the document does not need converting again
+        """
+        key = self._key(input_file)
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is None or entry['output'] != str(Path(output_file).resolve()):
+            return False
+        if not Path(output_file).exists():
+            return False
+
+        stat = Path(input_file).stat()
+        if stat.st_size != entry['size']:
+            return False
+        if stat.st_mtime == entry['mtime']:
+            return True
+
+        # Touched but possibly unchanged (e.g. copied or re-saved): compare contents
+        if hash_file(input_file) != entry['sha256']:
+            return False
+        with self._lock:
+            entry['mtime'] = stat.st_mtime
+        return True
+
+    def pending(self, jobs):
+        """
+        Filter (input_file, output_file) jobs down to those that need converting.
+
+        Jobs are consumed lazily; unchanged documents are counted in `skipped`.
+        """
+        for input_file, output_file in jobs:
+            if self.is_up_to_date(input_file, output_file):
+                self.skipped += 1
+                continue
+            yield input_file, output_file
+
+    def record(self, input_file, output_file):
+        """Record a successful conversion."""
+        stat = Path(input_file).stat()
+        entry = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'sha256': hash_file(input_file),
+            'output': str(Path(output_file).resolve()),
+            'converted_at': time.time(),
+        }
+        with self._lock:
+            self.entries[self._key(input_file)] = entry
+
+    def remove_orphans(self, delete_pdfs=False):
+        """
+        Drop entries whose source document no longer exists.
+
+        Args:
+            delete_pdfs (bool): If True, also delete the orphaned PDFs
+
+        Returns:
+            list: Output paths of the orphaned entries
+        """
+        orphans = []
+        with self._lock:
+            for key in list(self.entries):
+                if (self.input_dir / key).exists():
+                    continue
+                orphans.append(self.entries.pop(key)['output'])
+
+        if delete_pdfs:
+            for output in orphans:
+                try:
+                    os.remove(output)
+                    print(f"🗑 Removed orphaned PDF: {output}")
+                except FileNotFoundError:
+                    pass
+        return orphans
@@ -0,0 +1,250 @@
+"""
+Synthetic .docx Corpus Generator
+Builds reproducible Word documents directly as zip + WordprocessingML, with
+controllable page count, embedded images, tables and file count.
+
+Usage:
+    python benchmarks/corpus.py out_dir --files 50 --pages 10 --images 3 --image-kb 200 --tables 2
+"""
+
+import argparse
+import random
+import struct
+import zipfile
+import zlib
+from pathlib import Path
+
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Default Extension="png" ContentType="image/png"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>
+<Override PartName="/docProps/app.xml" ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>
+</Types>"""
+
+_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>
+<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/extended-properties" Target="docProps/app.xml"/>
+</Relationships>"""
+
+_CORE = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<dc:title>{title}</dc:title>
+<dc:creator>benchmarks/corpus.py</dc:creator>
+</cp:coreProperties>"""
+
+_APP = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">
+<Application>Microsoft Office Word</Application>
+<Pages>{pages}</Pages>
+<Words>{words}</Words>
+</Properties>"""
+
+_DOCUMENT_START = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">
+<w:body>
+"""
+
+_DOCUMENT_END = """<w:sectPr><w:pgSz w:w="11906" w:h="16838"/></w:sectPr>
+</w:body>
+</w:document>"""
+
+_IMAGE = """<w:p><w:r><w:drawing><wp:inline><wp:extent cx="3048000" cy="2286000"/><wp:docPr id="{id}" name="Picture {id}"/><a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture"><pic:pic><pic:nvPicPr><pic:cNvPr id="{id}" name="image{id}.png"/><pic:cNvPicPr/></pic:nvPicPr><pic:blipFill><a:blip r:embed="rIdImg{id}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill><pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="3048000" cy="2286000"/></a:xfrm><a:prstGeom prst="rect"/></pic:spPr></pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r></w:p>
+"""
+
+_WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+          "incididunt ut labore et dolore magna aliqua ut enim ad minim veniam quis nostrud").split()
+
+# Roughly one A4 page of body text
+_PARAGRAPHS_PER_PAGE = 6
+_WORDS_PER_PARAGRAPH = 80
+
+
+def _png_chunk(kind, data):
+    return (struct.pack('>I', len(data)) + kind + data
+            + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+
+def make_png(size_kb, rng):
+    """
+    Build a valid grayscale PNG of roughly `size_kb` kilobytes.
+
+    The pixels are random noise so the image does not compress, which keeps the
+    file size (and Word's work to embed it) close to the requested size.
+    """
+    width = 256
+    height = max(1, int(size_kb * 1024 / (width + 1)))
+    raw = b''.join(b'\x00' + bytes(rng.getrandbits(8) for _ in range(width)) for _ in range(height))
+    header = struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + _png_chunk(b'IHDR', header)
+            + _png_chunk(b'IDAT', zlib.compress(raw, 1)) + _png_chunk(b'IEND', b''))
+
+
+def _paragraph(rng):
+    text = ' '.join(rng.choice(_WORDS) for _ in range(_WORDS_PER_PARAGRAPH))
+    return f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>\n'
+
+
+def _table(rng, rows=6, columns=4):
+    cells = []
+    for _ in range(rows):
+        row = ''.join(f'<w:tc><w:p><w:r><w:t>{rng.choice(_WORDS)} {rng.randint(1, 999)}</w:t></w:r></w:p></w:tc>'
+                      for _ in range(columns))
+        cells.append(f'<w:tr>{row}</w:tr>')
+    grid = ''.join('<w:gridCol w:w="2000"/>' for _ in range(columns))
+    return (f'<w:tbl><w:tblPr><w:tblW w:w="0" w:type="auto"/></w:tblPr>'
+            f'<w:tblGrid>{grid}</w:tblGrid>{"".join(cells)}</w:tbl>\n')
+
+
+def write_docx(path, pages=5, images=0, image_kb=100, tables=0, seed=0):
+    """
+    Write one synthetic .docx file.
+
+    Args:
+        path (str): Output .docx path
+        pages (int): Approximate number of pages of body text
+        images (int): Number of embedded PNG images
+        image_kb (int): Approximate size of each image in KB
+        tables (int): Number of tables
+        seed (int): Random seed; the same arguments always give the same bytes
+    """
+    rng = random.Random(seed)
+    pages = max(1, pages)
+    body = []
+    relationships = []
+
+    # Spread images and tables evenly over the pages
+    image_pages = {int(i * pages / images) for i in range(images)} if images else set()
+    table_pages = {int(i * pages / tables) for i in range(tables)} if tables else set()
+    image_id = 0
+    tables_left = tables
+    images_left = images
+
+    for page in range(pages):
+        for _ in range(_PARAGRAPHS_PER_PAGE):
+            body.append(_paragraph(rng))
+        while images_left and (page in image_pages or page == pages - 1):
+            image_id += 1
+            images_left -= 1
+            body.append(_IMAGE.format(id=image_id))
+            relationships.append(
+                f'<Relationship Id="rIdImg{image_id}" '
+                f'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" '
+                f'Target="media/image{image_id}.png"/>'
+            )
+            if page != pages - 1:
+                break
+        while tables_left and (page in table_pages or page == pages - 1):
+            tables_left -= 1
+            body.append(_table(rng))
+            if page != pages - 1:
+                break
+        if page < pages - 1:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>\n')
+
+    document_rels = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                     + ''.join(relationships) + '</Relationships>')
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Fixed timestamps keep the archive byte-for-byte reproducible
+    date_time = (2020, 1, 1, 0, 0, 0)
+
+    def add(archive, name, data, compress=zipfile.ZIP_DEFLATED):
+        info = zipfile.ZipInfo(name, date_time)
+        info.compress_type = compress
+        archive.writestr(info, data)
+
+    with zipfile.ZipFile(path, 'w') as archive:
+        add(archive, '[Content_Types].xml', _CONTENT_TYPES)
+        add(archive, '_rels/.rels', _ROOT_RELS)
+        add(archive, 'docProps/core.xml', _CORE.format(title=path.stem))
+        add(archive, 'docProps/app.xml', _APP.format(
+            pages=pages, words=pages * _PARAGRAPHS_PER_PAGE * _WORDS_PER_PARAGRAPH))
+        add(archive, 'word/document.xml', _DOCUMENT_START + ''.join(body) + _DOCUMENT_END)
+        add(archive, 'word/_rels/document.xml.rels', document_rels)
+        for i in range(1, image_id + 1):
+            # PNG data is already compressed
+            add(archive, f'word/media/image{i}.png', make_png(image_kb, rng), zipfile.ZIP_STORED)
+    return path
+
+
+def generate_corpus(output_dir, files=20, pages=5, images=1, image_kb=100, tables=1,
+                    variation=0.0, seed=0, prefix='doc'):
+    """
+    Generate a reproducible corpus of .docx files.
+
+    Args:
+        output_dir (str): Folder to write the documents to
+        files (int): Number of documents
+        pages (int): Pages per document
+        images (int): Images per document
+        image_kb (int): Approximate size of each image in KB
+        tables (int): Tables per document
+        variation (float): 0..1; scales each document's pages, images and tables by
+            a random factor in [1 - variation, 1 + variation] to mix small and large files
+        seed (int): Random seed for the whole corpus
+        prefix (str): File name prefix
+
+    Returns:
+        list: Paths of the generated documents
+    """
+    rng = random.Random(seed)
+    paths = []
+    for i in range(files):
+        factor = 1.0 + rng.uniform(-variation, variation) if variation else 1.0
+        paths.append(write_docx(
+            Path(output_dir) / f"{prefix}_{i:04d}.docx",
+            pages=max(1, round(pages * factor)),
+            images=max(0, round(images * factor)),
+            image_kb=image_kb,
+            tables=max(0, round(tables * factor)),
+            seed=rng.getrandbits(32)
+        ))
+    return paths
+
+
+def add_corpus_arguments(parser):
+    """Add the corpus shape options to an argparse parser."""
+    parser.add_argument('--files', type=int, default=20, help='Number of documents (default: 20)')
+    parser.add_argument('--pages', type=int, default=5, help='Pages per document (default: 5)')
+    parser.add_argument('--images', type=int, default=1, help='Images per document (default: 1)')
+    parser.add_argument('--image-kb', type=int, default=100, help='Approximate KB per image (default: 100)')
+    parser.add_argument('--tables', type=int, default=1, help='Tables per document (default: 1)')
+    parser.add_argument('--variation', type=float, default=0.0,
+                        help='Per-document size variation, 0..1 (default: 0)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+
+
+def corpus_options(args):
+    """Collect corpus shape options from parsed arguments."""
+    return {
+        'files': args.files,
+        'pages': args.pages,
+        'images': args.images,
+        'image_kb': args.image_kb,
+        'tables': args.tables,
+        'variation': args.variation,
+        'seed': args.seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic .docx corpus for benchmarking')
+    parser.add_argument('output_dir', help='Folder to write the documents to')
+    add_corpus_arguments(parser)
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.output_dir, **corpus_options(args))
+    total_mb = sum(p.stat().st_size for p in paths) / (1024 * 1024)
+    print(f"✓ Generated {len(paths)} document(s), {total_mb:.2f} MB in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,468 @@
+"""
+Conversion Benchmarks
+Runs the single-file, batch and config entry points over a synthetic corpus
+and reports throughput, per-document latency and peak memory as JSON.
+
+Usage:
+    python benchmarks/run_benchmarks.py --backend fake
+    python benchmarks/run_benchmarks.py --backend word --files 50 --workers 4 --output results.json
+    python benchmarks/run_benchmarks.py --backend fake --baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --backend fake --workers 4 --schedule fifo --schedule largest
+    python benchmarks/run_benchmarks.py --backend word --entry advanced --export-profile print --export-profile screen
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from corpus import generate_corpus, add_corpus_arguments, corpus_options  # noqa: E402
+from conversion_backends import parse_backend_options, BACKENDS  # noqa: E402
+from job_scheduler import SCHEDULES, FIFO  # noqa: E402
+from export_profiles import PROFILES, DEFAULT_PROFILE  # noqa: E402
+
+
+SCENARIOS = ('single', 'batch', 'config')
+ENTRY_POINTS = ('basic', 'advanced')
+
+# Allowed relative slowdown before a metric counts as a regression
+DEFAULT_TOLERANCE = 0.10
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values (list): Sample values
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float or None: The percentile, or None for an empty sample
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb():
+    """
+    Peak resident memory of the current process in MB.
+
+    Only the Python process is measured; Word runs out of process and is not included.
+
+    Returns:
+        float or None: Peak RSS in MB, or None if it cannot be determined
+    """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        import win32api
+        import win32process
+        info = win32process.GetProcessMemoryInfo(win32api.GetCurrentProcess())
+        return info['PeakWorkingSetSize'] / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def _run_single(entry, spec, documents, output_dir):
+    """Convert each document with its own call to the single-file entry point."""
+    if entry == 'basic':
+        from word_to_pdf import convert_word_to_pdf as convert
+    else:
+        from word_to_pdf_advanced import convert_word_to_pdf_advanced as convert
+
+    options = {'backend': spec['backend'], 'backend_options': spec['backend_options']}
+    if entry == 'advanced' and spec.get('export_profile'):
+        options['export_profile'] = spec['export_profile']
+    durations, failed = [], 0
+    for document in documents:
+        started = time.perf_counter()
+        try:
+            convert(str(document), str(output_dir / document.with_suffix('.pdf').name), **options)
+            durations.append(time.perf_counter() - started)
+        except Exception:
+            failed += 1
+    return durations, failed
+
+
+def _batch_options(entry, spec):
+    options = {'workers': spec['workers'], 'backend': spec['backend'],
+               'backend_options': spec['backend_options']}
+    if entry == 'advanced':
+        options['pooled'] = spec['pool']
+        if spec.get('schedule'):
+            options['schedule'] = spec['schedule']
+        if spec.get('export_profile'):
+            options['export_profile'] = spec['export_profile']
+    return options
+
+
+def _run_batch(entry, spec, corpus_dir, output_dir):
+    """Convert the corpus with one call to the batch entry point."""
+    if entry == 'basic':
+        from word_to_pdf import batch_convert as convert
+    else:
+        from word_to_pdf_advanced import batch_convert_advanced as convert
+
+    result = convert(str(corpus_dir), str(output_dir), **_batch_options(entry, spec))
+    return result.durations, result.failed
+
+
+def _run_config(entry, spec, corpus_dir, output_dir):
+    """Convert the corpus through a generated config.json."""
+    if entry == 'basic':
+        from word_to_pdf import run_from_config
+    else:
+        from word_to_pdf_advanced import run_from_config
+
+    # The batch keyword arguments double as config.json keys
+    config = {'batch_mode': True, 'input_folder': str(corpus_dir), 'output_folder': str(output_dir)}
+    config.update(_batch_options(entry, spec))
+    config_file = output_dir.parent / f"benchmark_config_{entry}.json"
+    config_file.write_text(json.dumps(config), encoding='utf-8')
+    try:
+        result = run_from_config(str(config_file))
+    finally:
+        config_file.unlink()
+    return result.durations, result.failed
+
+
+def run_scenario(spec):
+    """
+    Run one scenario in the current process and measure it.
+
+    Args:
+        spec (dict): Scenario, entry point, corpus and backend settings
+
+    Returns:
+        dict: Benchmark metrics for the scenario
+    """
+    corpus_dir = Path(spec['corpus_dir'])
+    output_dir = Path(spec['output_dir'])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    documents = sorted(corpus_dir.glob('*.docx'))
+    scenario, entry = spec['scenario'], spec['entry']
+
+    started = time.perf_counter()
+    # Conversion progress output would dominate the benchmark report
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        if scenario == 'single':
+            durations, failed = _run_single(entry, spec, documents, output_dir)
+        elif scenario == 'batch':
+            durations, failed = _run_batch(entry, spec, corpus_dir, output_dir)
+        else:
+            durations, failed = _run_config(entry, spec, corpus_dir, output_dir)
+    elapsed = time.perf_counter() - started
+
+    converted = len(durations)
+    output_bytes = sum(pdf.stat().st_size for pdf in output_dir.rglob('*.pdf'))
+    return {
+        'documents': converted,
+        'failed': failed,
+        'wall_seconds': round(elapsed, 3),
+        'docs_per_min': round(converted / elapsed * 60, 2) if elapsed > 0 else None,
+        'latency_p50': _rounded(percentile(durations, 50)),
+        'latency_p95': _rounded(percentile(durations, 95)),
+        'latency_p99': _rounded(percentile(durations, 99)),
+        'peak_rss_mb': _rounded(peak_rss_mb(), 1),
+        'output_mb': round(output_bytes / (1024 * 1024), 3),
+        'output_kb_per_doc': round(output_bytes / 1024 / converted, 1) if converted else None,
+    }
+
+
+def _rounded(value, digits=3):
+    return None if value is None else round(value, digits)
+
+
+def _run_in_subprocess(spec):
+    """Run a scenario in a fresh interpreter so peak RSS is measured per scenario."""
+    with tempfile.TemporaryDirectory(prefix='word_to_pdf_bench_') as temp_dir:
+        spec_file = Path(temp_dir) / 'spec.json'
+        result_file = Path(temp_dir) / 'result.json'
+        spec_file.write_text(json.dumps(spec), encoding='utf-8')
+        command = [sys.executable, str(Path(__file__).resolve()),
+                   '--run-scenario', str(spec_file), '--result-file', str(result_file)]
+        completed = subprocess.run(command, cwd=str(REPO_ROOT))
+        if completed.returncode != 0 or not result_file.exists():
+            raise RuntimeError(f"Scenario {spec['scenario']}-{spec['entry']} exited with code {completed.returncode}")
+        return json.loads(result_file.read_text(encoding='utf-8'))
+
+
+def compare_to_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare benchmark results against a stored baseline.
+
+    Throughput may not drop, and p95 latency and peak RSS may not grow, by more
+    than `tolerance` (a fraction) for any scenario present in both.
+
+    Returns:
+        list: Human-readable regression descriptions (empty if none)
+    """
+    checks = (('docs_per_min', -1), ('latency_p95', 1), ('peak_rss_mb', 1))
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get('results', {}).get(name)
+        if not previous:
+            continue
+        for metric, direction in checks:
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change * direction > tolerance:
+                regressions.append(f"{name}: {metric} {old} -> {new} ({change:+.1%})")
+    return regressions
+
+
+def compare_schedules(results):
+    """
+    Add each scheduled run's makespan change against the FIFO run of the same
+    scenario, as `makespan_vs_fifo` (a fraction; negative is faster).
+
+    Returns:
+        list: Human-readable comparison lines
+    """
+    lines = []
+    for name, metrics in results.items():
+        base_name, _, schedule = name.rpartition('-')
+        if schedule not in SCHEDULES or schedule == FIFO:
+            continue
+        fifo = results.get(f"{base_name}-{FIFO}", {})
+        old, new = fifo.get('wall_seconds'), metrics.get('wall_seconds')
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        metrics['makespan_vs_fifo'] = round(change, 3)
+        lines.append(f"{name}: makespan {new:.2f}s vs {old:.2f}s with fifo ({change:+.1%})")
+    return lines
+
+
+def compare_profiles(results):
+    """
+    Add each export profile's output size and wall time against the 'print'
+    run of the same scenario, as `output_vs_print` and `time_vs_print`
+    (fractions; negative is smaller or faster).
+
+    Returns:
+        list: Human-readable comparison lines
+    """
+    lines = []
+    for name, metrics in results.items():
+        parts = name.split('-')
+        profile = next((part for part in parts if part in PROFILES), None)
+        if profile is None or profile == DEFAULT_PROFILE:
+            continue
+        base = results.get('-'.join(DEFAULT_PROFILE if part == profile else part for part in parts), {})
+        if not base.get('output_mb') or not base.get('wall_seconds') or 'output_mb' not in metrics:
+            continue
+        size_change = (metrics['output_mb'] - base['output_mb']) / base['output_mb']
+        time_change = (metrics['wall_seconds'] - base['wall_seconds']) / base['wall_seconds']
+        metrics['output_vs_print'] = round(size_change, 3)
+        metrics['time_vs_print'] = round(time_change, 3)
+        lines.append(f"{name}: {metrics['output_mb']:.2f} MB in {metrics['wall_seconds']:.2f}s vs "
+                     f"{base['output_mb']:.2f} MB in {base['wall_seconds']:.2f}s with {DEFAULT_PROFILE} "
+                     f"(size {size_change:+.1%}, time {time_change:+.1%})")
+    return lines
+
+
+def _print_report(results):
+    print(f"\n{'Scenario':<34} {'docs/min':>10} {'p50 (s)':>9} {'p95 (s)':>9} {'p99 (s)':>9} "
+          f"{'peak RSS':>10} {'PDF MB':>9} {'failed':>7}")
+    for name, metrics in results.items():
+        def cell(key, width):
+            value = metrics.get(key)
+            return f"{'-' if value is None else value:>{width}}"
+        print(f"{name:<34} {cell('docs_per_min', 10)} {cell('latency_p50', 9)} {cell('latency_p95', 9)} "
+              f"{cell('latency_p99', 9)} {cell('peak_rss_mb', 10)} {cell('output_mb', 9)} {cell('failed', 7)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark Word to PDF conversion over a synthetic corpus',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Quick run against the fake backend (no Word needed)
+  python benchmarks/run_benchmarks.py --backend fake
+
+  # Real Word, larger documents, parallel batch only
+  python benchmarks/run_benchmarks.py --backend word --pages 40 --images 10 --scenario batch --workers 4
+
+  # Record a baseline, then fail later runs that regress by more than 10%
+  python benchmarks/run_benchmarks.py --backend fake --output benchmarks/baseline.json
+  python benchmarks/run_benchmarks.py --backend fake --baseline benchmarks/baseline.json
+
+  # Makespan of largest-first scheduling against scan order on a mixed-size corpus
+  python benchmarks/run_benchmarks.py --backend fake --backend-option export_latency_per_mb=2 \\
+      --variation 0.9 --images 4 --scenario batch --entry advanced --workers 4 \\
+      --schedule fifo --schedule largest
+
+  # PDF size and export time of each export profile on an image-heavy corpus
+  python benchmarks/run_benchmarks.py --backend word --images 8 --image-kb 500 --entry advanced \\
+      --export-profile print --export-profile screen --export-profile archive
+        """
+    )
+    add_corpus_arguments(parser)
+    parser.add_argument('--corpus', help='Use an existing folder of .docx files instead of generating one')
+    parser.add_argument('--scenario', action='append', choices=SCENARIOS,
+                        help='Scenario to run (repeatable, default: all)')
+    parser.add_argument('--entry', action='append', choices=ENTRY_POINTS,
+                        help='Entry point module to run (repeatable, default: all)')
+    parser.add_argument('--backend', choices=sorted(BACKENDS),
+                        help="Conversion backend (default: each entry point's own default)")
+    parser.add_argument('--backend-option', action='append', metavar='KEY=VALUE',
+                        help='Backend setting, e.g. export_latency=0.2 for the fake backend (repeatable)')
+    parser.add_argument('--workers', type=int, default=1, help='Parallel workers for batch/config runs (default: 1)')
+    parser.add_argument('--pool', action='store_true', help='Use a pooled Word session in advanced batch runs')
+    parser.add_argument('--schedule', action='append', choices=SCHEDULES,
+                        help='Batch order for advanced batch/config runs (repeatable; each one is run '
+                             'and compared against fifo, which is always run too)')
+    parser.add_argument('--export-profile', action='append', choices=list(PROFILES),
+                        help='Export profile for advanced runs (repeatable; each one is run and its '
+                             f'output size and time compared against {DEFAULT_PROFILE}, which is always '
+                             'run too)')
+    parser.add_argument('--output', help='Write the JSON results to this file')
+    parser.add_argument('--baseline', help='Compare against a previous results file; exit 1 on regression')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed relative regression against the baseline (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--run-scenario', help=argparse.SUPPRESS)
+    parser.add_argument('--result-file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_scenario:
+        spec = json.loads(Path(args.run_scenario).read_text(encoding='utf-8'))
+        Path(args.result_file).write_text(json.dumps(run_scenario(spec)), encoding='utf-8')
+        return
+
+    try:
+        backend_options = parse_backend_options(args.backend_option)
+    except ValueError as e:
+        parser.error(str(e))
+
+    scenarios = args.scenario or list(SCENARIOS)
+    entries = args.entry or list(ENTRY_POINTS)
+    schedules = args.schedule or [None]
+    if args.schedule and FIFO not in schedules:
+        # The baseline every other schedule is compared against
+        schedules = [FIFO] + schedules
+    profiles = args.export_profile or [None]
+    if args.export_profile and DEFAULT_PROFILE not in profiles:
+        # The baseline every other profile is compared against
+        profiles = [DEFAULT_PROFILE] + profiles
+    work_dir = Path(tempfile.mkdtemp(prefix='word_to_pdf_bench_'))
+    try:
+        if args.corpus:
+            corpus_dir = Path(args.corpus).resolve()
+            corpus = {'path': str(corpus_dir)}
+        else:
+            corpus_dir = work_dir / 'corpus'
+            corpus = corpus_options(args)
+            generate_corpus(corpus_dir, **corpus)
+        document_count = len(list(corpus_dir.glob('*.docx')))
+        print(f"Corpus: {document_count} document(s) in {corpus_dir}")
+
+        results = {}
+        for scenario in scenarios:
+            for entry in entries:
+                # Scheduling only applies to the advanced batch entry points, and
+                # export profiles to the advanced entry points (docx2pdf has no options)
+                scheduled = scenario != 'single' and entry == 'advanced'
+                for profile in (profiles if entry == 'advanced' else [None]):
+                    for schedule in (schedules if scheduled else [None]):
+                        name = (f"{scenario}-{entry}"
+                                + (f"-{profile}" if profile and len(profiles) > 1 else '')
+                                + (f"-{schedule}" if schedule and len(schedules) > 1 else ''))
+                        print(f"Running {name}...")
+                        output_dir = work_dir / 'output' / name
+                        spec = {
+                            'scenario': scenario,
+                            'entry': entry,
+                            'corpus_dir': str(corpus_dir),
+                            'output_dir': str(output_dir),
+                            'backend': args.backend or _default_backend(entry),
+                            'backend_options': backend_options,
+                            'workers': args.workers,
+                            'pool': args.pool,
+                            'schedule': schedule,
+                            'export_profile': profile,
+                        }
+                        try:
+                            results[name] = _run_in_subprocess(spec)
+                        except RuntimeError as e:
+                            print(f"✗ {e}")
+                            results[name] = {'error': str(e)}
+                        shutil.rmtree(output_dir, ignore_errors=True)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backend': args.backend,
+            'backend_options': backend_options,
+            'workers': args.workers,
+            'pool': args.pool,
+            'schedule': args.schedule and schedules,
+            'export_profile': args.export_profile and profiles,
+        },
+        'corpus': corpus,
+        'results': results,
+    }
+
+    comparison = compare_schedules(results) + compare_profiles(results)
+    _print_report(results)
+    if comparison:
+        print()
+        for line in comparison:
+            print(line)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"\n✓ Results written to: {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print(f"\n✓ No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+def _default_backend(entry):
+    if entry == 'basic':
+        from word_to_pdf import DEFAULT_BACKEND
+    else:
+        from word_to_pdf_advanced import DEFAULT_BACKEND
+    return DEFAULT_BACKEND
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Startup Benchmark
+Measures how long the entry points take to import and to print --help, using
+`python -X importtime` in fresh interpreters, and checks that heavy modules
+(Word automation, the HTTP server, ...) are only imported once a conversion
+actually needs them.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --output benchmarks/startup_baseline.json
+    python benchmarks/startup.py --baseline benchmarks/startup_baseline.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_POINTS = ('word_to_pdf', 'word_to_pdf_advanced', 'word_to_pdf_gui')
+
+# Modules that must not be imported just to start up: they are only needed
+# once a conversion, the server, watch mode or the cache actually runs
+DEFERRED_MODULES = (
+    'docx2pdf', 'win32com', 'pythoncom', 'pywintypes',
+    'http.server', 'socketserver', 'ctypes', 'concurrent.futures',
+    'zipfile', 'hashlib', 'tempfile', 'uuid', 'sqlite3',
+)
+
+DEFAULT_RUNS = 7
+
+# Allowed relative slowdown before a metric counts as a regression. Start-up
+# times are small and noisy, so this is looser than the conversion benchmarks.
+DEFAULT_TOLERANCE = 0.25
+
+# Prints peak RSS after the import; `resource` is not available on Windows
+_RSS_PROBE = """
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024)
+except ImportError:
+    print('')
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Parse `python -X importtime` output.
+
+    Returns:
+        dict: Module name -> (self microseconds, cumulative microseconds)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+def measure_import(module):
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns:
+        dict: import_ms (cumulative import time), peak_rss_mb, and the
+            imported modules with their timings
+    """
+    code = f"import sys\nimport {module}\n{_RSS_PROBE}"
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                               cwd=str(REPO_ROOT), capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr.strip().splitlines()[-1]}")
+    modules = parse_importtime(completed.stderr)
+    rss = completed.stdout.strip()
+    return {
+        'import_ms': modules[module][1] / 1000,
+        'peak_rss_mb': float(rss) if rss else None,
+        'modules': modules,
+    }
+
+
+def measure_help(script):
+    """Wall time in ms of `python script --help` in a fresh interpreter."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, script, '--help'], cwd=str(REPO_ROOT),
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - started) * 1000
+
+
+def benchmark_entry_point(module, runs=DEFAULT_RUNS):
+    """
+    Measure one entry point over several runs.
+
+    Returns:
+        dict: Median import and --help times, peak RSS, the slowest imports,
+            and any deferred modules that were imported at startup
+    """
+    samples = [measure_import(module) for _ in range(runs)]
+    modules = samples[-1]['modules']
+    result = {
+        'import_ms': round(statistics.median(s['import_ms'] for s in samples), 2),
+        'peak_rss_mb': _median_or_none([s['peak_rss_mb'] for s in samples]),
+        'modules_imported': len(modules),
+        'slowest_imports': [
+            {'module': name, 'self_ms': round(self_us / 1000, 2)}
+            for name, (self_us, _) in sorted(modules.items(), key=lambda item: -item[1][0])[:10]
+        ],
+        'eager_heavy_imports': [
+            heavy for heavy in DEFERRED_MODULES
+            if any(name == heavy or name.startswith(heavy + '.') for name in modules)
+        ],
+    }
+    if module != 'word_to_pdf_gui':
+        result['help_ms'] = round(statistics.median(measure_help(f"{module}.py") for _ in range(runs)), 2)
+    return result
+
+
+def _median_or_none(values):
+    values = [value for value in values if value is not None]
+    return round(statistics.median(values), 1) if values else None
+
+
+def compare_to_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare startup results against a stored baseline.
+
+    Import time, --help time and peak RSS may not grow by more than
+    `tolerance` (a fraction) for any entry point present in both.
+
+    Returns:
+        list: Human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get('results', {}).get(name)
+        if not previous:
+            continue
+        for metric in ('import_ms', 'help_ms', 'peak_rss_mb'):
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > tolerance:
+                regressions.append(f"{name}: {metric} {old} -> {new} ({change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark start-up time of the Word to PDF entry points',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Measure and list the slowest imports
+  python benchmarks/startup.py
+
+  # Record a baseline, then fail later runs that start more than 25% slower
+  python benchmarks/startup.py --output benchmarks/startup_baseline.json
+  python benchmarks/startup.py --baseline benchmarks/startup_baseline.json
+        """
+    )
+    parser.add_argument('--entry', action='append', choices=ENTRY_POINTS,
+                        help='Entry point to measure (repeatable, default: all)')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS,
+                        help=f'Fresh interpreters per measurement; the median is reported (default: {DEFAULT_RUNS})')
+    parser.add_argument('--output', help='Write the JSON results to this file')
+    parser.add_argument('--baseline', help='Compare against a previous results file; exit 1 on regression')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed relative regression against the baseline (default: {DEFAULT_TOLERANCE})')
+    args = parser.parse_args()
+
+    results = {}
+    for module in args.entry or ENTRY_POINTS:
+        print(f"Measuring {module}...")
+        try:
+            results[module] = benchmark_entry_point(module, args.runs)
+        except RuntimeError as e:
+            # e.g. the GUI on a Python without tkinter
+            print(f"⚠ {e}")
+
+    print(f"\n{'Entry point':<24} {'import (ms)':>12} {'--help (ms)':>12} {'peak RSS':>10} {'modules':>8}")
+    for name, metrics in results.items():
+        help_ms = metrics.get('help_ms')
+        rss = metrics['peak_rss_mb']
+        print(f"{name:<24} {metrics['import_ms']:>12} {'-' if help_ms is None else help_ms:>12} "
+              f"{'-' if rss is None else rss:>10} {metrics['modules_imported']:>8}")
+    for name, metrics in results.items():
+        slowest = ', '.join(f"{entry['module']} {entry['self_ms']}ms" for entry in metrics['slowest_imports'][:5])
+        print(f"  {name} slowest imports: {slowest}")
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': {'python': platform.python_version(), 'platform': platform.platform()},
+        'results': results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"\n✓ Results written to: {args.output}")
+
+    failures = [f"{name} imports {', '.join(metrics['eager_heavy_imports'])} at startup"
+                for name, metrics in results.items() if metrics['eager_heavy_imports']]
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        failures += compare_to_baseline(results, baseline, args.tolerance)
+    if failures:
+        print(f"\n✗ {len(failures)} start-up regression(s):")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✓ No heavy imports at startup" +
+          (f" and no regressions against {args.baseline} (tolerance {args.tolerance:.0%})" if args.baseline else ''))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,627 @@
+"""
+Conversion Backends
+Common interface for the engines that turn Word documents into PDFs, so the
+CLI, batch and GUI entry points can share one conversion path and be run
+against a fake engine where Microsoft Word is not available.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from fnmatch import fnmatch
+from functools import partial
+from pathlib import Path
+from conversion_trace import span
+
+
+DEFAULT_BACKEND = 'word'
+
+# Upper bound for wait_for_release(); the fixed pause after Quit() it replaced
+DEFAULT_RELEASE_TIMEOUT = 1.0
+
+
+class ConversionBackend:
+    """
+    A conversion engine instance.
+
+    Lifecycle: launch() once, then open() / export() / close() for each
+    document, and teardown() when the instance is no longer needed.
+
+    Attributes:
+        name (str): Name the backend is registered under
+        requires_com (bool): True if the calling thread must initialize COM
+        supports_parallel (bool): False if instances cannot run side by side
+        pid (int or None): Process ID of the engine, if it runs out of process and is known
+    """
+
+    name = None
+    requires_com = False
+    supports_parallel = True
+    pid = None
+
+    def __init__(self):
+        self.documents_converted = 0
+        self.started_at = None
+        self._running = False
+
+    def launch(self):
+        """Start the engine. Returns self so it can be chained."""
+        self._running = True
+        self.started_at = time.time()
+        self.documents_converted = 0
+        return self
+
+    @property
+    def is_running(self):
+        return self._running
+
+    def open(self, input_file):
+        """Open a document and return a handle for export()."""
+        raise NotImplementedError
+
+    def export(self, document, output_file, export_options):
+        """Export an opened document to PDF."""
+        raise NotImplementedError
+
+    def close(self, document):
+        """Close a document opened with open()."""
+
+    def page_count(self, document):
+        """Number of pages of an opened document, or None if unknown."""
+        return None
+
+    def teardown(self):
+        """Stop the engine and release its resources."""
+        self._running = False
+
+    def memory_mb(self):
+        """Current memory usage of the engine in MB, or None if unknown."""
+        return None
+
+    def kill(self):
+        """
+        Forcibly stop a stuck engine. Called from another thread while a
+        conversion is blocked; teardown() is still called afterwards.
+
+        Returns:
+            bool: True if the engine was stopped
+        """
+        return False
+
+    def convert(self, input_file, output_file, export_options, export=None):
+        """
+        Open, export and close one document, keeping the engine running.
+
+        Args:
+            input_file (Path): Resolved path to the Word document
+            output_file (Path): Resolved path for the output PDF
+            export_options (dict): Engine-specific export options
+            export (callable, optional): Called as export(document, output_file,
+                export_options) instead of self.export, e.g. to split the export
+        """
+        export = export or self.export
+        document = None
+        name = Path(input_file).name
+        try:
+            with span('open', file=name):
+                document = self.open(input_file)
+            unshare_output(output_file)
+            with span('export', file=name):
+                export(document, output_file, export_options)
+        finally:
+            if document is not None:
+                try:
+                    with span('close', file=name):
+                        self.close(document)
+                except Exception:
+                    pass
+            self.documents_converted += 1
+
+
+def unshare_output(output_file):
+    """
+    Remove an existing PDF that is hardlinked to other files (a cache entry or
+    an identical document's PDF), so exporting over it does not change them.
+    Call before any export that writes the output file in place.
+    """
+    try:
+        if os.stat(output_file).st_nlink > 1:
+            os.unlink(output_file)
+    except FileNotFoundError:
+        pass
+
+
+def _default_dispatch():
+    """Launch a new, isolated Word.Application COM server."""
+    import win32com.client
+    return win32com.client.DispatchEx("Word.Application")
+
+
+def _find_word_pid(caption):
+    """
+    Find the process ID of the Word instance whose window caption is `caption`.
+
+    Returns:
+        int or None: Process ID, or None if it cannot be determined
+    """
+    try:
+        import win32gui
+        import win32process
+        hwnd = win32gui.FindWindow("OpusApp", caption)
+        if not hwnd:
+            return None
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        return pid
+    except Exception:
+        return None
+
+
+def _process_memory_mb(pid):
+    """
+    Get the working set size of a process in MB.
+
+    Returns:
+        float or None: Memory usage in MB, or None if it cannot be determined
+    """
+    try:
+        import win32api
+        import win32con
+        import win32process
+        handle = win32api.OpenProcess(
+            win32con.PROCESS_QUERY_INFORMATION | win32con.PROCESS_VM_READ, False, pid
+        )
+        try:
+            info = win32process.GetProcessMemoryInfo(handle)
+        finally:
+            win32api.CloseHandle(handle)
+        return info['WorkingSetSize'] / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def _process_exited(pid):
+    """
+    Check whether a process has exited.
+
+    Returns:
+        bool or None: True if it has exited, False if it is running, None if unknown
+    """
+    try:
+        import win32api
+        import win32con
+        import win32event
+    except ImportError:
+        return None
+    try:
+        handle = win32api.OpenProcess(win32con.SYNCHRONIZE, False, pid)
+    except Exception:
+        # The process is gone (or was never ours to query)
+        return True
+    try:
+        return win32event.WaitForSingleObject(handle, 0) == win32event.WAIT_OBJECT_0
+    finally:
+        win32api.CloseHandle(handle)
+
+
+def _terminate_process(pid):
+    """
+    Forcibly end a process.
+
+    Returns:
+        bool: True if the process was terminated
+    """
+    try:
+        import win32api
+        import win32con
+        handle = win32api.OpenProcess(win32con.PROCESS_TERMINATE, False, pid)
+        try:
+            win32api.TerminateProcess(handle, 1)
+        finally:
+            win32api.CloseHandle(handle)
+        return True
+    except Exception:
+        return False
+
+
+def _is_unlocked(path):
+    """Check that no other process holds `path` open in a mode that blocks writers."""
+    mode = os.O_RDWR if os.access(path, os.W_OK) else os.O_RDONLY
+    try:
+        os.close(os.open(str(path), mode | getattr(os, 'O_BINARY', 0)))
+        return True
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+
+
+def _is_complete_pdf(path):
+    """Check that a PDF exists and has been written through to its end-of-file marker."""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 1024))
+            return size > 0 and b'%%EOF' in f.read()
+    except OSError:
+        return False
+
+
+def wait_for_release(input_file, output_file=None, pid=None, timeout=DEFAULT_RELEASE_TIMEOUT):
+    """
+    Wait until Word has let go of a conversion's files after Quit().
+
+    Returns as soon as the input document is no longer locked and the output
+    PDF (if given) is complete, or the Word process has exited. Checks start
+    a few milliseconds apart and back off, so the common case returns almost
+    immediately, and give up after `timeout` seconds.
+
+    Args:
+        input_file (Path): Converted Word document
+        output_file (Path, optional): PDF that should be complete; None if the export failed
+        pid (int, optional): Process ID of the Word instance that was quit
+        timeout (float): Longest time to wait in seconds
+
+    Returns:
+        str: What ended the wait: 'released', 'exited' or 'timeout'
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+    while True:
+        if pid is not None and _process_exited(pid):
+            return 'exited'
+        if _is_unlocked(input_file) and (output_file is None or _is_complete_pdf(output_file)):
+            return 'released'
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return 'timeout'
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.1)
+
+
+class WordCOMBackend(ConversionBackend):
+    """
+    Microsoft Word driven directly through COM (DispatchEx + ExportAsFixedFormat).
+
+    Args:
+        dispatch (callable, optional): Factory returning a Word.Application object.
+            Defaults to DispatchEx("Word.Application"); pass a stub for testing.
+        memory_probe (callable, optional): Function taking the backend and returning
+            its memory usage in MB (or None). Defaults to querying the Word process.
+    """
+
+    name = 'word'
+    requires_com = True
+
+    def __init__(self, dispatch=None, memory_probe=None):
+        super().__init__()
+        self.dispatch = dispatch or _default_dispatch
+        self.memory_probe = memory_probe or WordCOMBackend._probe_process_memory
+        self.word = None
+        self.pid = None
+
+    def launch(self):
+        """Start Word and configure it for unattended conversion."""
+        self.word = self.dispatch()
+        self.word.Visible = False  # Run in background
+        self.word.DisplayAlerts = 0  # wdAlertsNone
+
+        # Give the hidden window a unique caption so its process can be found
+        caption = f"WordToPDF-{os.urandom(16).hex()}"
+        try:
+            self.word.Caption = caption
+            self.pid = _find_word_pid(caption)
+        except Exception:
+            self.pid = None
+
+        return super().launch()
+
+    def open(self, input_file):
+        return self.word.Documents.Open(str(input_file), ReadOnly=True)
+
+    def export(self, document, output_file, export_options):
+        document.ExportAsFixedFormat(OutputFileName=str(output_file), **export_options)
+
+    def close(self, document):
+        document.Close(SaveChanges=False)
+
+    def page_count(self, document):
+        # Paginates the document; the export reuses that layout
+        return document.ComputeStatistics(2)  # wdStatisticPages
+
+    def memory_mb(self):
+        return self.memory_probe(self)
+
+    def kill(self):
+        """Terminate this instance's WINWORD.EXE process (never other Word windows)."""
+        if self.pid is None:
+            return False
+        return _terminate_process(self.pid)
+
+    def teardown(self):
+        """Quit Word and release the COM reference."""
+        if self.word is not None:
+            try:
+                self.word.Quit()
+            except Exception:
+                pass
+        self.word = None
+        self.pid = None
+        super().teardown()
+
+    @staticmethod
+    def _probe_process_memory(backend):
+        if backend.pid is None:
+            return None
+        return _process_memory_mb(backend.pid)
+
+
+class Docx2PdfBackend(ConversionBackend):
+    """
+    The docx2pdf library. It starts and quits Word itself on every call and
+    attaches to the shared Word instance, so instances cannot run in parallel.
+    """
+
+    name = 'docx2pdf'
+    supports_parallel = False
+
+    def open(self, input_file):
+        return Path(input_file)
+
+    def export(self, document, output_file, export_options):
+        from docx2pdf import convert
+        convert(str(document), str(output_file))
+
+
+def _fake_pdf(title, first_page, last_page, image_bytes=0):
+    """
+    A minimal PDF with blank pages `first_page`..`last_page` of a document and
+    a bookmark every ten pages, like Word's heading bookmarks. `image_bytes`
+    of uncompressed image data stand in for the document's pictures.
+    """
+    pages = list(range(first_page, last_page + 1))
+    headings = [page for page in pages if page == 1 or page % 10 == 1]
+    first_page_num = 5
+    first_heading_num = first_page_num + len(pages)
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R /Outlines 3 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{first_page_num + i} 0 R' for i in range(len(pages)))}] "
+        f"/Count {len(pages)} >>",
+        f"<< /Type /Outlines /First {first_heading_num} 0 R "
+        f"/Last {first_heading_num + len(headings) - 1} 0 R /Count {len(headings)} >>",
+        f"<< /Title ({title}) /Producer (fake backend) >>",
+    ]
+    image_num = first_heading_num + len(headings)
+    resources = f" /Resources << /XObject << /Im0 {image_num} 0 R >> >>" if image_bytes else ""
+    objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842]{resources} >>")
+    objects += ["<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] >>"] * (len(pages) - 1)
+    for i, page in enumerate(headings):
+        links = "/Parent 3 0 R"
+        if i:
+            links += f" /Prev {first_heading_num + i - 1} 0 R"
+        if i + 1 < len(headings):
+            links += f" /Next {first_heading_num + i + 1} 0 R"
+        objects.append(f"<< /Title (Section {(page - 1) // 10 + 1}) {links} "
+                       f"/Dest [{first_page_num + pages.index(page)} 0 R /Fit] >>")
+
+    if image_bytes:
+        objects.append(f"<< /Type /XObject /Subtype /Image /Width {image_bytes} /Height 1 "
+                       f"/ColorSpace /DeviceGray /BitsPerComponent 8 /Length {image_bytes} >>\n"
+                       f"stream\n{'~' * image_bytes}\nendstream")
+
+    output = "%PDF-1.4\n"
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f"{num} 0 obj {body} endobj\n"
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    output += ''.join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    output += f"trailer << /Size {len(objects) + 1} /Root 1 0 R /Info 4 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return output.encode('latin-1', 'replace')
+
+
+class FakeBackend(ConversionBackend):
+    """
+    Deterministic in-process backend that simulates Word's latencies.
+
+    It sleeps for the configured launch/open/export/close/teardown times and
+    writes a minimal PDF with one blank page per page of the document (the
+    <Pages> count saved in docProps/app.xml), so batching, pooling, scheduling
+    and split exports can be tested and benchmarked without Word. Page-range
+    exports take the matching fraction of the export time. The document's
+    embedded media is copied into the PDF, at a quarter of its size with
+    OptimizeFor=1 (on-screen), like images downsampled from 300 to 150 dpi.
+
+    Args:
+        launch_latency (float): Seconds to "start Word"
+        open_latency (float): Seconds to open a document
+        export_latency (float): Fixed seconds to export a document
+        export_latency_per_mb (float): Additional export seconds per MB of input
+        close_latency (float): Seconds to close a document
+        teardown_latency (float): Seconds to "quit Word"
+        base_memory_mb (float): Reported memory use after launch
+        memory_per_document_mb (float): Reported memory growth per converted document
+        fail_pattern (str, optional): Glob; documents whose name matches fail to open
+        hang_pattern (str, optional): Glob; exporting documents whose name matches
+            never finishes (until the backend is killed)
+    """
+
+    name = 'fake'
+
+    def __init__(self, launch_latency=0.5, open_latency=0.05, export_latency=0.1,
+                 export_latency_per_mb=0.0, close_latency=0.01, teardown_latency=0.1,
+                 base_memory_mb=150.0, memory_per_document_mb=0.0, fail_pattern=None,
+                 hang_pattern=None):
+        super().__init__()
+        self.launch_latency = float(launch_latency)
+        self.open_latency = float(open_latency)
+        self.export_latency = float(export_latency)
+        self.export_latency_per_mb = float(export_latency_per_mb)
+        self.close_latency = float(close_latency)
+        self.teardown_latency = float(teardown_latency)
+        self.base_memory_mb = float(base_memory_mb)
+        self.memory_per_document_mb = float(memory_per_document_mb)
+        self.fail_pattern = fail_pattern
+        self.hang_pattern = hang_pattern
+        self._killed = threading.Event()
+
+    def _sleep(self, seconds):
+        """Sleep, failing like a dead COM server if the backend is killed meanwhile."""
+        if self._killed.wait(seconds):
+            raise RuntimeError("The remote procedure call failed (simulated: Word was killed)")
+
+    def launch(self):
+        self._killed.clear()
+        self._sleep(self.launch_latency)
+        return super().launch()
+
+    def open(self, input_file):
+        input_file = Path(input_file)
+        self._sleep(self.open_latency)
+        if not input_file.exists():
+            raise FileNotFoundError(f"Document not found: {input_file}")
+        if self.fail_pattern and fnmatch(input_file.name, self.fail_pattern):
+            raise RuntimeError(f"Simulated conversion failure: {input_file.name}")
+        return input_file
+
+    def page_count(self, document):
+        import zipfile
+
+        try:
+            with zipfile.ZipFile(document) as package:
+                properties = package.read('docProps/app.xml').decode('utf-8')
+        except (zipfile.BadZipFile, KeyError, OSError):
+            return None
+        start = properties.find('<Pages>')
+        end = properties.find('</Pages>')
+        if start < 0 or end < 0:
+            return None
+        return int(properties[start + len('<Pages>'):end])
+
+    def export(self, document, output_file, export_options):
+        size_mb = document.stat().st_size / (1024 * 1024)
+        if self.hang_pattern and fnmatch(document.name, self.hang_pattern):
+            self._sleep(None)
+        pages = self.page_count(document) or 1
+        first, last = 1, pages
+        if export_options.get('Range') == 3:  # wdExportFromTo
+            first, last = max(1, export_options['From']), min(pages, export_options['To'])
+        fraction = (last - first + 1) / pages
+        self._sleep(self.export_latency + self.export_latency_per_mb * size_mb * fraction)
+        image_bytes = self._media_bytes(document) * fraction
+        if export_options.get('OptimizeFor') == 1:  # wdExportOptimizeForOnScreen
+            image_bytes *= 0.25
+        title = document.stem.replace('(', '').replace(')', '')
+        Path(output_file).write_bytes(_fake_pdf(title, first, last, int(image_bytes)))
+
+    @staticmethod
+    def _media_bytes(document):
+        """Total size of the pictures embedded in a .docx package."""
+        import zipfile
+
+        try:
+            with zipfile.ZipFile(document) as package:
+                return sum(info.file_size for info in package.infolist()
+                           if info.filename.startswith('word/media/'))
+        except (zipfile.BadZipFile, OSError):
+            return 0
+
+    def close(self, document):
+        self._sleep(self.close_latency)
+
+    def teardown(self):
+        if self.is_running and not self._killed.is_set():
+            time.sleep(self.teardown_latency)
+        super().teardown()
+
+    def kill(self):
+        self._killed.set()
+        return True
+
+    def memory_mb(self):
+        return self.base_memory_mb + self.memory_per_document_mb * self.documents_converted
+
+
+BACKENDS = {
+    WordCOMBackend.name: WordCOMBackend,
+    Docx2PdfBackend.name: Docx2PdfBackend,
+    FakeBackend.name: FakeBackend,
+}
+
+
+def register_backend(backend_class):
+    """Register a ConversionBackend subclass under its `name`."""
+    BACKENDS[backend_class.name] = backend_class
+    return backend_class
+
+
+def get_backend_factory(name=DEFAULT_BACKEND, options=None):
+    """
+    Look up a backend by name.
+
+    Args:
+        name (str): Registered backend name ('word', 'docx2pdf', 'fake', ...)
+        options (dict, optional): Keyword arguments for the backend constructor
+
+    Returns:
+        callable: Factory returning new, unlaunched backend instances. The
+            backend class is available as the factory's `backend_class`.
+    """
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown conversion backend '{name}'. "
+                         f"Available: {', '.join(sorted(BACKENDS))}")
+    factory = partial(backend_class, **(options or {}))
+    factory.backend_class = backend_class
+    return factory
+
+
+@contextmanager
+def com_apartment(backend_factory=None):
+    """
+    Initialize a single-threaded COM apartment for the current thread, if the
+    backend needs one.
+    """
+    backend_class = getattr(backend_factory, 'backend_class', WordCOMBackend)
+    if not backend_class.requires_com:
+        yield
+        return
+
+    import pythoncom
+    pythoncom.CoInitialize()
+    try:
+        yield
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def parse_backend_options(option_strings):
+    """
+    Parse KEY=VALUE strings from the command line into backend options.
+
+    Numeric values are converted to float; everything else stays a string.
+
+    Returns:
+        dict: Backend constructor keyword arguments
+    """
+    options = {}
+    for option in option_strings or []:
+        if '=' not in option:
+            raise ValueError(f"Backend option must be KEY=VALUE: {option}")
+        key, value = option.split('=', 1)
+        try:
+            options[key.strip()] = float(value)
+        except ValueError:
+            options[key.strip()] = value
+    return options
+
+
+def add_backend_arguments(parser, default=DEFAULT_BACKEND):
+    """Add the backend selection options to an argparse parser."""
+    parser.add_argument('--backend', default=default, choices=sorted(BACKENDS),
+                        help=f'Conversion engine to use (default: {default})')
+    parser.add_argument('--backend-option', action='append', metavar='KEY=VALUE',
+                        help='Backend setting, e.g. export_latency=0.2 for the fake backend (repeatable)')
@@ -0,0 +1,309 @@
+"""
+Conversion Cache
+Content-addressed cache of converted PDFs, keyed on the input document's
+contents and the export options, so unchanged documents are not re-exported.
+"""
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+
+DEFAULT_CACHE_DIR = Path.home() / '.word_to_pdf_cache'
+DEFAULT_CACHE_MAX_MB = 2048
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Linux ioctl that clones a file's data blocks (Btrfs, XFS and other copy-on-write filesystems)
+_FICLONE = 0x40049409
+
+
+def hash_file(file_path):
+    """
+    Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        file_path (str): Path to the file
+
+    Returns:
+        str: Hex digest
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(source, destination):
+    """
+    Clone `source` to `destination` sharing its data blocks, where the
+    filesystem supports copy-on-write clones.
+
+    Returns:
+        bool: True if the clone was created
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        try:
+            os.unlink(destination)
+        except FileNotFoundError:
+            pass
+        return False
+
+
+def link_or_copy(source, destination):
+    """
+    Place `source` at `destination` using a hardlink, a reflink (copy-on-write
+    clone) if the filesystem cannot hardlink it, or a copy.
+
+    The destination is replaced atomically if it already exists.
+
+    Returns:
+        str: 'link', 'reflink' or 'copy', depending on how the file was materialized
+    """
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if os.path.samefile(source, destination):
+            # Already a hardlink of `source`; replacing it would leave the temporary link behind
+            return 'link'
+    except FileNotFoundError:
+        pass
+    temp_path = destination.with_name(f".{destination.name}.{os.urandom(16).hex()}.tmp")
+    try:
+        os.link(source, temp_path)
+        method = 'link'
+    except OSError:
+        if _reflink(source, temp_path):
+            method = 'reflink'
+        else:
+            shutil.copyfile(source, temp_path)
+            method = 'copy'
+    try:
+        os.replace(temp_path, destination)
+    except OSError:
+        try:
+            temp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+    return method
+
+
+class ConversionCache:
+    """
+    Size-bounded, least-recently-used cache of converted PDFs.
+
+    Entries are stored as <cache_dir>/<key[:2]>/<key>.pdf. An entry's mtime is
+    refreshed on every hit, and the oldest entries are evicted once the cache
+    grows beyond `max_size_mb`. Safe to share between worker threads.
+
+    Args:
+        cache_dir (str): Directory holding the cached PDFs
+        max_size_mb (float): Maximum total size of the cache (0 = unbounded)
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_size_mb=DEFAULT_CACHE_MAX_MB):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_mb = max_size_mb
+        self.hits = 0
+        self.misses = 0
+        self._size_bytes = None
+        self._lock = threading.Lock()
+
+    def key_for(self, input_file, export_options):
+        """
+        Build the cache key for a document and the options it is exported with.
+
+        Args:
+            input_file (str): Path to the Word document
+            export_options (dict): Options that affect the produced PDF
+
+        Returns:
+            str: Hex cache key
+        """
+        import hashlib
+
+        digest = hashlib.sha256()
+        digest.update(hash_file(input_file).encode('ascii'))
+        digest.update(json.dumps(export_options, sort_keys=True, default=str).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.pdf"
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+        return [p for p in self.cache_dir.glob('*/*.pdf') if p.is_file()]
+
+    def materialize(self, key, output_file):
+        """
+        Place the cached PDF for `key` at `output_file`, if there is one.
+
+        Returns:
+            bool: True on a cache hit
+        """
+        entry = self._entry_path(key)
+        try:
+            os.utime(entry)  # Mark as recently used
+            link_or_copy(entry, output_file)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, key, pdf_file):
+        """
+        Add a freshly converted PDF to the cache and evict old entries if needed.
+
+        Args:
+            key (str): Cache key from key_for()
+            pdf_file (str): Path to the converted PDF
+        """
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        existing_size = entry.stat().st_size if entry.exists() else 0
+        link_or_copy(pdf_file, entry)
+
+        with self._lock:
+            if self._size_bytes is not None:
+                self._size_bytes += entry.stat().st_size - existing_size
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits its size limit."""
+        if not self.max_size_mb:
+            return
+        limit = self.max_size_mb * 1024 * 1024
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(p.stat().st_size for p in self._entries())
+            if self._size_bytes <= limit:
+                return
+
+            entries = []
+            for path in self._entries():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort()
+
+            self._size_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if self._size_bytes <= limit:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                self._size_bytes -= size
+
+    def stats(self):
+        """
+        Summarize the cache contents.
+
+        Returns:
+            dict: Entry count, total size and configured limit
+        """
+        entries = self._entries()
+        return {
+            'cache_dir': str(self.cache_dir),
+            'entries': len(entries),
+            'size_mb': sum(p.stat().st_size for p in entries) / (1024 * 1024),
+            'max_size_mb': self.max_size_mb,
+        }
+
+    def purge(self):
+        """
+        Delete every cached PDF.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            entries = self._entries()
+            for path in entries:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._size_bytes = 0
+        return len(entries)
+
+
+def add_cache_arguments(parser):
+    """Add the conversion cache options to an argparse parser."""
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse previously converted PDFs for unchanged documents')
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        help=f'Conversion cache directory (implies --cache, default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_CACHE_MAX_MB, metavar='MB',
+                        help=f'Maximum conversion cache size, 0 = unbounded (default: {DEFAULT_CACHE_MAX_MB})')
+    parser.add_argument('--cache-stats', action='store_true',
+                        help='Show conversion cache statistics and exit')
+    parser.add_argument('--cache-purge', action='store_true',
+                        help='Delete all cached PDFs and exit')
+
+
+def cache_from_args(args):
+    """
+    Build a ConversionCache from parsed command-line arguments.
+
+    Returns:
+        ConversionCache or None: None if caching was not requested
+    """
+    if not (args.cache or args.cache_dir or args.cache_stats or args.cache_purge):
+        return None
+    return ConversionCache(args.cache_dir or DEFAULT_CACHE_DIR, args.cache_max_mb)
+
+
+def cache_from_config(config):
+    """
+    Build a ConversionCache from configuration file settings.
+
+    Returns:
+        ConversionCache or None: None if caching is not enabled in the config
+    """
+    if not (config.get('cache', False) or config.get('cache_dir')):
+        return None
+    return ConversionCache(config.get('cache_dir') or DEFAULT_CACHE_DIR,
+                           config.get('cache_max_mb', DEFAULT_CACHE_MAX_MB))
+
+
+def run_cache_command(args, cache):
+    """
+    Handle --cache-stats / --cache-purge.
+
+    Returns:
+        bool: True if a cache command was run and the program should exit
+    """
+    if args.cache_purge:
+        removed = cache.purge()
+        print(f"✓ Removed {removed} cached PDF(s) from {cache.cache_dir}")
+        return True
+    if args.cache_stats:
+        stats = cache.stats()
+        print(f"Cache directory: {stats['cache_dir']}")
+        print(f"Entries: {stats['entries']}")
+        limit = f"{stats['max_size_mb']:.0f} MB" if stats['max_size_mb'] else "unbounded"
+        print(f"Size: {stats['size_mb']:.2f} MB (limit: {limit})")
+        return True
+    return False
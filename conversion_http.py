@@ -0,0 +1,186 @@
+"""
+Conversion HTTP Front End
+Request handler and threaded HTTP server for the conversion service (see
+conversion_server.py). Kept separate so the HTTP machinery is only imported
+when the server is actually started.
+
+Endpoints:
+    POST   /convert?filename=report.docx        Upload a document (request body) and
+                                                wait for the PDF
+    POST   /convert?filename=report.docx&async=1
+                                                Upload and get a job ID back immediately
+    GET    /jobs/<id>                           Job status as JSON
+    GET    /jobs/<id>/pdf                       Download the PDF of a finished job
+    DELETE /jobs/<id>                           Discard a job and its files
+    GET    /health                              Queue and worker status
+"""
+
+import json
+import shutil
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, quote
+
+from conversion_server import DEFAULT_MAX_UPLOAD_MB, DEFAULT_SYNC_TIMEOUT
+from file_scanner import is_word_document
+
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _content_disposition(filename):
+    """
+    Content-Disposition header for a download named after a client-supplied
+    file name: an ASCII name without control characters, quotes or
+    backslashes, plus the exact name encoded as RFC 5987 filename*.
+    """
+    fallback = ''.join(c if ' ' <= c <= '~' and c not in '"\\' else '_' for c in filename)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for a ConversionService (available as self.server.service)."""
+
+    server_version = 'WordToPDF'
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def _send_json(self, status, data, headers=None):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status, message, headers=None):
+        self._send_json(status, {'error': message}, headers)
+
+    def _send_pdf(self, job):
+        """Stream a finished job's PDF in chunks."""
+        size = job.output_file.stat().st_size
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(size))
+        self.send_header('Content-Disposition', _content_disposition(job.output_file.name))
+        self.send_header('X-Job-Id', job.id)
+        self.end_headers()
+        with open(job.output_file, 'rb') as f:
+            shutil.copyfileobj(f, self.wfile, _CHUNK_SIZE)
+
+    def _job_from_path(self, parts):
+        job = self.service.get(parts[1]) if len(parts) >= 2 else None
+        if job is None:
+            self._send_error(404, 'Unknown job')
+        return job
+
+    def do_GET(self):
+        self.service.expire_jobs()
+        parts = [part for part in urlsplit(self.path).path.split('/') if part]
+        if parts == ['health']:
+            self._send_json(200, self.service.health())
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            job = self._job_from_path(parts)
+            if job is not None:
+                self._send_json(200, job.to_dict())
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'pdf':
+            job = self._job_from_path(parts)
+            if job is None:
+                return
+            if job.status == 'done':
+                self._send_pdf(job)
+            elif job.status == 'failed':
+                self._send_error(500, job.error or 'Conversion failed')
+            else:
+                self._send_error(409, 'Conversion not finished', {'Retry-After': '1'})
+        else:
+            self._send_error(404, 'Not found')
+
+    def do_DELETE(self):
+        parts = [part for part in urlsplit(self.path).path.split('/') if part]
+        if len(parts) == 2 and parts[0] == 'jobs' and self.service.discard(parts[1]) is not None:
+            self._send_json(200, {'id': parts[1], 'deleted': True})
+        else:
+            self._send_error(404, 'Unknown job')
+
+    def do_POST(self):
+        self.service.expire_jobs()
+        url = urlsplit(self.path)
+        if url.path.rstrip('/') != '/convert':
+            self._send_error(404, 'Not found')
+            return
+        query = parse_qs(url.query)
+        filename = (query.get('filename') or [self.headers.get('X-Filename') or 'document.docx'])[0]
+        asynchronous = (query.get('async') or ['0'])[0].lower() in ('1', 'true', 'yes')
+
+        if not is_word_document(filename):
+            self._send_error(415, 'Upload must be a Word document (.docx, .doc or .docm)')
+            return
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            self._send_error(411, 'Content-Length required')
+            return
+        if length > self.server.max_upload_bytes:
+            self._send_error(413, f'Upload larger than {self.server.max_upload_bytes // (1024 * 1024)} MB')
+            return
+        # Refuse early so a busy server does not read uploads it cannot queue
+        if self.service.queue_full:
+            self._send_error(429, 'Conversion queue is full', {'Retry-After': '1'})
+            return
+
+        job = self.service.new_job(filename)
+        try:
+            with open(job.input_file, 'wb') as f:
+                remaining = length
+                while remaining > 0:
+                    chunk = self.rfile.read(min(_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise ConnectionError('Upload ended early')
+                    f.write(chunk)
+                    remaining -= len(chunk)
+        except (OSError, ConnectionError) as e:
+            shutil.rmtree(job.input_file.parent, ignore_errors=True)
+            self._send_error(400, f'Could not read upload: {e}')
+            return
+
+        if not self.service.submit(job):
+            self._send_error(429, 'Conversion queue is full', {'Retry-After': '1'})
+            return
+
+        status_url = f'/jobs/{job.id}'
+        if asynchronous:
+            self._send_json(202, dict(job.to_dict(), status_url=status_url,
+                                      pdf_url=f'{status_url}/pdf'),
+                            {'Location': status_url})
+            return
+
+        if not job.finished.wait(self.server.sync_timeout):
+            # Still converting; let the client poll rather than hold the connection
+            self._send_json(202, dict(job.to_dict(), status_url=status_url,
+                                      pdf_url=f'{status_url}/pdf'),
+                            {'Location': status_url})
+            return
+        try:
+            if job.status == 'done':
+                self._send_pdf(job)
+            else:
+                self._send_error(500, job.error or 'Conversion failed')
+        finally:
+            self.service.discard(job.id)
+
+
+class ConversionHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the ConversionService for its handlers."""
+
+    daemon_threads = True
+
+    def __init__(self, address, service, max_upload_mb=DEFAULT_MAX_UPLOAD_MB,
+                 sync_timeout=DEFAULT_SYNC_TIMEOUT):
+        super().__init__(address, ConversionRequestHandler)
+        self.service = service
+        self.max_upload_bytes = int(max_upload_mb * 1024 * 1024)
+        self.sync_timeout = sync_timeout
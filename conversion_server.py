@@ -0,0 +1,259 @@
+"""
+Conversion Server
+Local HTTP service that converts uploaded Word documents to PDF, so other
+programs can request conversions without scripting Word themselves.
+
+Endpoints:
+    POST   /convert?filename=report.docx        Upload a document (request body) and
+                                                wait for the PDF
+    POST   /convert?filename=report.docx&async=1
+                                                Upload and get a job ID back immediately
+    GET    /jobs/<id>                           Job status as JSON
+    GET    /jobs/<id>/pdf                       Download the PDF of a finished job
+    DELETE /jobs/<id>                           Discard a job and its files
+    GET    /health                              Queue and worker status
+
+Uploads are queued to a bounded pool of conversion workers, each keeping its
+own Word session warm. When the queue is full the server answers 429 with a
+Retry-After header instead of accepting more work. The HTTP handler lives in
+conversion_http.py and is only imported when the server starts.
+"""
+
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from parallel_batch import BatchResult, start_workers, stop_workers
+from word_pool import DEFAULT_MAX_DOCUMENTS, DEFAULT_MAX_MEMORY_MB
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_MAX_UPLOAD_MB = 100
+
+# Synchronous requests waiting longer than this get a job ID to poll instead
+DEFAULT_SYNC_TIMEOUT = 300
+
+# Finished jobs are deleted this many seconds after they complete
+DEFAULT_JOB_TTL = 3600
+
+
+class ConversionJob:
+    """One uploaded document and the state of its conversion."""
+
+    def __init__(self, job_id, input_file, output_file):
+        self.id = job_id
+        self.input_file = input_file
+        self.output_file = output_file
+        self.status = 'queued'
+        self.error = None
+        self.duration = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.finished = threading.Event()
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'status': self.status,
+            'filename': self.input_file.name,
+            'error': self.error,
+            'duration': None if self.duration is None else round(self.duration, 3),
+            'created_at': self.created_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class ConversionService:
+    """
+    Job store and worker pool behind the HTTP server.
+
+    Args:
+        export (callable): Called as export(session, input_file, output_file)
+        backend_factory (callable, optional): Backend factory (default: Word via COM)
+        workers (int): Number of conversion workers / Word instances
+        queue_size (int): Maximum number of jobs waiting for a worker
+        cache (ConversionCache, optional): Reuse cached PDFs
+        cache_options (dict, optional): Export options included in the cache key
+        max_documents (int): Recycle each worker's Word after this many documents
+        max_memory_mb (float): Recycle each worker's Word above this memory use
+        job_ttl (float): Seconds to keep finished jobs before deleting them
+        work_dir (str, optional): Folder for uploads and PDFs (default: a new temp folder)
+        watchdog (Watchdog, optional): Stops Word when a job runs past its time limit
+    """
+
+    def __init__(self, export, backend_factory=None, workers=1, queue_size=DEFAULT_QUEUE_SIZE,
+                 cache=None, cache_options=None, max_documents=DEFAULT_MAX_DOCUMENTS,
+                 max_memory_mb=DEFAULT_MAX_MEMORY_MB, job_ttl=DEFAULT_JOB_TTL, work_dir=None,
+                 watchdog=None):
+        if work_dir is None:
+            import tempfile
+            work_dir = tempfile.mkdtemp(prefix='word_to_pdf_server_')
+        self.work_dir = Path(work_dir)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        self.job_ttl = job_ttl
+        self.jobs = {}
+        self._jobs_by_input = {}
+        self._lock = threading.Lock()
+        self.result = BatchResult(on_record=self._on_record)
+        self.job_queue = queue.Queue(maxsize=queue_size)
+        self.threads = start_workers(self.job_queue, workers, self.result, export,
+                                     backend_factory=backend_factory,
+                                     max_documents=max_documents, max_memory_mb=max_memory_mb,
+                                     cache=cache, cache_options=cache_options,
+                                     on_start=self._on_start, watchdog=watchdog, name='server')
+
+    def _on_start(self, input_file, output_file):
+        with self._lock:
+            job = self._jobs_by_input.get(input_file)
+        if job is not None:
+            job.status = 'converting'
+
+    def _on_record(self, input_file, duration, error):
+        with self._lock:
+            job = self._jobs_by_input.pop(input_file, None)
+        if job is None:
+            return
+        job.duration = duration
+        job.error = None if error is None else str(error)
+        job.status = 'done' if error is None else 'failed'
+        job.finished_at = time.time()
+        job.finished.set()
+
+    @property
+    def queue_full(self):
+        return self.job_queue.full()
+
+    def new_job(self, filename):
+        """
+        Create a job folder for an upload.
+
+        Returns:
+            ConversionJob: The job; write the upload to `job.input_file`, then submit() it
+        """
+        job_id = os.urandom(16).hex()
+        job_dir = self.work_dir / job_id
+        job_dir.mkdir()
+        input_file = job_dir / Path(filename).name
+        return ConversionJob(job_id, input_file, input_file.with_suffix('.pdf'))
+
+    def submit(self, job):
+        """
+        Queue a job for conversion.
+
+        Returns:
+            bool: False if the queue is full (the job is discarded)
+        """
+        with self._lock:
+            self.jobs[job.id] = job
+            self._jobs_by_input[job.input_file] = job
+        try:
+            self.job_queue.put_nowait((job.input_file, job.output_file))
+        except queue.Full:
+            self.discard(job.id)
+            return False
+        return True
+
+    def get(self, job_id):
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def discard(self, job_id):
+        """Forget a job and delete its files."""
+        with self._lock:
+            job = self.jobs.pop(job_id, None)
+            if job is not None:
+                self._jobs_by_input.pop(job.input_file, None)
+        if job is not None:
+            shutil.rmtree(job.input_file.parent, ignore_errors=True)
+        return job
+
+    def expire_jobs(self):
+        """Delete finished jobs older than the job TTL."""
+        cutoff = time.time() - self.job_ttl
+        with self._lock:
+            expired = [job.id for job in self.jobs.values()
+                       if job.finished_at is not None and job.finished_at < cutoff]
+        for job_id in expired:
+            self.discard(job_id)
+
+    def health(self):
+        with self._lock:
+            statuses = [job.status for job in self.jobs.values()]
+        return {
+            'status': 'ok' if any(thread.is_alive() for thread in self.threads) else 'no workers',
+            'workers': self.workers,
+            'queued': self.job_queue.qsize(),
+            'queue_size': self.job_queue.maxsize,
+            'jobs': {status: statuses.count(status)
+                     for status in ('queued', 'converting', 'done', 'failed')},
+            'converted': self.result.successful,
+            'failed': self.result.failed,
+        }
+
+    def close(self):
+        """Stop the workers and delete all job files."""
+        stop_workers(self.job_queue, self.threads)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+def serve(export, backend_factory=None, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=1,
+          queue_size=DEFAULT_QUEUE_SIZE, max_upload_mb=DEFAULT_MAX_UPLOAD_MB,
+          sync_timeout=DEFAULT_SYNC_TIMEOUT, cache=None, cache_options=None,
+          max_documents=DEFAULT_MAX_DOCUMENTS, max_memory_mb=DEFAULT_MAX_MEMORY_MB, watchdog=None):
+    """
+    Run the conversion server until interrupted with Ctrl+C.
+
+    Args:
+        export (callable): Called as export(session, input_file, output_file)
+        backend_factory (callable, optional): Backend factory (default: Word via COM)
+        host (str): Address to listen on. The default only accepts local connections.
+        port (int): Port to listen on
+        workers (int): Number of conversion workers / Word instances
+        queue_size (int): Maximum jobs waiting for a worker before answering 429
+        max_upload_mb (float): Largest accepted upload
+        sync_timeout (float): Seconds a synchronous request waits before getting a job ID
+        cache (ConversionCache, optional): Reuse cached PDFs
+        cache_options (dict, optional): Export options included in the cache key
+        max_documents (int): Recycle each worker's Word after this many documents
+        max_memory_mb (float): Recycle each worker's Word above this memory use
+        watchdog (Watchdog, optional): Stops Word when a job runs past its time limit
+    """
+    from conversion_http import ConversionHTTPServer
+
+    service = ConversionService(export, backend_factory, workers=workers, queue_size=queue_size,
+                                cache=cache, cache_options=cache_options,
+                                max_documents=max_documents, max_memory_mb=max_memory_mb,
+                                watchdog=watchdog)
+    server = ConversionHTTPServer((host, port), service, max_upload_mb=max_upload_mb,
+                                  sync_timeout=sync_timeout)
+    print(f"Conversion server listening on http://{host}:{server.server_address[1]}/ "
+          f"({workers} worker(s), queue of {queue_size}). Press Ctrl+C to stop.")
+    print(f"  curl --data-binary @report.docx -o report.pdf "
+          f"\"http://{host}:{server.server_address[1]}/convert?filename=report.docx\"")
+    try:
+        server.serve_forever(poll_interval=0.5)
+    except KeyboardInterrupt:
+        print("\n⚠ Stopping conversion server...")
+    finally:
+        server.server_close()
+        service.close()
+
+
+def add_server_arguments(parser):
+    """Add the HTTP server options to an argparse parser."""
+    parser.add_argument('--serve', action='store_true',
+                        help='Run a local HTTP conversion service instead of converting files')
+    parser.add_argument('--host', default=DEFAULT_HOST,
+                        help=f'With --serve, address to listen on (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'With --serve, port to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE, metavar='N',
+                        help=f'With --serve, jobs allowed to wait before answering 429 (default: {DEFAULT_QUEUE_SIZE})')
+    parser.add_argument('--max-upload-mb', type=float, default=DEFAULT_MAX_UPLOAD_MB, metavar='MB',
+                        help=f'With --serve, largest accepted upload (default: {DEFAULT_MAX_UPLOAD_MB})')
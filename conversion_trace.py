@@ -0,0 +1,174 @@
+"""
+Conversion Tracing
+Records timing spans for each conversion stage (Word launch, open, export,
+close, quit, waits) and writes them in the Chrome trace-event format, which
+can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+Tracing is off unless started; span() then only adds the stage's duration
+to per-thread totals (see take_stage_timings()).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class TraceRecorder:
+    """
+    Collects complete ("X") trace events, one track per thread.
+
+    Each worker thread shows up as its own track, labelled with the thread name.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.pid = os.getpid()
+        self._origin = time.perf_counter()
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def _now_us(self):
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def _track(self):
+        """Track ID for the calling thread, registering its name on first use."""
+        thread = threading.current_thread()
+        tid = thread.ident
+        if tid not in self._threads:
+            self._threads[tid] = thread.name
+            self.events.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                'args': {'name': thread.name},
+            })
+        return tid
+
+    @contextmanager
+    def span(self, name, category='conversion', **args):
+        """
+        Record the time spent inside the block as one event.
+
+        Yields the event's args dict, so the block can add results to it.
+        """
+        start = self._now_us()
+        error = None
+        try:
+            yield args
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            event = {
+                'name': name, 'cat': category, 'ph': 'X', 'pid': self.pid,
+                'ts': round(start, 1), 'dur': round(self._now_us() - start, 1),
+            }
+            if error is not None:
+                args['error'] = str(error) or type(error).__name__
+            if args:
+                event['args'] = {key: str(value) for key, value in args.items()}
+            with self._lock:
+                event['tid'] = self._track()
+                self.events.append(event)
+
+    def save(self, path):
+        """Write the collected events as a Chrome trace JSON file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            trace = {'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+
+
+_recorder = None
+
+# Seconds per stage name on each thread, since its last take_stage_timings()
+_stage_totals = threading.local()
+
+
+def start_tracing():
+    """Start recording spans in this process. Returns the recorder."""
+    global _recorder
+    _recorder = TraceRecorder()
+    return _recorder
+
+
+def stop_tracing(path=None):
+    """
+    Stop recording spans, optionally writing them to `path`.
+
+    Returns:
+        TraceRecorder or None: The recorder that was active
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is not None and path:
+        recorder.save(path)
+    return recorder
+
+
+@contextmanager
+def span(name, category='conversion', **args):
+    """
+    Time a conversion stage: recorded as a trace event if tracing is active,
+    and always added to the thread's stage totals.
+
+    Args:
+        name (str): Stage name, e.g. 'launch', 'open', 'export'
+        category (str): Trace category
+        **args: Extra details shown with the event (e.g. file name)
+
+    Yields:
+        dict: The event's details; entries added inside the block are recorded too
+    """
+    recorder = _recorder
+    start = time.perf_counter()
+    try:
+        if recorder is None:
+            yield args
+        else:
+            with recorder.span(name, category, **args) as details:
+                yield details
+    finally:
+        totals = getattr(_stage_totals, 'totals', None)
+        if totals is None:
+            totals = _stage_totals.totals = {}
+        totals[name] = totals.get(name, 0.0) + time.perf_counter() - start
+
+
+def take_stage_timings():
+    """
+    Seconds spent in each span() stage on the calling thread since the last
+    call, whether or not tracing is active. Resets the totals.
+
+    Returns:
+        dict: Stage name -> seconds (nested stages are counted in their parents too)
+    """
+    totals = getattr(_stage_totals, 'totals', None) or {}
+    _stage_totals.totals = {}
+    return totals
+
+
+@contextmanager
+def tracing(path):
+    """
+    Record spans for the duration of the block and write them to `path`.
+    Does nothing if `path` is empty.
+    """
+    if not path:
+        yield
+        return
+    start_tracing()
+    try:
+        yield
+    finally:
+        stop_tracing(path)
+        print(f"✓ Trace written to: {path}")
+
+
+def add_trace_argument(parser):
+    """Add the --trace option to an argparse parser."""
+    parser.add_argument('--trace', metavar='OUT.json',
+                        help='Write per-stage timings as a Chrome/Perfetto trace file')
@@ -0,0 +1,162 @@
+"""
+Conversion Watchdog
+Per-document time limits for conversions. A corrupt or huge document can
+leave Word stuck inside Documents.Open or ExportAsFixedFormat forever; the
+watchdog kills that Word instance once the document's time limit passes, so
+the blocked call fails and the batch carries on with a fresh instance.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from conversion_trace import span
+
+
+# Time limit for a document: base seconds plus seconds per MB of input
+DEFAULT_TIMEOUT_SECONDS = 120
+DEFAULT_TIMEOUT_PER_MB = 30
+
+# With a trained duration model, a document predicted to be slow is allowed
+# this multiple of its predicted conversion time if that is above its limit
+PREDICTED_TIME_FACTOR = 5
+
+
+class ConversionTimeout(Exception):
+    """A document took longer than its time limit and its Word instance was killed."""
+
+    def __init__(self, input_file, limit):
+        super().__init__(f"Timed out after {limit:.0f}s; Word was stopped")
+        self.input_file = input_file
+        self.limit = limit
+
+
+class _Guard:
+    def __init__(self, session, input_file, limit):
+        self.session = session
+        self.input_file = input_file
+        self.limit = limit
+        self.deadline = time.monotonic() + limit
+        self.timed_out = False
+
+
+class Watchdog:
+    """
+    Kills the conversion engine of any document that runs past its time limit.
+
+    One watchdog thread serves every worker. Wrap each conversion in guard();
+    if the limit passes, the session is killed (which makes the blocked Word
+    call fail) and guard() raises ConversionTimeout instead of that error.
+
+    Args:
+        timeout_seconds (float): Base time limit per document (0 = no limit)
+        timeout_per_mb (float): Extra seconds allowed per MB of input
+        model (DurationModel, optional): Once trained on earlier conversions,
+            a document's limit is raised to PREDICTED_TIME_FACTOR times its
+            predicted conversion time when that is longer; the limit from
+            `timeout_seconds` and `timeout_per_mb` is never lowered
+    """
+
+    def __init__(self, timeout_seconds=DEFAULT_TIMEOUT_SECONDS, timeout_per_mb=DEFAULT_TIMEOUT_PER_MB,
+                 model=None):
+        self.timeout_seconds = timeout_seconds
+        self.timeout_per_mb = timeout_per_mb
+        self.model = model
+        self.kills = 0
+        self._guards = set()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def limit_for(self, input_file):
+        """Time limit in seconds for a document: by its size, raised if it is predicted to be slow."""
+        size_mb = Path(input_file).stat().st_size / (1024 * 1024)
+        limit = self.timeout_seconds + self.timeout_per_mb * size_mb
+        if self.model is not None and self.model.trained:
+            limit = max(limit, self.timeout_seconds + PREDICTED_TIME_FACTOR * self.model.estimate(input_file))
+        return limit
+
+    @contextmanager
+    def guard(self, session, input_file):
+        """
+        Enforce the document's time limit on the conversion inside the block.
+
+        Args:
+            session (ConversionBackend): Engine doing the conversion; killed on timeout
+            input_file (Path): Document being converted
+
+        Raises:
+            ConversionTimeout: If the limit passed and the engine was killed
+        """
+        if not self.timeout_seconds:
+            yield
+            return
+
+        guard = _Guard(session, input_file, self.limit_for(input_file))
+        with self._condition:
+            self._guards.add(guard)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='watchdog', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        try:
+            yield
+        except Exception as e:
+            if guard.timed_out:
+                raise ConversionTimeout(input_file, guard.limit) from e
+            raise
+        finally:
+            with self._condition:
+                self._guards.discard(guard)
+
+    def _run(self):
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                expired = [guard for guard in self._guards
+                           if not guard.timed_out and guard.deadline <= now]
+                for guard in expired:
+                    guard.timed_out = True
+                if expired:
+                    # Kill outside the lock so workers can still register and finish
+                    self._condition.release()
+                    try:
+                        for guard in expired:
+                            self._kill(guard)
+                    finally:
+                        self._condition.acquire()
+                    continue
+                waiting = [guard.deadline for guard in self._guards if not guard.timed_out]
+                self._condition.wait(min(waiting) - now if waiting else None)
+
+    def _kill(self, guard):
+        print(f"⏱ {Path(guard.input_file).name} exceeded its {guard.limit:.0f}s limit; stopping Word...")
+        with span('watchdog kill', file=Path(guard.input_file).name, limit=round(guard.limit)):
+            if guard.session.kill():
+                self.kills += 1
+            else:
+                print("⚠ Could not stop the stuck Word instance (its process ID is unknown)")
+
+    def close(self):
+        """Stop the watchdog thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+
+def add_timeout_arguments(parser):
+    """Add the per-document time limit options to an argparse parser."""
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT_SECONDS, metavar='SECONDS',
+                        help='Stop Word and skip a document after this many seconds, plus --timeout-per-mb '
+                             f'for each MB of input; 0 = no limit (default: {DEFAULT_TIMEOUT_SECONDS})')
+    parser.add_argument('--timeout-per-mb', type=float, default=DEFAULT_TIMEOUT_PER_MB, metavar='SECONDS',
+                        help='Extra time allowed per MB of input; with --timings, documents predicted to be '
+                             'slow may be allowed longer, never less '
+                             f'(default: {DEFAULT_TIMEOUT_PER_MB})')
@@ -0,0 +1,260 @@
+"""
+Document Pre-flight
+Inspects a Word document before converting it, to predict how long the
+conversion will take and show a real estimate instead of an open-ended wait.
+
+.docx/.docm files are zip packages. The inspector only reads the zip
+directory, docProps/app.xml (page and word counts as saved by Word) and the
+document body, streamed in chunks, so it takes milliseconds even on
+documents with hundreds of MB of embedded pictures.
+"""
+
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Rough conversion costs on a typical PC. Launching Word is not included.
+BASE_SECONDS = 1.0
+SECONDS_PER_PAGE = 0.05
+SECONDS_PER_MEDIA_MB = 0.4
+SECONDS_PER_MB = 2.0  # for .doc files and packages without a saved page count
+
+# Starting a Word instance that is not already running
+WORD_START_SECONDS = 3.0
+
+# Word lays out and exports the revision marks of documents with tracked changes
+TRACKED_CHANGES_FACTOR = 1.3
+
+# Estimates above this are reported as long conversions
+LONG_CONVERSION_SECONDS = 60
+
+# Document body bytes read per chunk, and the most that is scanned; larger
+# bodies are extrapolated from the part that was read
+_CHUNK_SIZE = 1024 * 1024
+MAX_SCAN_BYTES = 64 * 1024 * 1024
+
+_BODY = 'word/document.xml'
+_MEDIA_PREFIX = 'word/media/'
+# Tables and tracked insertions, deletions and moves in the document body
+_MARKUP = re.compile(rb'<w:(tbl|ins|del|moveFrom|moveTo)[ >/]')
+_LONGEST_TAG = len(b'<w:moveFrom ')
+
+
+class DocumentInfo:
+    """
+    What a pre-flight inspection found out about a document.
+
+    Attributes:
+        size_bytes (int): File size
+        pages (int or None): Page count saved by Word in docProps/app.xml
+        words (int or None): Word count saved by Word
+        media_count (int): Embedded pictures and other media files
+        media_bytes (int): Uncompressed size of the embedded media
+        content_bytes (int): Uncompressed size of the package's XML
+        tables (int): Tables in the document body
+        tracked_changes (bool): True if the body contains tracked revisions
+        is_package (bool): False for .doc files and unreadable packages,
+            which are only described by their size
+        estimated (bool): True if the body was too large to scan completely
+            and the table count is extrapolated
+    """
+
+    def __init__(self, size_bytes):
+        self.size_bytes = size_bytes
+        self.pages = None
+        self.words = None
+        self.media_count = 0
+        self.media_bytes = 0
+        self.content_bytes = size_bytes
+        self.tables = 0
+        self.tracked_changes = False
+        self.is_package = False
+        self.estimated = False
+
+    def estimate_seconds(self):
+        """
+        Predicted conversion time, excluding starting Word.
+
+        Returns:
+            float: Predicted seconds
+        """
+        if self.pages:
+            seconds = (BASE_SECONDS + SECONDS_PER_PAGE * self.pages
+                       + SECONDS_PER_MEDIA_MB * self.media_bytes / (1024 * 1024))
+        else:
+            seconds = BASE_SECONDS + SECONDS_PER_MB * self.content_bytes / (1024 * 1024)
+        if self.tracked_changes:
+            seconds *= TRACKED_CHANGES_FACTOR
+        return seconds
+
+    def summary(self):
+        """One-line description for progress output."""
+        if not self.is_package:
+            return f"{self.size_bytes / (1024 * 1024):.2f} MB"
+        parts = []
+        if self.pages is not None:
+            parts.append(f"{self.pages} page(s)")
+        if self.media_count:
+            parts.append(f"{self.media_count} image(s) ({self.media_bytes / (1024 * 1024):.1f} MB)")
+        if self.tables:
+            parts.append(f"{'~' if self.estimated else ''}{self.tables} table(s)")
+        if self.tracked_changes:
+            parts.append("tracked changes")
+        return ", ".join(parts) or "empty document"
+
+
+def inspect_document(input_file, scan_body=True):
+    """
+    Inspect a Word document without extracting it.
+
+    Args:
+        input_file (Path): Word document
+        scan_body (bool): Count tables and tracked changes in the document
+            body. Without it only the zip directory and docProps/app.xml are read.
+
+    Returns:
+        DocumentInfo: What was found
+    """
+    import zipfile
+
+    info = DocumentInfo(Path(input_file).stat().st_size)
+    try:
+        with zipfile.ZipFile(input_file) as package:
+            content = 0
+            body = None
+            for entry in package.infolist():
+                if entry.filename.startswith(_MEDIA_PREFIX):
+                    info.media_count += 1
+                    info.media_bytes += entry.file_size
+                elif entry.filename.endswith('.xml'):
+                    content += entry.file_size
+                    if entry.filename == _BODY:
+                        body = entry
+            info.content_bytes = content
+            info.is_package = True
+            _read_app_properties(package, info)
+            if scan_body and body is not None:
+                _scan_body(package, body, info)
+    except (zipfile.BadZipFile, OSError, RuntimeError):
+        # .doc files, and encrypted or damaged packages
+        info.is_package = False
+    return info
+
+
+def _read_app_properties(package, info):
+    try:
+        properties = package.read('docProps/app.xml')
+    except KeyError:
+        return
+    for name in ('Pages', 'Words'):
+        match = re.search(rb'<(?:\w+:)?' + name.encode() + rb'>(\d+)<', properties)
+        if match:
+            setattr(info, name.lower(), int(match.group(1)))
+
+
+def _scan_body(package, body, info):
+    """Count tables and look for revision marks in word/document.xml, in chunks."""
+    scanned = 0
+    tail = b''
+    with package.open(body) as f:
+        while True:
+            chunk = f.read(_CHUNK_SIZE) if scanned < MAX_SCAN_BYTES else b''
+            if not chunk:
+                break
+            scanned += len(chunk)
+            data = tail + chunk
+            # A tag cut off at the end of the chunk is counted with the next one
+            limit = max(len(data) - _LONGEST_TAG, 0)
+            _count_markup(data, limit, info)
+            tail = data[limit:]
+    if scanned < body.file_size:
+        info.estimated = True
+        if scanned:
+            info.tables = round(info.tables * body.file_size / scanned)
+    else:
+        _count_markup(tail, len(tail), info)
+
+
+def _count_markup(data, limit, info):
+    """Count the tags in `data` that start before `limit`."""
+    for match in _MARKUP.finditer(data):
+        if match.start() >= limit:
+            break
+        if match.group(1) == b'tbl':
+            info.tables += 1
+        else:
+            info.tracked_changes = True
+
+
+def format_duration(seconds):
+    """Format seconds as '42s' or '3m 05s'."""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}m {seconds:02d}s" if minutes else f"{seconds}s"
+
+
+def describe(info, seconds=None):
+    """
+    Print the pre-flight summary and the conversion time estimate.
+
+    Args:
+        info (DocumentInfo): Pre-flight inspection of the document
+        seconds (float, optional): Estimate to show instead of info.estimate_seconds(),
+            e.g. from a model fitted on earlier conversions
+
+    Returns:
+        float: Estimated seconds
+    """
+    if seconds is None:
+        seconds = info.estimate_seconds()
+    print(f"Document: {info.summary()}")
+    print(f"Estimated conversion time: ~{format_duration(seconds)}")
+    if seconds > LONG_CONVERSION_SECONDS:
+        print("⚠ Long conversion expected. Please be patient...")
+    return seconds
+
+
+@contextmanager
+def eta_progress(estimate_seconds, interval=1.0, stream=None):
+    """
+    Show elapsed time and the time remaining on one updating console line
+    while the block runs. Does nothing unless the output is a terminal.
+
+    Args:
+        estimate_seconds (float): Predicted duration of the block
+        interval (float): Seconds between updates
+        stream (file, optional): Output stream (default: sys.stdout)
+    """
+    stream = stream or sys.stdout
+    if not getattr(stream, 'isatty', lambda: False)():
+        yield
+        return
+
+    done = threading.Event()
+    started = time.monotonic()
+
+    def show():
+        while not done.wait(interval):
+            elapsed = time.monotonic() - started
+            if elapsed < estimate_seconds:
+                percent = 100 * elapsed / estimate_seconds
+                line = (f"  ⏱ {format_duration(elapsed)} elapsed, "
+                        f"~{format_duration(estimate_seconds - elapsed)} left ({percent:.0f}%)")
+            else:
+                line = f"  ⏱ {format_duration(elapsed)} elapsed, taking longer than estimated..."
+            stream.write(f"\r{line:<60}")
+            stream.flush()
+
+    thread = threading.Thread(target=show, name='eta', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        done.set()
+        thread.join()
+        if time.monotonic() - started >= interval:
+            stream.write("\r" + " " * 60 + "\r")
+            stream.flush()
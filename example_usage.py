@@ -49,6 +49,19 @@ def example_recursive_conversion():
         print(f"Error: {e}")
 
 
+
+# Example 5: Convert from asyncio code, four documents at a time
+def example_async_conversion():
+    """Convert several files from an asyncio event loop"""
+    import asyncio
+    from async_convert import convert_many
+    
+    results = asyncio.run(convert_many(["report.docx", "letter.docx"], concurrency=4,
+                                       output_folder="output_pdfs"))
+    for result in results:
+        print(f"{result.input_file.name}: {'ok' if result.ok else result.error}")
+
+
 if __name__ == "__main__":
     print("Word to PDF Converter - Example Usage")
     print("=" * 50)
@@ -59,6 +72,7 @@ if __name__ == "__main__":
     # example_custom_output()
     # example_batch_conversion()
     # example_recursive_conversion()
+    # example_async_conversion()
     
     print("\nNote: Make sure to have Word documents ready before running examples!")
 
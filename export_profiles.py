@@ -0,0 +1,63 @@
+"""
+Export Profiles
+Named sets of Word's ExportAsFixedFormat options, so a conversion can trade
+print quality for smaller PDFs that are quicker to write to a share and to
+serve, or produce archival PDF/A files.
+"""
+
+
+PRINT = 'print'
+SCREEN = 'screen'
+ARCHIVE = 'archive'
+
+# ExportAsFixedFormat parameters for best quality and layout preservation
+_PRINT_OPTIONS = {
+    'ExportFormat': 17,  # wdExportFormatPDF
+    'OpenAfterExport': False,
+    'OptimizeFor': 0,  # wdExportOptimizeForPrint (best quality)
+    'Range': 0,  # wdExportAllDocument
+    'From': 1,
+    'To': 1,
+    'Item': 0,  # wdExportDocumentContent
+    'IncludeDocProps': True,
+    'KeepIRM': True,
+    'CreateBookmarks': 1,  # wdExportCreateHeadingBookmarks
+    'DocStructureTags': True,
+    'BitmapMissingFonts': True,
+    'UseISO19005_1': False,
+}
+
+PROFILES = {
+    # Full-resolution images; fonts that cannot be embedded are drawn as bitmaps
+    PRINT: _PRINT_OPTIONS,
+    # Images downsampled for on-screen viewing, and text in fonts that cannot
+    # be embedded kept as text instead of bitmaps: much smaller files
+    SCREEN: {**_PRINT_OPTIONS, 'OptimizeFor': 1, 'BitmapMissingFonts': False},  # wdExportOptimizeForOnScreen
+    # PDF/A-1 for long-term archiving: fonts embedded, no rights management
+    ARCHIVE: {**_PRINT_OPTIONS, 'UseISO19005_1': True, 'KeepIRM': False},
+}
+
+DEFAULT_PROFILE = PRINT
+
+
+def export_options(profile=DEFAULT_PROFILE):
+    """
+    ExportAsFixedFormat options of a named profile.
+
+    Args:
+        profile (str): PRINT, SCREEN or ARCHIVE
+
+    Returns:
+        dict: A copy of the profile's options
+    """
+    try:
+        return dict(PROFILES[profile])
+    except KeyError:
+        raise ValueError(f"Unknown export profile '{profile}'. Available: {', '.join(PROFILES)}")
+
+
+def add_profile_argument(parser):
+    """Add the --export-profile option to an argparse parser."""
+    parser.add_argument('--export-profile', choices=list(PROFILES), default=DEFAULT_PROFILE,
+                        help="PDF settings: 'print' (full quality), 'screen' (downsampled images, "
+                             f"smaller files) or 'archive' (PDF/A) (default: {DEFAULT_PROFILE})")
@@ -0,0 +1,222 @@
+"""
+Word Document Scanner
+Single-pass, streaming discovery of Word documents in a folder tree.
+"""
+
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+
+
+# Document types Word can open and export to PDF (compared case-insensitively)
+WORD_EXTENSIONS = ('.docx', '.doc', '.docm')
+
+# Word creates "~$name.docx" owner files next to documents that are open
+OWNER_FILE_PREFIX = '~$'
+
+# Folders listed at once by scan_tree(); on network shares most of a listing
+# is spent waiting for the server, so this is well above the CPU count
+DEFAULT_SCAN_WORKERS = 16
+
+
+def is_word_document(file_name):
+    """Check whether a file name looks like a convertible Word document."""
+    name = os.path.basename(file_name)
+    return (name.lower().endswith(WORD_EXTENSIONS)
+            and not name.startswith(OWNER_FILE_PREFIX))
+
+
+def _matches(relative_path, name, patterns):
+    """Match glob patterns against the relative path, or the name for bare patterns."""
+    for pattern in patterns:
+        target = relative_path if '/' in pattern else name
+        if fnmatch(target.lower(), pattern.lower()):
+            return True
+    return False
+
+
+def is_excluded_folder(relative_dir, exclude=None):
+    """
+    Check whether a folder, or any folder above it, matches an exclude pattern.
+
+    Args:
+        relative_dir (str): Folder path relative to the input folder, using '/' separators
+        exclude (list, optional): Glob patterns for documents and folders to skip
+
+    Returns:
+        bool: True if iter_word_files() would not descend into the folder
+    """
+    if not exclude or not relative_dir:
+        return False
+    parts = relative_dir.split('/')
+    for depth in range(1, len(parts) + 1):
+        if _matches('/'.join(parts[:depth]), parts[depth - 1], exclude):
+            return True
+    return False
+
+
+def is_selected(relative_path, recursive=False, include=None, exclude=None):
+    """
+    Check whether a path relative to the scanned folder would be picked up by
+    iter_word_files() with the same settings, without listing the folder.
+
+    Args:
+        relative_path (str): Path relative to the input folder, using '/' separators
+        recursive (bool): If False, only documents directly in the folder are selected
+        include (list, optional): Glob patterns a document must match
+        exclude (list, optional): Glob patterns for documents and folders to skip
+
+    Returns:
+        bool: True if the path is a Word document that should be converted
+    """
+    relative_dir, _, name = relative_path.rpartition('/')
+    if not is_word_document(name) or (relative_dir and not recursive):
+        return False
+    if exclude and (is_excluded_folder(relative_dir, exclude) or _matches(relative_path, name, exclude)):
+        return False
+    return not include or _matches(relative_path, name, include)
+
+
+def iter_word_files(input_dir, recursive=False, include=None, exclude=None):
+    """
+    Yield Word documents in a folder as they are found, in a single pass.
+
+    Uses os.scandir so each directory is listed once and file types come from
+    the directory entries. Documents are yielded as soon as they are seen, so
+    conversion can start before the whole tree has been walked.
+
+    Args:
+        input_dir (str): Folder to scan
+        recursive (bool): If True, descend into subfolders
+        include (list, optional): Glob patterns a document must match, e.g. ['report*'].
+            Patterns containing '/' match the path relative to input_dir.
+        exclude (list, optional): Glob patterns for documents and folders to skip
+
+    Yields:
+        Path: Path of each matching Word document
+    """
+    root = Path(input_dir)
+    include = list(include or [])
+    exclude = list(exclude or [])
+    pending = [(root, '')]
+
+    while pending:
+        directory, relative_dir = pending.pop()
+        documents = []
+        subdirectories = []
+        try:
+            # Read one directory at a time so no handle stays open during conversions
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative_path = f"{relative_dir}{entry.name}"
+                    try:
+                        # Like rglob, do not follow folder symlinks (they can loop)
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+
+                    if is_dir:
+                        if recursive and not _matches(relative_path, entry.name, exclude):
+                            subdirectories.append((entry.path, relative_path + '/'))
+                        continue
+
+                    if not is_word_document(entry.name):
+                        continue
+                    if include and not _matches(relative_path, entry.name, include):
+                        continue
+                    if exclude and _matches(relative_path, entry.name, exclude):
+                        continue
+                    documents.append(entry.path)
+        except (PermissionError, FileNotFoundError) as e:
+            print(f"⚠ Skipping unreadable folder {directory}: {e}")
+            continue
+
+        for document in documents:
+            yield Path(document)
+
+        # Visit subfolders in listing order
+        pending.extend(reversed(subdirectories))
+
+
+def _list_folder(directory, match, list_files, folder_times):
+    """
+    List one folder for scan_tree(): its subfolders (with their modification
+    times when `folder_times` is set) and, if `list_files`, its matching files
+    with their stat results.
+    """
+    subfolders = []
+    files = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        mtime = entry.stat(follow_symlinks=False).st_mtime if folder_times else None
+                        subfolders.append((entry.path, mtime))
+                    elif list_files and match(entry.name):
+                        # Free on Windows, where scandir returns the file's stat data
+                        files.append((entry.path, entry.stat()))
+                except OSError:
+                    continue
+    except OSError as e:
+        print(f"⚠ Skipping unreadable folder {directory}: {e}")
+    return subfolders, files
+
+
+def scan_tree(root, match, changed_since=None, workers=DEFAULT_SCAN_WORKERS):
+    """
+    Yield files in a folder tree as they are found, listing up to `workers`
+    folders at a time.
+
+    Listing folders concurrently hides the round trip of each listing and
+    stat on network shares (SMB, NFS). File stat data comes from the folder
+    entries, which is free on Windows and one stat per matching file elsewhere.
+
+    With `changed_since`, files are not listed in folders whose modification
+    time is older: creating, deleting or renaming a file updates its folder's
+    time, so such folders cannot hold files created since then. Their
+    subfolders are still visited. A file rewritten in place without being
+    replaced does not update its folder and is missed.
+
+    Args:
+        root (str): Folder to scan
+        match (callable): Called with each file name; True to yield the file
+        changed_since (float, optional): Skip the files of folders unchanged
+            since this time.time()
+        workers (int): Folders listed at once (at least 1)
+
+    Yields:
+        tuple: (path, os.stat_result) for each matching file, in the order found
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    root = str(root)
+    workers = max(1, workers)
+    list_root = True
+    if changed_since is not None:
+        try:
+            list_root = os.stat(root).st_mtime >= changed_since
+        except OSError:
+            pass
+    folders = [(root, list_root)]
+    in_flight = set()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scan')
+    try:
+        while folders or in_flight:
+            # Bound the listings in flight; the rest wait as paths in `folders`
+            while folders and len(in_flight) < workers:
+                folder, list_files = folders.pop()
+                in_flight.add(executor.submit(_list_folder, folder, match, list_files,
+                                              changed_since is not None))
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                subfolders, files = future.result()
+                for path, mtime in subfolders:
+                    folders.append((path, mtime is None or mtime >= changed_since))
+                for path, stat in files:
+                    yield path, stat
+    finally:
+        # Stop listing if the caller stops reading
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
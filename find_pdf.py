@@ -1,58 +1,105 @@
 """
 Helper script to find recently created PDF files
 Useful if you're not sure where your PDF was saved
+
+PDFs written by the converters are listed from the output index
+(see output_index.py) without touching the folder tree; folders are only
+scanned when there is no index yet, or with --scan, several folders at a
+time with results printed as they are found.
 """
 
 import os
+import time
+import argparse
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
+from file_scanner import scan_tree, DEFAULT_SCAN_WORKERS
+from output_index import OutputIndex, DEFAULT_INDEX_PATH
+
+
+def _from_index(index, directory, cutoff):
+    """Recent PDFs under `directory` recorded in the output index, checking each still exists."""
+    found_files = []
+    for record in index.recent(cutoff, under=directory):
+        try:
+            size = os.stat(record['pdf']).st_size
+        except OSError:
+            # Deleted or moved since it was converted
+            continue
+        found_files.append((Path(record['pdf']), datetime.fromtimestamp(record['time']),
+                            size / (1024 * 1024)))
+    return found_files
+
 
-def find_recent_pdfs(directory, hours=1):
+def _positive_int(value):
+    """argparse type for a whole number of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def _from_scan(directory, cutoff, prune=True, workers=DEFAULT_SCAN_WORKERS):
+    """Recent PDFs under `directory`, yielded as the concurrent folder walk finds them."""
+    for path, stat in scan_tree(directory, lambda name: name.lower().endswith('.pdf'),
+                                changed_since=cutoff if prune else None, workers=workers):
+        if stat.st_ctime > cutoff:
+            yield Path(path), datetime.fromtimestamp(stat.st_ctime), stat.st_size / (1024 * 1024)
+
+
+def find_recent_pdfs(directory, hours=1, index=None, prune=True, workers=DEFAULT_SCAN_WORKERS):
     """
     Find PDF files created in the last N hours
     
     Args:
         directory: Directory to search
         hours: How many hours back to search
+        index (OutputIndex, optional): Answer from this output index instead of
+            scanning the folders (default: the converters' index, if it exists;
+            pass False to always scan)
+        prune (bool): When scanning, skip the files of folders not modified
+            within the last N hours (their subfolders are still searched)
+        workers (int): Folders listed at once when scanning
+    
+    Returns:
+        list: (path, creation time, size in MB) tuples, in the order printed
+            (newest first from the index, as found when scanning)
     """
     directory = Path(directory)
-    cutoff_time = datetime.now() - timedelta(hours=hours)
+    cutoff = time.time() - hours * 3600
+    if index is None:
+        index = OutputIndex()
     
     print(f"Searching for PDF files created in the last {hours} hour(s)...")
     print(f"Location: {directory}")
+    
+    if index and index.exists():
+        print(f"Source: output index ({index.path})")
+        results = _from_index(index, directory, cutoff)
+    else:
+        print("Source: folder scan")
+        results = _from_scan(directory, cutoff, prune, workers)
     print("=" * 70)
+    print()
     
+    # Print each PDF as soon as it is found rather than after the whole walk
     found_files = []
-    
-    # Search for PDF files
-    for pdf_file in directory.rglob("*.pdf"):
-        try:
-            # Get file creation time
-            creation_time = datetime.fromtimestamp(pdf_file.stat().st_ctime)
-            
-            if creation_time > cutoff_time:
-                file_size_mb = pdf_file.stat().st_size / (1024 * 1024)
-                found_files.append((pdf_file, creation_time, file_size_mb))
-        except Exception as e:
-            continue
-    
-    # Sort by creation time (newest first)
-    found_files.sort(key=lambda x: x[1], reverse=True)
+    for pdf_path, creation_time, size in results:
+        found_files.append((pdf_path, creation_time, size))
+        print(f"{len(found_files)}. {pdf_path.name}")
+        print(f"   Size: {size:.2f} MB")
+        print(f"   Created: {creation_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"   Location: {pdf_path}")
+        print()
     
     if found_files:
-        print(f"\nFound {len(found_files)} PDF file(s):\n")
-        
-        for i, (pdf_path, creation_time, size) in enumerate(found_files, 1):
-            print(f"{i}. {pdf_path.name}")
-            print(f"   Size: {size:.2f} MB")
-            print(f"   Created: {creation_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"   Location: {pdf_path}")
-            print()
-        
+        print(f"Found {len(found_files)} PDF file(s)")
         return found_files
     else:
-        print(f"\n❌ No PDF files found created in the last {hours} hour(s)")
+        print(f"❌ No PDF files found created in the last {hours} hour(s)")
         print(f"\nTry increasing the search time or checking a different directory.")
+        if index and index.exists():
+            print("PDFs not made by the converters are only found with --scan.")
         return []
 
 
@@ -62,14 +109,21 @@ def open_file_location(file_path):
 
 
 if __name__ == "__main__":
-    import sys
-    
-    # Default to current directory
-    search_dir = Path(__file__).parent
-    
-    # Allow command line argument for directory
-    if len(sys.argv) > 1:
-        search_dir = Path(sys.argv[1])
+    parser = argparse.ArgumentParser(description='Locate recently created PDF files.')
+    # Default to the script's folder
+    parser.add_argument('directory', nargs='?', default=str(Path(__file__).parent),
+                        help='Folder to search (default: this script\'s folder)')
+    parser.add_argument('--hours', type=float, default=1,
+                        help='How many hours back to search (default: 1)')
+    parser.add_argument('--scan', action='store_true',
+                        help=f'Scan the folders instead of reading the output index ({DEFAULT_INDEX_PATH})')
+    parser.add_argument('--no-prune', action='store_true',
+                        help='When scanning, also check PDFs in folders not modified within --hours '
+                             '(finds PDFs overwritten in place, but is slower)')
+    parser.add_argument('--workers', type=_positive_int, default=DEFAULT_SCAN_WORKERS, metavar='N',
+                        help=f'Folders listed at once when scanning (default: {DEFAULT_SCAN_WORKERS})')
+    args = parser.parse_args()
+    search_dir = Path(args.directory)
     
     print("=" * 70)
     print("PDF Finder - Locate Recently Created PDFs")
@@ -77,7 +131,8 @@ if __name__ == "__main__":
     print()
     
     # Search for PDFs
-    found = find_recent_pdfs(search_dir, hours=1)
+    found = find_recent_pdfs(search_dir, hours=args.hours, index=False if args.scan else None,
+                             prune=not args.no_prune, workers=args.workers)
     
     if found:
         print("=" * 70)
@@ -87,9 +142,10 @@ if __name__ == "__main__":
             response = input("Enter 'y' to open, or file number (1, 2, etc.): ").strip().lower()
             
             if response == 'y':
-                # Open most recent
-                open_file_location(found[0][0])
-                print(f"✓ Opened location: {found[0][0].parent}")
+                # Open most recent (scan results are in the order found)
+                newest = max(found, key=lambda x: x[1])
+                open_file_location(newest[0])
+                print(f"✓ Opened location: {newest[0].parent}")
             elif response.isdigit():
                 idx = int(response) - 1
                 if 0 <= idx < len(found):
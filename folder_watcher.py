@@ -0,0 +1,366 @@
+"""
+Folder Watcher
+Long-running watch mode: converts Word documents within seconds of them
+landing in a folder, instead of rescanning the whole folder on a schedule.
+
+Changes are picked up with inotify on Linux (blocking, so an idle watcher
+uses no CPU) and by periodic polling elsewhere. A document is only converted
+once its size and modification time have stopped changing, so files that are
+still being copied in are left alone until they are complete.
+"""
+
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+from batch_manifest import BatchManifest
+from file_scanner import iter_word_files, is_selected, is_excluded_folder
+from parallel_batch import BatchResult, start_workers, stop_workers
+from word_pool import DEFAULT_MAX_DOCUMENTS, DEFAULT_MAX_MEMORY_MB
+
+
+# A document must keep the same size and mtime this long before it is converted
+DEFAULT_SETTLE_SECONDS = 2.0
+
+# Seconds between folder scans when inotify is not available
+DEFAULT_POLL_INTERVAL = 2.0
+
+# inotify event masks (see <sys/inotify.h>)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class PollingChangeSource:
+    """
+    Detects changed documents by rescanning the folder every `interval` seconds
+    and comparing sizes and modification times with the previous scan.
+    """
+
+    def __init__(self, root, recursive=False, include=None, exclude=None,
+                 interval=DEFAULT_POLL_INTERVAL):
+        self.root = Path(root)
+        self.recursive = recursive
+        self.include = include
+        self.exclude = exclude
+        self.interval = interval
+        self._snapshot = {}
+        self._last_scan = None
+
+    def wait(self, timeout=None):
+        """
+        Wait up to `timeout` seconds (or until the next scan is due) for changes.
+
+        Returns:
+            set: Paths of documents that were added or changed
+        """
+        if self._last_scan is not None:
+            due_in = self._last_scan + self.interval - time.monotonic()
+            delay = due_in if timeout is None else min(due_in, timeout)
+            if delay > 0:
+                time.sleep(delay)
+            if time.monotonic() < self._last_scan + self.interval:
+                return set()
+
+        self._last_scan = time.monotonic()
+        snapshot = {}
+        changed = set()
+        for path in iter_word_files(self.root, self.recursive, self.include, self.exclude):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_size, stat.st_mtime)
+            if self._snapshot.get(path) != snapshot[path]:
+                changed.add(path)
+        self._snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyChangeSource:
+    """
+    Detects changed documents from Linux inotify events.
+
+    Waiting blocks in select() on the inotify descriptor, so an idle watcher
+    does not wake up. Subfolders are watched as they appear when `recursive`.
+
+    Raises:
+        OSError: If inotify is not available
+    """
+
+    def __init__(self, root, recursive=False, include=None, exclude=None):
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+        self.root = Path(root).resolve()
+        self.recursive = recursive
+        self.include = include
+        self.exclude = exclude
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches = {}
+        self._rescan_needed = False
+        self._add_tree(self.root)
+
+    def _add_watch(self, directory):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), _WATCH_MASK)
+        if wd < 0:
+            import ctypes
+            print(f"⚠ Cannot watch folder {directory}: {os.strerror(ctypes.get_errno())}")
+            return
+        self._watches[wd] = Path(directory)
+
+    def _add_tree(self, directory):
+        """Watch a folder and, when recursive, every selected folder below it."""
+        self._add_watch(directory)
+        if not self.recursive:
+            return
+        for current, subdirectories, _ in os.walk(directory):
+            subdirectories[:] = [name for name in subdirectories
+                                 if not self._is_excluded_dir(Path(current) / name)]
+            for name in subdirectories:
+                self._add_watch(Path(current) / name)
+
+    def _is_excluded_dir(self, path):
+        return is_excluded_folder(path.relative_to(self.root).as_posix(), self.exclude)
+
+    def _is_selected(self, path):
+        return is_selected(path.relative_to(self.root).as_posix(), self.recursive,
+                           self.include, self.exclude)
+
+    def wait(self, timeout=None):
+        """
+        Wait up to `timeout` seconds (forever if None) for changes.
+
+        Returns:
+            set or None: Paths of documents that may have changed, or None if
+                events were lost and the folder must be rescanned
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode(sys.getfilesystemencoding(), 'surrogateescape')
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                self._rescan_needed = True
+                continue
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+
+            if mask & _IN_ISDIR:
+                if self.recursive and mask & (_IN_CREATE | _IN_MOVED_TO) and not self._is_excluded_dir(path):
+                    # A new folder may already contain documents (e.g. moved in whole)
+                    self._add_tree(path)
+                    changed.update(document for document in iter_word_files(path, True)
+                                   if self._is_selected(document))
+                continue
+            if self._is_selected(path):
+                changed.add(path)
+
+        if self._rescan_needed:
+            self._rescan_needed = False
+            return None
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_change_source(root, recursive=False, include=None, exclude=None,
+                       poll_interval=DEFAULT_POLL_INTERVAL, force_polling=False):
+    """
+    Create the best available change source for a folder.
+
+    Returns:
+        InotifyChangeSource or PollingChangeSource
+    """
+    if not force_polling:
+        try:
+            return InotifyChangeSource(root, recursive, include, exclude)
+        except (OSError, AttributeError):
+            # Not Linux, or the inotify limit is exhausted; fall back to polling
+            pass
+    return PollingChangeSource(root, recursive, include, exclude, poll_interval)
+
+
+def watch_folder(input_folder, output_path_for, export, backend_factory=None, recursive=False,
+                 include=None, exclude=None, manifest_dir=None, cache=None, cache_options=None,
+                 settle_seconds=DEFAULT_SETTLE_SECONDS, poll_interval=DEFAULT_POLL_INTERVAL,
+                 force_polling=False, max_documents=DEFAULT_MAX_DOCUMENTS,
+                 max_memory_mb=DEFAULT_MAX_MEMORY_MB, stop_event=None, watchdog=None,
+                 on_success=None):
+    """
+    Convert documents as they are added to or changed in a folder, until
+    interrupted with Ctrl+C or `stop_event` is set.
+
+    Documents already in the folder are converted first unless the manifest
+    shows their PDF is up to date. New and changed documents are queued to a
+    single conversion worker that keeps its Word session warm between files.
+
+    Args:
+        input_folder (str): Folder to watch
+        output_path_for (callable): Returns the output PDF path for a document
+        export (callable): Called as export(session, input_file, output_file)
+        backend_factory (callable, optional): Backend factory (default: Word via COM)
+        recursive (bool): Also watch subfolders
+        include (list, optional): Glob patterns documents must match
+        exclude (list, optional): Glob patterns for documents and folders to skip
+        manifest_dir (str, optional): Folder for the manifest of converted documents
+            (default: the input folder)
+        cache (ConversionCache, optional): Reuse cached PDFs
+        cache_options (dict, optional): Export options included in the cache key
+        settle_seconds (float): How long a document's size and mtime must stay
+            unchanged before it is converted
+        poll_interval (float): Seconds between scans when polling
+        force_polling (bool): Poll even where inotify is available (e.g. network shares,
+            where inotify does not see changes made by other machines)
+        max_documents (int): Recycle Word after this many documents
+        max_memory_mb (float): Recycle Word above this memory use
+        stop_event (threading.Event, optional): Stops watching when set
+        watchdog (Watchdog, optional): Stops Word when a document runs past its time limit
+        on_success (callable, optional): Also called as on_success(input_file,
+            output_file) after each document is converted, e.g. OutputIndex.record
+
+    Returns:
+        BatchResult: Counts and durations of the conversions done while watching
+    """
+    input_dir = Path(input_folder).resolve()
+    if not input_dir.exists() or not input_dir.is_dir():
+        raise NotADirectoryError(f"Input folder not found: {input_folder}")
+    stop_event = stop_event or threading.Event()
+
+    manifest = BatchManifest(input_dir, Path(manifest_dir) if manifest_dir else input_dir)
+
+    on_converted = on_success
+
+    def on_success(input_file, output_file):
+        manifest.record(input_file, output_file)
+        manifest.save()
+        if on_converted is not None:
+            on_converted(input_file, output_file)
+
+    in_flight = set()
+    in_flight_lock = threading.Lock()
+
+    def on_done(input_file, duration, error):
+        with in_flight_lock:
+            in_flight.discard(input_file)
+
+    result = BatchResult(on_record=on_done)
+    job_queue = queue.Queue()
+    threads = start_workers(job_queue, 1, result, export, backend_factory=backend_factory,
+                            max_documents=max_documents, max_memory_mb=max_memory_mb,
+                            cache=cache, cache_options=cache_options, on_success=on_success,
+                            watchdog=watchdog, name='watch')
+
+    source = open_change_source(input_dir, recursive, include, exclude, poll_interval, force_polling)
+    mode = f"polling every {poll_interval:g}s" if isinstance(source, PollingChangeSource) else 'inotify'
+    print(f"Watching {input_dir} for Word documents ({mode}). Press Ctrl+C to stop.")
+    print("-" * 60)
+
+    # Candidate documents -> (size, mtime, time that size/mtime were first seen)
+    settling = {}
+    changed = set(iter_word_files(input_dir, recursive, include, exclude))
+
+    try:
+        while not stop_event.is_set() and any(thread.is_alive() for thread in threads):
+            if changed is None:
+                changed = set(iter_word_files(input_dir, recursive, include, exclude))
+            for path in changed:
+                settling.setdefault(path, None)
+
+            now = time.monotonic()
+            for path in list(settling):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    # Deleted or renamed before it settled
+                    del settling[path]
+                    continue
+                signature = (stat.st_size, stat.st_mtime)
+                previous = settling[path]
+                if previous is None or previous[:2] != signature:
+                    settling[path] = signature + (now,)
+                    continue
+                if now - previous[2] < settle_seconds:
+                    continue
+
+                with in_flight_lock:
+                    if path in in_flight:
+                        # Changed again while converting; try once the current job is done
+                        continue
+                del settling[path]
+                output_file = output_path_for(path)
+                if manifest.is_up_to_date(path, output_file):
+                    continue
+                with in_flight_lock:
+                    in_flight.add(path)
+                print(f"Queued: {path.name}")
+                job_queue.put((path, output_file))
+
+            # Wake up in time to re-check settling documents; otherwise block until an event
+            timeout = min(settle_seconds / 2, 0.5) if settling else 1.0
+            changed = source.wait(timeout)
+    except KeyboardInterrupt:
+        print("\n⚠ Stopping watch mode...")
+    finally:
+        source.close()
+        stop_workers(job_queue, threads)
+        manifest.save()
+
+    print("-" * 60)
+    print(f"Watch mode stopped: {result.successful} converted, {result.failed} failed")
+    return result
+
+
+def add_watch_arguments(parser):
+    """Add the watch mode options to an argparse parser."""
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and convert documents as they are added to or changed in the folder')
+    parser.add_argument('--settle-seconds', type=float, default=DEFAULT_SETTLE_SECONDS, metavar='S',
+                        help='With --watch, wait until a document has been unchanged for S seconds '
+                             f'before converting it (default: {DEFAULT_SETTLE_SECONDS:g})')
+    parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL, metavar='S',
+                        help=f'With --watch, seconds between folder scans when polling (default: {DEFAULT_POLL_INTERVAL:g})')
+    parser.add_argument('--force-polling', action='store_true',
+                        help='With --watch, scan the folder instead of using inotify (for network shares)')
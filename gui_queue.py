@@ -0,0 +1,461 @@
+"""
+Word to PDF Converter - GUI Conversion Queue
+A window that converts many files and folders at once on a small pool of
+background workers, each keeping its own Word instance warm, with a status
+line per file and the overall throughput.
+"""
+
+import queue
+import threading
+import time
+from pathlib import Path
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+from file_scanner import iter_word_files, WORD_EXTENSIONS
+from parallel_batch import BatchResult, start_workers, stop_workers
+from export_profiles import export_options, DEFAULT_PROFILE
+from docx_preflight import format_duration
+
+
+# Full-quality PDF export settings (the 'print' profile)
+EXPORT_OPTIONS = export_options(DEFAULT_PROFILE)
+
+DEFAULT_GUI_WORKERS = 2
+MAX_GUI_WORKERS = 8
+
+# Worker updates are collected and applied to the window at most this often
+FLUSH_INTERVAL_MS = 100
+
+QUEUED = 'Queued'
+CONVERTING = 'Converting'
+DONE = 'Done'
+FAILED = 'Failed'
+CANCELLED = 'Cancelled'
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class QueueItem:
+    """One document in the conversion queue and its current status."""
+
+    def __init__(self, input_file, output_file):
+        self.input_file = input_file
+        self.output_file = output_file
+        # Identifies the document in the queue; re-adding it replaces the item
+        self.key = input_file.resolve()
+        self.status = QUEUED
+        self.worker = None
+        self.duration = None
+        self.error = None
+
+
+def _export(session, input_file, output_file):
+    """Export one document on a worker's Word session."""
+    session.convert(input_file.resolve(), output_file.resolve(), EXPORT_OPTIONS)
+
+
+class ConversionQueue:
+    """
+    Converts queued documents on background workers and reports status changes
+    to the Tk thread in batches.
+
+    Workers start with the first queued document and keep their Word session
+    warm until close(). Every status change marks its item as changed; changed
+    items are handed to `on_update` together, at most once per
+    `flush_interval_ms`, so hundreds of documents finishing quickly cost a few
+    redraws rather than one Tk callback each.
+
+    Args:
+        backend_factory (callable): Backend factory for the workers
+        schedule (callable): Runs a function on the Tk thread after a delay,
+            called as schedule(delay_ms, func) (e.g. root.after)
+        on_update (callable): Called on the Tk thread with a list of changed QueueItems
+        flush_interval_ms (int): Minimum time between on_update calls
+        on_success (callable, optional): Called on a worker thread as
+            on_success(input_file, output_file) for each converted document
+    """
+
+    def __init__(self, backend_factory, schedule, on_update, flush_interval_ms=FLUSH_INTERVAL_MS,
+                 on_success=None):
+        self.backend_factory = backend_factory
+        self.on_success = on_success
+        self.schedule = schedule
+        self.on_update = on_update
+        self.flush_interval_ms = flush_interval_ms
+        self.items = {}
+        self.result = BatchResult(on_record=self._on_record)
+        self._jobs = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._changed = {}
+        self._flush_scheduled = False
+        self._active = 0
+        self._run_started = None
+        self._run_ended = None
+        self._run_finished = 0
+
+    def start(self, workers=DEFAULT_GUI_WORKERS):
+        """Start the conversion workers (done automatically by the first add)."""
+        if self._threads:
+            return
+        self._threads = start_workers(self._jobs, workers, self.result, _export,
+                                      backend_factory=self.backend_factory,
+                                      on_success=self.on_success, on_start=self._on_start,
+                                      name='gui')
+
+    def add_paths(self, paths, workers=DEFAULT_GUI_WORKERS):
+        """
+        Queue Word documents, and every Word document under folders, for conversion.
+
+        Folders are scanned on a background thread; documents appear in the
+        queue as they are found. Each PDF is saved next to its document.
+
+        Args:
+            paths (list): Files and folders to add
+            workers (int): Number of workers, if they are not running yet
+        """
+        self.start(workers)
+        thread = threading.Thread(target=self._scan, args=(list(paths),), name='gui-scan', daemon=True)
+        thread.start()
+
+    def _scan(self, paths):
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                for word_file in iter_word_files(path, recursive=True):
+                    self._enqueue(word_file)
+            elif path.suffix.lower() in WORD_EXTENSIONS and not path.name.startswith('~$'):
+                self._enqueue(path)
+
+    def _enqueue(self, input_file):
+        item = QueueItem(input_file, input_file.with_suffix('.pdf'))
+        with self._lock:
+            previous = self.items.get(item.key)
+            if previous is not None and previous.status not in FINISHED:
+                return
+            self.items[item.key] = item
+            if not self._active:
+                # The queue was idle, so throughput is measured afresh from here
+                self._run_started = None
+            self._active += 1
+        self._jobs.put((item.input_file, item.output_file))
+        self._changed_item(item)
+
+    def _on_start(self, input_file, output_file):
+        """on_start hook for the workers."""
+        with self._lock:
+            item = self.items.get(input_file.resolve())
+            if item is None:
+                return
+            item.status = CONVERTING
+            item.worker = threading.current_thread().name
+            if self._run_started is None:
+                self._run_started = time.perf_counter()
+                self._run_finished = 0
+                self._run_ended = None
+        self._changed_item(item)
+
+    def _on_record(self, input_file, duration, error):
+        """on_record hook for the workers' BatchResult."""
+        with self._lock:
+            item = self.items.get(input_file.resolve())
+            if item is None:
+                return
+            item.status = DONE if error is None else FAILED
+            item.duration = duration
+            item.error = None if error is None else str(error)
+            self._active -= 1
+            self._run_finished += 1
+            if not self._active:
+                self._run_ended = time.perf_counter()
+        self._changed_item(item)
+
+    def _changed_item(self, item):
+        with self._lock:
+            self._changed[item] = None
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.schedule(self.flush_interval_ms, self._flush)
+
+    def _flush(self):
+        """Hand all items changed since the last flush to on_update (Tk thread)."""
+        with self._lock:
+            changed = list(self._changed)
+            self._changed.clear()
+            self._flush_scheduled = False
+        if changed:
+            self.on_update(changed)
+
+    def cancel_pending(self):
+        """Remove documents that have not started converting yet from the queue."""
+        cancelled = []
+        while True:
+            try:
+                input_file, _ = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                item = self.items.get(input_file.resolve())
+                if item is not None and item.status == QUEUED:
+                    item.status = CANCELLED
+                    self._active -= 1
+                    cancelled.append(item)
+                    if not self._active and self._run_started is not None:
+                        self._run_ended = time.perf_counter()
+        for item in cancelled:
+            self._changed_item(item)
+        return cancelled
+
+    def clear_finished(self):
+        """
+        Forget documents that are done, failed or cancelled.
+
+        Returns:
+            list: The removed QueueItems
+        """
+        with self._lock:
+            removed = [item for item in self.items.values() if item.status in FINISHED]
+            for item in removed:
+                del self.items[item.key]
+        return removed
+
+    def counts(self):
+        """Number of items in each status."""
+        with self._lock:
+            statuses = [item.status for item in self.items.values()]
+        return {status: statuses.count(status) for status in (QUEUED, CONVERTING, DONE, FAILED, CANCELLED)}
+
+    def throughput(self):
+        """
+        Documents per minute since the current run started, and the estimated
+        seconds until the queue is empty.
+
+        Returns:
+            tuple: (docs_per_min, seconds_left); either may be None
+        """
+        with self._lock:
+            started, ended = self._run_started, self._run_ended
+            finished, remaining = self._run_finished, self._active
+        if started is None or not finished:
+            return None, None
+        elapsed = (ended or time.perf_counter()) - started
+        rate = finished / elapsed * 60 if elapsed > 0 else None
+        seconds_left = remaining / rate * 60 if rate else None
+        return rate, seconds_left
+
+    def close(self):
+        """Cancel queued documents, let the workers finish their current one, and stop them."""
+        self.cancel_pending()
+        stop_workers(self._jobs, self._threads)
+        self._threads = []
+
+
+class ConversionQueueWindow:
+    """Queue view: add files and folders, then watch them convert."""
+
+    def __init__(self, root, backend_factory, colors, on_success=None):
+        self.root = root
+        self.colors = colors
+        self.window = tk.Toplevel(root)
+        self.window.title("Word to PDF Converter - Conversion Queue")
+        self.window.geometry("760x520")
+        self.window.configure(bg=colors['bg'])
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.queue = ConversionQueue(backend_factory, self.window.after, self.refresh,
+                                     on_success=on_success)
+        self.workers = tk.IntVar(value=DEFAULT_GUI_WORKERS)
+        self.summary_text = tk.StringVar(value="Add Word documents or folders to start converting")
+        self.rows = {}
+        self.closing = False
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Create and layout the queue window widgets"""
+        toolbar = tk.Frame(self.window, bg=self.colors['bg'])
+        toolbar.pack(fill=tk.X, padx=15, pady=(15, 10))
+
+        def button(text, command, color):
+            btn = tk.Button(
+                toolbar,
+                text=text,
+                command=command,
+                font=("Segoe UI", 10, "bold"),
+                bg=color,
+                fg="white",
+                relief=tk.FLAT,
+                cursor="hand2",
+                padx=12,
+                pady=6
+            )
+            btn.pack(side=tk.LEFT, padx=(0, 8))
+            return btn
+
+        button("➕ Add Files...", self.add_files, self.colors['secondary'])
+        button("📁 Add Folder...", self.add_folder, self.colors['secondary'])
+        button("⏹ Stop", self.stop, self.colors['danger'])
+        button("🧹 Clear Finished", self.clear_finished, "#757575")
+
+        self.workers_spinbox = tk.Spinbox(
+            toolbar,
+            from_=1,
+            to=MAX_GUI_WORKERS,
+            textvariable=self.workers,
+            width=3,
+            font=("Segoe UI", 10)
+        )
+        self.workers_spinbox.pack(side=tk.RIGHT)
+        tk.Label(
+            toolbar,
+            text="Word instances:",
+            font=("Segoe UI", 9),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(side=tk.RIGHT, padx=(0, 5))
+
+        # Per-file status list
+        list_frame = tk.Frame(self.window, bg=self.colors['bg'])
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=15)
+
+        self.tree = ttk.Treeview(list_frame, columns=('file', 'folder', 'status', 'time'),
+                                 show='headings', selectmode='browse')
+        for column, heading, width, stretch in (('file', 'Document', 220, True),
+                                                ('folder', 'Folder', 250, True),
+                                                ('status', 'Status', 170, True),
+                                                ('time', 'Time', 60, False)):
+            self.tree.heading(column, text=heading, anchor=tk.W)
+            self.tree.column(column, width=width, stretch=stretch, anchor=tk.W)
+        self.tree.tag_configure(DONE, foreground=self.colors['primary'])
+        self.tree.tag_configure(FAILED, foreground=self.colors['danger'])
+        self.tree.tag_configure(CANCELLED, foreground="#999999")
+
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Overall progress
+        progress_frame = tk.Frame(self.window, bg=self.colors['bg'])
+        progress_frame.pack(fill=tk.X, padx=15, pady=(10, 15))
+
+        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate', maximum=1)
+        self.progress_bar.pack(fill=tk.X, pady=(0, 8))
+
+        tk.Label(
+            progress_frame,
+            textvariable=self.summary_text,
+            font=("Segoe UI", 10),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(anchor=tk.W)
+
+    def add_files(self):
+        """Choose Word documents to add to the queue"""
+        filenames = filedialog.askopenfilenames(
+            parent=self.window,
+            title="Select Word Documents",
+            filetypes=[
+                ("Word Documents", "*.docx *.doc *.docm"),
+                ("All Files", "*.*")
+            ]
+        )
+        if filenames:
+            self.add_paths(filenames)
+
+    def add_folder(self):
+        """Choose a folder whose Word documents (including subfolders) are added to the queue"""
+        folder = filedialog.askdirectory(parent=self.window, title="Select Folder of Word Documents")
+        if folder:
+            self.add_paths([folder])
+
+    def add_paths(self, paths):
+        """Queue files and folders for conversion"""
+        try:
+            workers = max(1, min(MAX_GUI_WORKERS, int(self.workers.get())))
+        except (tk.TclError, ValueError):
+            workers = DEFAULT_GUI_WORKERS
+        self.queue.add_paths(paths, workers)
+        # The worker count is fixed once the workers are running
+        self.workers_spinbox.config(state='disabled')
+
+    def stop(self):
+        """Cancel documents that have not started yet"""
+        self.queue.cancel_pending()
+
+    def clear_finished(self):
+        """Remove done, failed and cancelled documents from the list"""
+        for item in self.queue.clear_finished():
+            row = self.rows.pop(item.key, None)
+            if row is not None:
+                self.tree.delete(row)
+        self.update_summary()
+
+    def refresh(self, items):
+        """Apply a batch of status changes to the list (Tk thread)"""
+        if self.closing:
+            return
+        for item in items:
+            values = self._row_values(item)
+            # Keyed by document, so a re-added document reuses its row
+            row = self.rows.get(item.key)
+            if row is None:
+                self.rows[item.key] = self.tree.insert('', tk.END, values=values, tags=(item.status,))
+            elif self.tree.exists(row):
+                self.tree.item(row, values=values, tags=(item.status,))
+        self.update_summary()
+
+    def _row_values(self, item):
+        if item.status == CONVERTING:
+            status = f"⏳ Converting ({item.worker})"
+        elif item.status == DONE:
+            status = "✅ Done"
+        elif item.status == FAILED:
+            status = f"❌ {item.error}"
+        elif item.status == CANCELLED:
+            status = "Cancelled"
+        else:
+            status = "Queued"
+        duration = f"{item.duration:.1f}s" if item.duration is not None else ""
+        return (item.input_file.name, str(item.input_file.parent), status, duration)
+
+    def update_summary(self):
+        """Update the progress bar and the throughput line"""
+        counts = self.queue.counts()
+        finished = counts[DONE] + counts[FAILED]
+        total = finished + counts[QUEUED] + counts[CONVERTING]
+        self.progress_bar.config(maximum=max(total, 1), value=finished)
+
+        if not total:
+            self.summary_text.set("Add Word documents or folders to start converting")
+            return
+        parts = [f"{finished} of {total} converted"]
+        if counts[FAILED]:
+            parts.append(f"{counts[FAILED]} failed")
+        rate, seconds_left = self.queue.throughput()
+        if rate:
+            parts.append(f"{rate:.1f} docs/min")
+        if seconds_left and (counts[QUEUED] or counts[CONVERTING]):
+            parts.append(f"about {format_duration(seconds_left)} left")
+        self.summary_text.set("  •  ".join(parts))
+
+    def close(self):
+        """Close the window, letting documents being converted finish first"""
+        counts = self.queue.counts()
+        if counts[QUEUED] or counts[CONVERTING]:
+            if not messagebox.askyesno(
+                "Conversions Running",
+                "Documents are still being converted.\n\n"
+                "Stop converting and close the queue? Documents already being "
+                "converted will finish first.",
+                parent=self.window
+            ):
+                return
+        self.closing = True
+        self.window.withdraw()
+
+        def shutdown():
+            self.queue.close()
+            self.root.after(0, self.window.destroy)
+
+        threading.Thread(target=shutdown, name='gui-shutdown', daemon=True).start()
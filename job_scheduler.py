@@ -0,0 +1,77 @@
+"""
+Job Scheduler
+Orders batch documents by their predicted conversion time. Parallel batches
+finish sooner when the biggest documents start first (a large document picked
+up last keeps one Word instance busy while the others sit idle), and
+smallest-first gives the quickest feedback on a long run.
+"""
+
+import heapq
+
+
+FIFO = 'fifo'
+LARGEST_FIRST = 'largest'
+SMALLEST_FIRST = 'smallest'
+SCHEDULES = (FIFO, LARGEST_FIRST, SMALLEST_FIRST)
+DEFAULT_SCHEDULE = FIFO
+
+
+def predicted_makespan(costs, workers):
+    """
+    Wall time for `workers` to finish jobs taken from a shared queue in the
+    given order, each job going to whichever worker frees up first.
+
+    Args:
+        costs (list): Predicted seconds of each job, in queue order
+        workers (int): Number of parallel workers
+
+    Returns:
+        float: Seconds until the last worker finishes
+    """
+    finish_times = [0.0] * max(1, workers)
+    for cost in costs:
+        heapq.heapreplace(finish_times, finish_times[0] + cost)
+    return max(finish_times)
+
+
+def schedule_jobs(jobs, schedule, model, workers=1):
+    """
+    Order (input_file, output_file) jobs for conversion.
+
+    FIFO keeps the scan order and streams jobs as they are found. The other
+    schedules need every job up front: 'largest' starts the longest
+    predicted conversions first, so parallel workers hand out work in
+    longest-processing-time order and finish close together; 'smallest'
+    converts quick documents first for fast feedback.
+
+    Args:
+        jobs (iterable): (input_file, output_file) pairs
+        schedule (str): FIFO, LARGEST_FIRST or SMALLEST_FIRST
+        model (DurationModel): Predicts each document's conversion time (see timing_store)
+        workers (int): Parallel workers, used for the predicted wall time
+
+    Returns:
+        iterable: The jobs in conversion order
+    """
+    if schedule == FIFO:
+        return jobs
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown schedule '{schedule}'. Available: {', '.join(SCHEDULES)}")
+
+    costed = [(model.estimate(input_file), input_file, output_file)
+              for input_file, output_file in jobs]
+    costed.sort(key=lambda job: job[0], reverse=(schedule == LARGEST_FIRST))
+    if costed:
+        costs = [cost for cost, _, _ in costed]
+        print(f"Scheduling {len(costed)} document(s) {schedule}-first: "
+              f"~{sum(costs):.0f}s of conversion, ~{predicted_makespan(costs, workers):.0f}s "
+              f"with {workers} worker(s)")
+    return [(input_file, output_file) for _, input_file, output_file in costed]
+
+
+def add_schedule_argument(parser):
+    """Add the --schedule option to an argparse parser."""
+    parser.add_argument('--schedule', choices=SCHEDULES, default=DEFAULT_SCHEDULE,
+                        help="Batch order: 'largest' predicted conversion first (shortest total time "
+                             "with --workers), 'smallest' first (quickest feedback) or 'fifo' "
+                             f"(scan order, default: {DEFAULT_SCHEDULE})")
@@ -0,0 +1,159 @@
+"""
+Output Index
+Append-only record of every PDF the converters produce (path, size, time and
+source document), so finding recent outputs does not mean walking a share
+with hundreds of thousands of PDFs.
+
+The index is a JSON-lines file. Records are appended in the order the PDFs
+were written, so "what was produced in the last N hours" is answered by
+reading the file backwards from the end and stopping at the first record
+older than the cutoff.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+DEFAULT_INDEX_PATH = Path.home() / '.word_to_pdf_outputs.jsonl'
+
+# Bytes read per step when reading the index backwards
+_BLOCK_SIZE = 64 * 1024
+
+# Parallel workers and separate processes append slightly out of time order;
+# keep reading this far past the cutoff before stopping
+_REORDER_SECONDS = 300
+
+
+class OutputIndex:
+    """
+    Append-only index of produced PDFs. Safe to share between worker threads;
+    several processes can append to the same file.
+
+    Args:
+        path (str): Index file (created on the first record)
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def exists(self):
+        """True if any PDF has been recorded."""
+        return self.path.exists()
+
+    def record(self, input_file, output_file):
+        """
+        Add a produced PDF. Fits the on_success(input_file, output_file)
+        callback of the batch functions.
+
+        Args:
+            input_file (Path): Source document
+            output_file (Path): PDF that was written
+        """
+        output_file = Path(output_file).resolve()
+        try:
+            size = output_file.stat().st_size
+        except OSError:
+            return
+        line = json.dumps({
+            'time': round(time.time(), 3),
+            'pdf': str(output_file),
+            'size': size,
+            'source': str(Path(input_file).resolve()),
+        }) + '\n'
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # One write per record, so concurrent appends do not interleave
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+            except OSError as e:
+                print(f"⚠ Could not update the output index {self.path}: {e}")
+
+    def _records_backwards(self):
+        """Yield the index's records, newest first, skipping damaged lines."""
+        with open(self.path, 'rb') as f:
+            position = f.seek(0, os.SEEK_END)
+            rest = b''
+            while position > 0:
+                step = min(_BLOCK_SIZE, position)
+                position -= step
+                f.seek(position)
+                lines = (f.read(step) + rest).split(b'\n')
+                # The first line may continue in the previous block
+                rest = lines.pop(0)
+                for line in reversed(lines):
+                    record = _parse(line)
+                    if record is not None:
+                        yield record
+            record = _parse(rest)
+            if record is not None:
+                yield record
+
+    def recent(self, since, under=None):
+        """
+        PDFs recorded at or after a time, newest first, each path once.
+
+        Args:
+            since (float): Earliest time.time() to include
+            under (str, optional): Only PDFs inside this folder
+
+        Returns:
+            list: Records (dicts with time, pdf, size and source)
+        """
+        prefix = None
+        if under is not None:
+            prefix = os.path.join(os.path.normcase(str(Path(under).resolve())), '')
+        seen = set()
+        found = []
+        for record in self._records_backwards():
+            if record['time'] < since - _REORDER_SECONDS:
+                break
+            pdf = record['pdf']
+            if record['time'] < since or pdf in seen:
+                continue
+            seen.add(pdf)
+            if prefix is None or os.path.normcase(pdf).startswith(prefix):
+                found.append(record)
+        found.sort(key=lambda record: record['time'], reverse=True)
+        return found
+
+
+def _parse(line):
+    """A record from one index line, or None for a damaged or partial line."""
+    try:
+        record = json.loads(line)
+        record['time'] = float(record['time'])
+    except (ValueError, KeyError, TypeError):
+        return None
+    return record if isinstance(record.get('pdf'), str) else None
+
+
+def add_index_argument(parser):
+    """Add the --no-output-index option to an argparse parser."""
+    parser.add_argument('--no-output-index', action='store_true',
+                        help=f'Do not record produced PDFs in the output index ({DEFAULT_INDEX_PATH}) '
+                             'used by find_pdf.py')
+
+
+def index_from_args(args):
+    """
+    The OutputIndex to record PDFs in, from parsed command-line arguments.
+
+    Returns:
+        OutputIndex or None: None if recording was turned off
+    """
+    return None if args.no_output_index else OutputIndex()
+
+
+def index_from_config(config):
+    """
+    The OutputIndex to record PDFs in, from configuration file settings.
+
+    Returns:
+        OutputIndex or None: None if recording is turned off in the config
+    """
+    return OutputIndex() if config.get('output_index', True) else None
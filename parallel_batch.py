@@ -0,0 +1,242 @@
+"""
+Parallel Batch Conversion
+Runs several isolated conversion workers, each on its own COM-initialized
+thread with a dedicated Word (or other backend) instance, pulling documents
+from a shared queue.
+"""
+
+import queue
+import threading
+import time
+from conversion_backends import com_apartment, get_backend_factory
+from conversion_trace import span
+from conversion_watchdog import ConversionTimeout
+from word_pool import WordPool, DEFAULT_MAX_DOCUMENTS, DEFAULT_MAX_MEMORY_MB
+
+
+_STOP = object()
+
+
+class BatchResult:
+    """
+    Aggregated outcome of a batch run.
+
+    Args:
+        on_record (callable, optional): Called as on_record(input_file, duration, error)
+            after each document is recorded, on the recording thread
+    """
+
+    def __init__(self, on_record=None):
+        self.successful = 0
+        self.failed = 0
+        self.skipped = 0
+        self.failed_files = []
+        self.timed_out_files = []
+        self.durations = []
+        self.on_record = on_record
+        self._lock = threading.Lock()
+
+    @property
+    def total(self):
+        return self.successful + self.failed + self.skipped
+
+    @property
+    def timed_out(self):
+        return len(self.timed_out_files)
+
+    def record(self, input_file, duration, error=None):
+        with self._lock:
+            self.durations.append(duration)
+            if error is None:
+                self.successful += 1
+            else:
+                self.failed += 1
+                self.failed_files.append(input_file.name)
+                if isinstance(error, ConversionTimeout):
+                    self.timed_out_files.append((input_file.name, error.limit))
+        if self.on_record is not None:
+            self.on_record(input_file, duration, error)
+
+
+def _worker_loop(name, jobs, result, export, pool_options, print_lock, cache, cache_options,
+                 on_success, on_start, watchdog):
+    """Convert jobs from the queue until the stop marker is received."""
+    with com_apartment(pool_options['backend_factory']):
+        pool = WordPool(**pool_options)
+        try:
+            while True:
+                job = jobs.get()
+                if job is _STOP:
+                    break
+
+                input_file, output_file = job
+                if on_start is not None:
+                    on_start(input_file, output_file)
+                start = time.perf_counter()
+                session = None
+                cached = False
+                try:
+                    with span('document', file=input_file.name):
+                        output_file.parent.mkdir(parents=True, exist_ok=True)
+                        cache_key = None
+                        if cache is not None:
+                            with span('cache lookup', category='cache'):
+                                cache_key = cache.key_for(input_file, cache_options)
+                                cached = cache.materialize(cache_key, output_file)
+                        if not cached:
+                            session = pool.acquire()
+                            if watchdog is not None:
+                                with watchdog.guard(session, input_file):
+                                    export(session, input_file, output_file)
+                            else:
+                                export(session, input_file, output_file)
+                            pool.release(session)
+                            # The session is back in the pool; a later error is not Word's fault
+                            session = None
+                            if cache_key is not None:
+                                try:
+                                    with span('cache store', category='cache'):
+                                        cache.store(cache_key, output_file)
+                                except OSError as e:
+                                    # The PDF is written; only the next run loses the cache hit
+                                    with print_lock:
+                                        print(f"[{name}] ⚠ Could not cache {input_file.name}: {e}")
+                        if on_success is not None:
+                            on_success(input_file, output_file)
+                    error = None
+                except Exception as e:
+                    if session is not None:
+                        pool.release(session, failed=True)
+                    error = e
+
+                duration = time.perf_counter() - start
+                result.record(input_file, duration, error)
+                with print_lock:
+                    if cached:
+                        print(f"[{name}] ✓ {input_file.name} (cached)")
+                    elif error is None:
+                        print(f"[{name}] ✓ {input_file.name} ({duration:.1f}s)")
+                    else:
+                        print(f"[{name}] ✗ {input_file.name}: {error}")
+        finally:
+            pool.close()
+
+
+def _put_while_alive(job_queue, item, threads):
+    """Put an item on the queue, giving up if no worker thread is left to take it."""
+    while True:
+        try:
+            job_queue.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            if not any(thread.is_alive() for thread in threads):
+                return False
+
+
+def start_workers(job_queue, workers, result, export, backend_factory=None,
+                  max_documents=DEFAULT_MAX_DOCUMENTS, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                  cache=None, cache_options=None, on_success=None, on_start=None, watchdog=None,
+                  name='worker'):
+    """
+    Start conversion worker threads that take (input_file, output_file) jobs
+    from `job_queue` until stop_workers() is called.
+
+    Each worker keeps its own warm backend session (see WordPool). Arguments
+    are as for run_parallel_batch(); `name` prefixes each worker's output lines.
+
+    Returns:
+        list: The started threads
+    """
+    pool_options = {
+        'max_documents': max_documents,
+        'max_memory_mb': max_memory_mb,
+        'backend_factory': backend_factory or get_backend_factory(),
+    }
+    print_lock = threading.Lock()
+
+    threads = []
+    for i in range(workers):
+        worker_name = f"{name}-{i + 1}"
+        thread = threading.Thread(
+            target=_worker_loop,
+            name=worker_name,
+            args=(worker_name, job_queue, result, export, pool_options, print_lock,
+                  cache, cache_options, on_success, on_start, watchdog),
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+def stop_workers(job_queue, threads):
+    """
+    Tell workers started with start_workers() to finish the queued jobs and
+    exit, and wait for them.
+    """
+    for _ in threads:
+        _put_while_alive(job_queue, _STOP, threads)
+
+    # Join with a timeout so Ctrl+C still reaches the main thread
+    for thread in threads:
+        while thread.is_alive():
+            thread.join(0.5)
+
+
+def run_parallel_batch(jobs, export, workers, max_documents=DEFAULT_MAX_DOCUMENTS,
+                       max_memory_mb=DEFAULT_MAX_MEMORY_MB, backend_factory=None, cache=None,
+                       cache_options=None, on_success=None, on_start=None, on_record=None,
+                       watchdog=None):
+    """
+    Convert documents using several workers, each with its own Word instance.
+
+    A failing document only fails itself; the worker recycles its Word session
+    and carries on with the next document in the queue.
+
+    Args:
+        jobs (iterable): (input_file, output_file) Path pairs to convert
+        export (callable): Called as export(session, input_file, output_file)
+        workers (int): Number of worker threads / Word instances
+        max_documents (int): Recycle each worker's Word after this many documents
+        max_memory_mb (float): Recycle each worker's Word above this memory use
+        backend_factory (callable, optional): Backend factory for each worker's WordPool
+            (default: Word via COM)
+        cache (ConversionCache, optional): Reuse cached PDFs for unchanged documents
+        cache_options (dict, optional): Export options included in the cache key
+        on_success (callable, optional): Called as on_success(input_file, output_file)
+            on the worker thread after each successful conversion
+        on_start (callable, optional): Called as on_start(input_file, output_file)
+            on the worker thread before each document is converted
+        on_record (callable, optional): Passed to the BatchResult; called as
+            on_record(input_file, duration, error) after each document
+        watchdog (Watchdog, optional): Kills a worker's Word if a document runs
+            past its time limit; the worker then continues on a fresh instance
+
+    Returns:
+        BatchResult: Success/failure counts and per-document durations
+    """
+    result = BatchResult(on_record=on_record)
+    job_queue = queue.Queue(maxsize=workers * 2)
+    threads = start_workers(job_queue, workers, result, export, backend_factory=backend_factory,
+                            max_documents=max_documents, max_memory_mb=max_memory_mb,
+                            cache=cache, cache_options=cache_options, on_success=on_success,
+                            on_start=on_start, watchdog=watchdog)
+
+    for job in jobs:
+        if not _put_while_alive(job_queue, job, threads):
+            # Every worker has died; fail the document rather than block forever
+            result.record(job[0], 0.0, RuntimeError("no conversion worker available"))
+            print(f"✗ {job[0].name}: no conversion worker available")
+    stop_workers(job_queue, threads)
+
+    # Anything still queued was never picked up by a worker
+    while True:
+        try:
+            job = job_queue.get_nowait()
+        except queue.Empty:
+            break
+        if job is not _STOP:
+            result.record(job[0], 0.0, RuntimeError("no conversion worker available"))
+            print(f"✗ {job[0].name}: no conversion worker available")
+
+    return result
@@ -0,0 +1,703 @@
+"""
+PDF Merge
+Stitches PDFs exported from page ranges of one document back into a single
+PDF, keeping the bookmarks (outline), named destinations and document
+properties.
+
+The merge streams: each input is memory-mapped and its objects are copied to
+the output one at a time with their object numbers shifted, so memory use
+does not grow with the size of the document. Only the objects that tie a PDF
+together (catalog, page tree, outline root, name trees) are rebuilt.
+
+Handles the PDFs Word writes: classic or stream cross-reference tables
+(including hybrid files), object streams and incremental updates.
+Encrypted PDFs are not supported.
+"""
+
+import mmap
+import os
+import re
+import zlib
+from pathlib import Path
+
+
+_WHITESPACE = b'\x00\t\n\x0c\r '
+_DELIMITERS = b'()<>[]{}/%'
+_INTEGER = re.compile(rb'[+-]?\d+$')
+
+# Page attributes a page inherits from its ancestors in the page tree
+_INHERITABLE = (b'/Resources', b'/MediaBox', b'/CropBox', b'/Rotate')
+
+# Catalog entries copied from the first part
+_CATALOG_KEEP = (b'/Lang', b'/MarkInfo', b'/ViewerPreferences', b'/Metadata', b'/PageLayout')
+
+# What malformed input makes the parser raise; reported as PdfMergeError
+_READ_ERRORS = (AttributeError, IndexError, KeyError, TypeError, ValueError, zlib.error)
+
+
+class PdfMergeError(Exception):
+    """A PDF could not be read or merged."""
+
+
+class Ref:
+    """An indirect object reference (N G R)."""
+
+    __slots__ = ('num', 'gen')
+
+    def __init__(self, num, gen=0):
+        self.num = num
+        self.gen = gen
+
+    def __eq__(self, other):
+        return isinstance(other, Ref) and other.num == self.num
+
+    def __hash__(self):
+        return hash(self.num)
+
+
+class Token(bytes):
+    """A name, number, string or keyword, kept exactly as written."""
+
+
+class Stream:
+    """A stream object: its dictionary and raw (still encoded) data."""
+
+    __slots__ = ('dict', 'data')
+
+    def __init__(self, dictionary, data):
+        self.dict = dictionary
+        self.data = data
+
+
+class _Parser:
+    """Parses PDF objects from a bytes-like buffer."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def skip_whitespace(self, pos):
+        data = self.data
+        length = len(data)
+        while pos < length:
+            char = data[pos]
+            if char in _WHITESPACE:
+                pos += 1
+            elif char == 0x25:  # % comment
+                while pos < length and data[pos] not in b'\r\n':
+                    pos += 1
+            else:
+                break
+        return pos
+
+    def _regular_token(self, pos):
+        data = self.data
+        end = pos
+        length = len(data)
+        while end < length and data[end] not in _WHITESPACE and data[end] not in _DELIMITERS:
+            end += 1
+        return bytes(data[pos:end]), end
+
+    def parse(self, pos):
+        """
+        Parse one object starting at `pos`.
+
+        Returns:
+            tuple: (value, position after the value)
+        """
+        pos = self.skip_whitespace(pos)
+        data = self.data
+        char = data[pos:pos + 1]
+
+        if char == b'<':
+            if data[pos + 1:pos + 2] == b'<':
+                return self._parse_dict(pos + 2)
+            end = data.find(b'>', pos)
+            return Token(data[pos:end + 1]), end + 1
+        if char == b'[':
+            items = []
+            pos += 1
+            while True:
+                pos = self.skip_whitespace(pos)
+                if data[pos:pos + 1] == b']':
+                    return items, pos + 1
+                value, pos = self.parse(pos)
+                items.append(value)
+        if char == b'(':
+            return self._parse_literal_string(pos)
+        if char == b'/':
+            token, end = self._regular_token(pos + 1)
+            return Token(b'/' + token), end
+        if char in (b')', b'>', b']', b'}', b'{'):
+            raise PdfMergeError(f"Unexpected {char!r} at offset {pos}")
+
+        token, end = self._regular_token(pos)
+        if not token:
+            raise PdfMergeError(f"Unreadable object at offset {pos}")
+        if _INTEGER.match(token):
+            # "N G R" is a reference; otherwise it is just a number
+            gen_start = self.skip_whitespace(end)
+            gen, gen_end = self._regular_token(gen_start)
+            if gen_end > gen_start and gen.isdigit():
+                r_start = self.skip_whitespace(gen_end)
+                keyword, r_end = self._regular_token(r_start)
+                if keyword == b'R':
+                    return Ref(int(token), int(gen)), r_end
+        return Token(token), end
+
+    def _parse_dict(self, pos):
+        items = {}
+        data = self.data
+        while True:
+            pos = self.skip_whitespace(pos)
+            if data[pos:pos + 2] == b'>>':
+                return items, pos + 2
+            key, pos = self.parse(pos)
+            if not key.startswith(b'/'):
+                raise PdfMergeError(f"Dictionary key expected at offset {pos}")
+            value, pos = self.parse(pos)
+            items[bytes(key)] = value
+
+    def _parse_literal_string(self, pos):
+        data = self.data
+        depth = 0
+        end = pos
+        while True:
+            char = data[end]
+            if char == 0x5c:  # backslash escapes the next character
+                end += 2
+                continue
+            if char == 0x28:
+                depth += 1
+            elif char == 0x29:
+                depth -= 1
+                if depth == 0:
+                    return Token(data[pos:end + 1]), end + 1
+            end += 1
+
+
+def serialize(value):
+    """Write a parsed object back out as PDF syntax."""
+    if isinstance(value, Token):
+        return bytes(value)
+    if isinstance(value, Ref):
+        return b'%d %d R' % (value.num, value.gen)
+    if isinstance(value, dict):
+        return b'<<' + b''.join(key + b' ' + serialize(item) + b'\n'
+                                for key, item in value.items()) + b'>>'
+    if isinstance(value, list):
+        return b'[' + b' '.join(serialize(item) for item in value) + b']'
+    if isinstance(value, int):
+        return b'%d' % value
+    if isinstance(value, str):
+        return value.encode('latin-1')
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _renumber(value, offset):
+    """Copy of `value` with every reference's object number shifted by `offset`."""
+    if isinstance(value, Ref):
+        return Ref(value.num + offset)
+    if isinstance(value, dict):
+        return {key: _renumber(item, offset) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_renumber(item, offset) for item in value]
+    return value
+
+
+def _png_unpredict(data, columns):
+    """Undo the PNG row predictors used by cross-reference streams."""
+    row_size = columns + 1
+    previous = bytearray(columns)
+    output = bytearray()
+    for start in range(0, len(data), row_size):
+        kind = data[start]
+        row = bytearray(data[start + 1:start + row_size])
+        for i in range(len(row)):
+            left = row[i - 1] if i else 0
+            up = previous[i]
+            if kind == 1:
+                row[i] = (row[i] + left) & 0xff
+            elif kind == 2:
+                row[i] = (row[i] + up) & 0xff
+            elif kind == 3:
+                row[i] = (row[i] + (left + up) // 2) & 0xff
+            elif kind == 4:
+                upper_left = previous[i - 1] if i else 0
+                estimate = left + up - upper_left
+                candidates = (abs(estimate - left), abs(estimate - up), abs(estimate - upper_left))
+                row[i] = (row[i] + (left, up, upper_left)[candidates.index(min(candidates))]) & 0xff
+        output += row
+        previous = row
+    return bytes(output)
+
+
+class PdfReader:
+    """
+    Random access to the objects of one PDF file.
+
+    Args:
+        path (Path): PDF file
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise PdfMergeError(f"{self.path.name} is empty")
+        self._parser = _Parser(self._data)
+        self._object_streams = {}
+        # Object number -> (1, offset) or (2, object stream number, index)
+        self.xref = {}
+        self.trailer = {}
+        try:
+            self._read_xref_chain()
+        except _READ_ERRORS as e:
+            self.close()
+            raise PdfMergeError(f"Cannot read {self.path.name}: {e}") from e
+        if b'/Encrypt' in self.trailer:
+            self.close()
+            raise PdfMergeError(f"{self.path.name} is encrypted")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._file.close()
+
+    @property
+    def size(self):
+        """One more than the highest object number in use."""
+        return max(int(self.trailer.get(b'/Size', 0)), max(self.xref, default=0) + 1)
+
+    def _read_xref_chain(self):
+        tail = self._data[-2048:]
+        marker = tail.rfind(b'startxref')
+        if marker < 0:
+            raise PdfMergeError(f"{self.path.name} has no cross-reference table")
+        offset = int(tail[marker + 9:].split()[0])
+        seen = set()
+        while offset is not None and offset not in seen:
+            seen.add(offset)
+            offset = self._read_xref_section(offset)
+
+    def _read_xref_section(self, offset):
+        """Read one cross-reference section; returns the previous section's offset."""
+        pos = self._parser.skip_whitespace(offset)
+        if self._data[pos:pos + 4] == b'xref':
+            trailer = self._read_xref_table(pos + 4)
+            # Hybrid files list compressed objects in an extra cross-reference stream
+            if b'/XRefStm' in trailer:
+                self._read_xref_stream(int(trailer[b'/XRefStm']))
+        else:
+            trailer = self._read_xref_stream(pos)
+        for key, value in trailer.items():
+            self.trailer.setdefault(key, value)
+        previous = trailer.get(b'/Prev')
+        return int(previous) if previous is not None else None
+
+    def _read_xref_table(self, pos):
+        data = self._data
+        while True:
+            pos = self._parser.skip_whitespace(pos)
+            if data[pos:pos + 7] == b'trailer':
+                trailer, _ = self._parser.parse(pos + 7)
+                return trailer
+            line_end = pos
+            while data[line_end] not in b'\r\n':
+                line_end += 1
+            start, count = (int(part) for part in data[pos:line_end].split())
+            pos = line_end
+            for num in range(start, start + count):
+                pos = self._parser.skip_whitespace(pos)
+                offset, _, kind = data[pos:pos + 18].split()
+                pos += 18
+                if kind == b'n' and num not in self.xref:
+                    self.xref[num] = (1, int(offset))
+
+    def _read_xref_stream(self, pos):
+        _, stream = self._read_indirect(pos)
+        fields = stream.dict
+        widths = [int(width) for width in fields[b'/W']]
+        data = self._decode(stream)
+        index = fields.get(b'/Index') or [0, fields[b'/Size']]
+        entry_size = sum(widths)
+        entry = 0
+        for first, count in zip(index[0::2], index[1::2]):
+            for num in range(int(first), int(first) + int(count)):
+                row = data[entry * entry_size:(entry + 1) * entry_size]
+                entry += 1
+                values = []
+                start = 0
+                for width in widths:
+                    values.append(int.from_bytes(row[start:start + width], 'big') if width else None)
+                    start += width
+                kind = 1 if values[0] is None else values[0]
+                if num in self.xref or kind == 0:
+                    continue
+                if kind == 1:
+                    self.xref[num] = (1, values[1])
+                elif kind == 2:
+                    self.xref[num] = (2, values[1], values[2] or 0)
+        return fields
+
+    def _decode(self, stream):
+        """Decoded data of a Flate-compressed stream (all this module needs to decode)."""
+        filters = stream.dict.get(b'/Filter')
+        filters = filters if isinstance(filters, list) else [filters] if filters else []
+        filters = [self.resolve(item) for item in filters]
+        data = stream.data
+        if filters and filters != [b'/FlateDecode']:
+            raise PdfMergeError(f"Unsupported stream filter in {self.path.name}: {filters}")
+        if filters:
+            data = zlib.decompress(data)
+        parms = self.resolve(stream.dict.get(b'/DecodeParms')) or {}
+        if isinstance(parms, list):
+            parms = parms[0] or {}
+        predictor = int(parms.get(b'/Predictor', 1))
+        if predictor >= 10:
+            data = _png_unpredict(data, int(parms.get(b'/Columns', 1)))
+        return data
+
+    def _read_indirect(self, pos):
+        """Parse "N G obj ... endobj" at `pos`; returns (object number, value)."""
+        parser = self._parser
+        num, pos = parser.parse(pos)
+        _, pos = parser.parse(pos)
+        keyword_start = parser.skip_whitespace(pos)
+        if self._data[keyword_start:keyword_start + 3] != b'obj':
+            raise PdfMergeError(f"Object expected at offset {keyword_start} in {self.path.name}")
+        value, pos = parser.parse(keyword_start + 3)
+        pos = parser.skip_whitespace(pos)
+        if isinstance(value, dict) and self._data[pos:pos + 6] == b'stream':
+            pos += 6
+            if self._data[pos:pos + 2] == b'\r\n':
+                pos += 2
+            elif self._data[pos:pos + 1] in (b'\n', b'\r'):
+                pos += 1
+            length = self.resolve(value.get(b'/Length'))
+            end = pos + int(length) if length is not None else -1
+            after = parser.skip_whitespace(end) if end >= 0 else -1
+            if end < 0 or self._data[after:after + 9] != b'endstream':
+                # Missing or wrong /Length: fall back to the endstream keyword
+                end = self._data.find(b'endstream', pos)
+                while end > pos and self._data[end - 1] in b'\r\n':
+                    end -= 1
+            value = Stream(value, self._data[pos:end])
+        return int(num), value
+
+    def read(self, num):
+        """
+        Parse object `num`.
+
+        Returns:
+            The object's value, or None if it does not exist
+        """
+        location = self.xref.get(num)
+        if location is None:
+            return None
+        if location[0] == 1:
+            return self._read_indirect(location[1])[1]
+        return self._read_compressed(location[1], location[2], num)
+
+    def _read_compressed(self, stream_num, index, num):
+        objects = self._object_streams.get(stream_num)
+        if objects is None:
+            # Keep only the most recent object stream decoded
+            stream = self.read(stream_num)
+            data = self._decode(stream)
+            first = int(stream.dict[b'/First'])
+            header = data[:first].split()
+            offsets = {int(header[i]): first + int(header[i + 1]) for i in range(0, len(header), 2)}
+            self._object_streams = {stream_num: (data, offsets)}
+            objects = self._object_streams[stream_num]
+        data, offsets = objects
+        if num not in offsets:
+            return None
+        return _Parser(data).parse(offsets[num])[0]
+
+    def resolve(self, value):
+        """Follow a reference to its object; other values are returned as they are."""
+        seen = set()
+        while isinstance(value, Ref) and value.num not in seen:
+            seen.add(value.num)
+            value = self.read(value.num)
+        return value
+
+    def object_numbers(self):
+        return sorted(self.xref)
+
+
+class _Part:
+    """One input PDF and what the merge needs to know about it."""
+
+    def __init__(self, reader, offset):
+        self.reader = reader
+        self.offset = offset
+        root_ref = reader.trailer.get(b'/Root')
+        self.catalog = reader.resolve(root_ref) or {}
+        self.skip = set()
+        if isinstance(root_ref, Ref):
+            self.skip.add(root_ref.num)
+        self.pages = []
+        self.inherited = {}
+        self._walk_pages(self.catalog.get(b'/Pages'), {})
+        self.outline_items = []
+        self.outline_count = 0
+        self._read_outline()
+        self.named_dests = []
+        self._read_named_dests()
+        for num in reader.object_numbers():
+            location = reader.xref[num]
+            if location[0] == 1:
+                value = reader.read(num)
+                if isinstance(value, Stream) and value.dict.get(b'/Type') in (b'/XRef', b'/ObjStm'):
+                    self.skip.add(num)
+
+    def _walk_pages(self, node_ref, inherited):
+        node = self.reader.resolve(node_ref)
+        if not isinstance(node, dict):
+            return
+        if node.get(b'/Type') == b'/Pages' or b'/Kids' in node:
+            if isinstance(node_ref, Ref):
+                self.skip.add(node_ref.num)
+            inherited = dict(inherited)
+            for key in _INHERITABLE:
+                if key in node:
+                    inherited[key] = node[key]
+            for kid in self.reader.resolve(node.get(b'/Kids')) or []:
+                self._walk_pages(kid, inherited)
+        elif isinstance(node_ref, Ref):
+            self.pages.append(node_ref.num)
+            self.inherited[node_ref.num] = inherited
+
+    def _read_outline(self):
+        outlines_ref = self.catalog.get(b'/Outlines')
+        outlines = self.reader.resolve(outlines_ref)
+        if not isinstance(outlines, dict):
+            return
+        if isinstance(outlines_ref, Ref):
+            self.skip.add(outlines_ref.num)
+        item = outlines.get(b'/First')
+        seen = set()
+        while isinstance(item, Ref) and item.num not in seen:
+            seen.add(item.num)
+            self.outline_items.append(item.num)
+            item = (self.reader.read(item.num) or {}).get(b'/Next')
+        count = outlines.get(b'/Count')
+        self.outline_count = abs(int(count)) if count is not None else len(self.outline_items)
+
+    def _read_named_dests(self):
+        names = self.reader.resolve(self.catalog.get(b'/Names'))
+        if isinstance(names, dict):
+            if isinstance(self.catalog.get(b'/Names'), Ref):
+                self.skip.add(self.catalog[b'/Names'].num)
+            self._walk_name_tree(names.get(b'/Dests'))
+        # PDF 1.1 style: a dictionary of name -> destination
+        old_style = self.reader.resolve(self.catalog.get(b'/Dests'))
+        if isinstance(old_style, dict):
+            for name, dest in old_style.items():
+                self.named_dests.append((b'(' + _escape(name[1:]) + b')', dest))
+
+    def _walk_name_tree(self, node_ref, depth=0):
+        node = self.reader.resolve(node_ref)
+        if not isinstance(node, dict) or depth > 32:
+            return
+        if isinstance(node_ref, Ref):
+            self.skip.add(node_ref.num)
+        names = self.reader.resolve(node.get(b'/Names')) or []
+        for name, dest in zip(names[0::2], names[1::2]):
+            self.named_dests.append((name, dest))
+        for kid in self.reader.resolve(node.get(b'/Kids')) or []:
+            self._walk_name_tree(kid, depth + 1)
+
+
+def _escape(data):
+    return data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def _name_key(token):
+    """Sort key for a PDF string token, so the merged name tree is in order."""
+    if token.startswith(b'<'):
+        return bytes.fromhex(token[1:-1].decode('ascii'))
+    return bytes(token[1:-1])
+
+
+class _Writer:
+    """Writes numbered objects to a file, remembering their offsets."""
+
+    def __init__(self, f):
+        self.f = f
+        self.position = 0
+        self.offsets = {}
+
+    def write(self, data):
+        self.f.write(data)
+        self.position += len(data)
+
+    def write_object(self, num, value):
+        self.offsets[num] = self.position
+        if isinstance(value, Stream):
+            fields = dict(value.dict)
+            fields[b'/Length'] = len(value.data)
+            self.write(b'%d 0 obj\n' % num + serialize(fields) + b'\nstream\n')
+            self.write(value.data)
+            self.write(b'\nendstream\nendobj\n')
+        else:
+            self.write(b'%d 0 obj\n' % num + serialize(value) + b'\nendobj\n')
+
+
+# Object numbers of the merged PDF's own catalog, page tree, outline and name tree
+_CATALOG, _PAGES, _OUTLINES, _DESTS = 1, 2, 3, 4
+_FIRST_FREE = 5
+
+
+def _write_merged(f, parts, first_free):
+    """Write the merged PDF of `parts` to the open file `f`; returns its page count."""
+    # Top-level bookmarks of all parts, chained in order under one outline root
+    outline_chain = [part.offset + num for part in parts for num in part.outline_items]
+    outline_links = {}
+    for i, num in enumerate(outline_chain):
+        outline_links[num] = (outline_chain[i - 1] if i else None,
+                              outline_chain[i + 1] if i + 1 < len(outline_chain) else None)
+
+    writer = _Writer(f)
+    writer.write(b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n')
+    kids = []
+    for part in parts:
+        for num in part.reader.object_numbers():
+            if num in part.skip:
+                continue
+            value = part.reader.read(num)
+            if value is None:
+                continue
+            new_num = part.offset + num
+            if isinstance(value, Stream):
+                value = Stream(_renumber(value.dict, part.offset), value.data)
+            else:
+                value = _renumber(value, part.offset)
+
+            if num in part.inherited and isinstance(value, dict):
+                for key, inherited in part.inherited[num].items():
+                    value.setdefault(key, _renumber(inherited, part.offset))
+                value[b'/Parent'] = Ref(_PAGES)
+            if new_num in outline_links and isinstance(value, dict):
+                previous, following = outline_links[new_num]
+                value[b'/Parent'] = Ref(_OUTLINES)
+                value.pop(b'/Prev', None)
+                value.pop(b'/Next', None)
+                if previous is not None:
+                    value[b'/Prev'] = Ref(previous)
+                if following is not None:
+                    value[b'/Next'] = Ref(following)
+            writer.write_object(new_num, value)
+        kids.extend(Ref(part.offset + num) for num in part.pages)
+
+    writer.write_object(_PAGES, {b'/Type': Token(b'/Pages'), b'/Kids': kids, b'/Count': len(kids)})
+
+    catalog = {b'/Type': Token(b'/Catalog'), b'/Pages': Ref(_PAGES)}
+    first = parts[0] if parts else None
+    if first is not None:
+        for key in _CATALOG_KEEP:
+            if key in first.catalog:
+                catalog[key] = _renumber(first.catalog[key], first.offset)
+
+    if outline_chain:
+        writer.write_object(_OUTLINES, {
+            b'/Type': Token(b'/Outlines'),
+            b'/First': Ref(outline_chain[0]),
+            b'/Last': Ref(outline_chain[-1]),
+            b'/Count': sum(part.outline_count for part in parts),
+        })
+        catalog[b'/Outlines'] = Ref(_OUTLINES)
+        catalog[b'/PageMode'] = Token(b'/UseOutlines')
+
+    named = {}
+    for part in parts:
+        for name, dest in part.named_dests:
+            named.setdefault(_name_key(name), (name, _renumber(dest, part.offset)))
+    if named:
+        entries = []
+        for key in sorted(named):
+            entries.extend(named[key])
+        writer.write_object(_DESTS, {b'/Names': entries})
+        catalog[b'/Names'] = {b'/Dests': Ref(_DESTS)}
+
+    writer.write_object(_CATALOG, catalog)
+
+    size = max([first_free] + [num + 1 for num in writer.offsets])
+    xref_offset = writer.position
+    writer.write(b'xref\n0 %d\n0000000000 65535 f \n' % size)
+    for num in range(1, size):
+        if num in writer.offsets:
+            writer.write(b'%010d 00000 n \n' % writer.offsets[num])
+        else:
+            writer.write(b'0000000000 00000 f \n')
+    trailer = {b'/Size': size, b'/Root': Ref(_CATALOG)}
+    if first is not None and isinstance(first.reader.trailer.get(b'/Info'), Ref):
+        trailer[b'/Info'] = Ref(first.reader.trailer[b'/Info'].num + first.offset)
+    file_id = Token(b'<' + os.urandom(16).hex().encode('ascii') + b'>')
+    trailer[b'/ID'] = [file_id, file_id]
+    writer.write(b'trailer\n' + serialize(trailer) + b'\nstartxref\n%d\n%%%%EOF\n' % xref_offset)
+    return len(kids)
+
+
+def merge_pdfs(input_files, output_file):
+    """
+    Merge PDFs into one, in order.
+
+    Pages, bookmarks and named destinations of every input are kept; the
+    document properties (title, author, XMP metadata, language) come from the
+    first input.
+
+    Args:
+        input_files (list): PDF files to merge
+        output_file (Path): Merged PDF to write
+
+    Returns:
+        int: Number of pages in the merged PDF
+
+    Raises:
+        PdfMergeError: If an input cannot be read
+        OSError: If the merged PDF cannot be written (no partial file is left)
+    """
+    output_file = Path(output_file)
+    readers = []
+    try:
+        parts = []
+        offset = _FIRST_FREE
+        for input_file in input_files:
+            reader = PdfReader(input_file)
+            readers.append(reader)
+            try:
+                parts.append(_Part(reader, offset))
+            except _READ_ERRORS as e:
+                raise PdfMergeError(f"Cannot read {Path(input_file).name}: {e}") from e
+            offset += reader.size
+
+        temp_file = output_file.with_name(output_file.name + '.merging')
+        try:
+            with open(temp_file, 'wb') as f:
+                page_count = _write_merged(f, parts, offset)
+            os.replace(temp_file, output_file)
+        except BaseException as e:
+            try:
+                os.unlink(temp_file)
+            except FileNotFoundError:
+                pass
+            if isinstance(e, _READ_ERRORS):
+                raise PdfMergeError(f"Cannot merge into {output_file.name}: {e}") from e
+            raise
+        return page_count
+    finally:
+        for reader in readers:
+            reader.close()
@@ -0,0 +1,247 @@
+"""
+Split Export
+Exports very long documents in page ranges on several Word instances at once,
+then merges the ranges into one PDF.
+
+A single ExportAsFixedFormat call lays out and renders the whole document on
+one core, so a 500+ page manual can take minutes while the rest of the
+machine sits idle. In split mode the document's pages are divided into
+ranges; the Word session converting the document exports the first range
+(wdExportFromTo) while helper Word instances open the same document
+read-only and export the others. The range PDFs are then stitched together
+with pdf_merge, keeping the heading bookmarks and document properties.
+
+Limitations: the tagged-PDF structure tree is not kept (range exports are
+written without it), and a heading whose sub-headings fall in a later range
+shows those sub-headings at the top level of the bookmarks.
+"""
+
+import threading
+from contextlib import nullcontext
+from functools import partial
+from pathlib import Path
+from conversion_trace import span
+from word_pool import WordWarmer, DEFAULT_IDLE_TIMEOUT
+
+
+WD_EXPORT_FROM_TO = 3  # wdExportFromTo
+
+# Documents with at least this many pages are split (0 = never split)
+DEFAULT_SPLIT_PAGES = 0
+SUGGESTED_SPLIT_PAGES = 300
+
+# Number of page ranges (and so Word instances) per split document
+DEFAULT_SPLIT_PARTS = 4
+
+
+def page_ranges(page_count, parts):
+    """
+    Divide pages 1..page_count into `parts` contiguous ranges of near-equal size.
+
+    Returns:
+        list: (first_page, last_page) tuples, 1-based and inclusive
+    """
+    parts = max(1, min(parts, page_count))
+    ranges = []
+    first = 1
+    for part in range(parts):
+        size = page_count // parts + (1 if part < page_count % parts else 0)
+        ranges.append((first, first + size - 1))
+        first += size
+    return ranges
+
+
+def part_options(export_options, first_page, last_page):
+    """Export options for one page range of a split document."""
+    options = dict(export_options)
+    options['Range'] = WD_EXPORT_FROM_TO
+    options['From'] = first_page
+    options['To'] = last_page
+    # Structure trees of separate exports cannot be combined, and skipping
+    # them makes each range export faster
+    options['DocStructureTags'] = False
+    return options
+
+
+class SplitExporter:
+    """
+    Exports documents with at least `min_pages` pages in parallel page ranges.
+
+    Helper Word instances are started on first use and kept warm for the
+    next long document; each quits after `idle_timeout` idle seconds.
+    Shorter documents are exported in one piece on the calling session.
+
+    Args:
+        backend_factory (callable): Backend factory for the helper instances
+        min_pages (int): Split documents with at least this many pages (0 = never)
+        parts (int): Page ranges per split document, including the one
+            exported on the calling session
+        watchdog (Watchdog, optional): Applies the document's time limit to
+            each helper's range export
+        idle_timeout (float): Quit idle helper instances after this many seconds
+    """
+
+    def __init__(self, backend_factory, min_pages=DEFAULT_SPLIT_PAGES, parts=DEFAULT_SPLIT_PARTS,
+                 watchdog=None, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.backend_factory = backend_factory
+        self.min_pages = min_pages
+        self.parts = parts
+        self.watchdog = watchdog
+        self.idle_timeout = idle_timeout
+        self.documents_split = 0
+        self._helpers = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _get_helpers(self, count):
+        with self._lock:
+            while len(self._helpers) < count:
+                self._helpers.append(WordWarmer(self.backend_factory, idle_timeout=self.idle_timeout,
+                                                name=f'split-{len(self._helpers) + 1}'))
+            return self._helpers[:count]
+
+    def convert(self, session, input_file, output_file, export_options):
+        """
+        Open, export (split if long enough) and close one document on `session`.
+        Same arguments as ConversionBackend.convert().
+        """
+        session.convert(input_file, output_file, export_options,
+                        export=partial(self.export, session, input_file))
+
+    def export(self, session, input_file, document, output_file, export_options):
+        """
+        Export an opened document, in parallel page ranges if it is long enough.
+
+        Args:
+            session (ConversionBackend): Session that opened the document
+            input_file (Path): The document's file, opened again by the helpers
+            document: Handle returned by session.open()
+            output_file (Path): PDF to write
+            export_options (dict): Export options for the whole document
+
+        Returns:
+            int: Number of page ranges the document was exported in (1 if not split)
+        """
+        page_count = None
+        if self.min_pages and self.parts > 1:
+            with span('count pages', file=Path(input_file).name):
+                page_count = session.page_count(document)
+        if not page_count or page_count < self.min_pages:
+            session.export(document, output_file, export_options)
+            return 1
+
+        import shutil
+        import tempfile
+        from pdf_merge import merge_pdfs
+
+        output_file = Path(output_file)
+        ranges = page_ranges(page_count, self.parts)
+        print(f"Splitting {page_count} pages into {len(ranges)} ranges on {len(ranges)} Word instances...")
+        temp_dir = Path(tempfile.mkdtemp(prefix='.split-', dir=str(output_file.parent)))
+        part_files = [temp_dir / f"part{i + 1:02d}.pdf" for i in range(len(ranges))]
+        cancelled = threading.Event()
+        helper_sessions = []
+        try:
+            with span('split export', file=Path(input_file).name, pages=page_count, parts=len(ranges)):
+                futures = [
+                    helper.submit(partial(self._export_part, input_file, part_file,
+                                          part_options(export_options, first, last),
+                                          cancelled, helper_sessions))
+                    for helper, part_file, (first, last)
+                    in zip(self._get_helpers(len(ranges) - 1), part_files[1:], ranges[1:])
+                ]
+                try:
+                    first, last = ranges[0]
+                    with span('export range', pages=f"{first}-{last}"):
+                        session.export(document, part_files[0], part_options(export_options, first, last))
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    # One range failed: no point finishing the others
+                    self._cancel(futures, cancelled, helper_sessions)
+                    raise
+
+            with span('merge', file=output_file.name, parts=len(ranges)):
+                merge_pdfs(part_files, output_file)
+            self.documents_split += 1
+            return len(ranges)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _export_part(self, input_file, part_file, options, cancelled, helper_sessions, pool):
+        """Export one page range on a helper's warm session (runs on the helper thread)."""
+        session = pool.acquire()
+        with self._lock:
+            if cancelled.is_set():
+                pool.release(session)
+                raise RuntimeError("Split export cancelled")
+            helper_sessions.append(session)
+        try:
+            time_limit = (self.watchdog.guard(session, input_file) if self.watchdog is not None
+                          else nullcontext())
+            with time_limit, span('export range', pages=f"{options['From']}-{options['To']}"):
+                session.convert(input_file, part_file, options)
+        except Exception:
+            self._finished(session, cancelled, helper_sessions)
+            pool.release(session, failed=True)
+            raise
+        # A session killed by a cancel just as it finished must not be reused
+        pool.release(session, failed=self._finished(session, cancelled, helper_sessions))
+
+    def _finished(self, session, cancelled, helper_sessions):
+        """Deregister a helper session; returns True if the document was cancelled meanwhile."""
+        with self._lock:
+            helper_sessions.remove(session)
+            return cancelled.is_set()
+
+    def _cancel(self, futures, cancelled, helper_sessions):
+        """Stop the helpers' range exports of a document whose export failed."""
+        with self._lock:
+            cancelled.set()
+            # Only sessions still exporting this document; idle ones stay warm
+            for session in helper_sessions:
+                session.kill()
+        for future in futures:
+            future.cancel()
+        for future in futures:
+            try:
+                future.result()
+            except BaseException:
+                pass
+
+    def close(self):
+        """Quit the helper Word instances."""
+        with self._lock:
+            helpers, self._helpers = self._helpers, []
+        for helper in helpers:
+            helper.close()
+
+
+def split_exporter(backend_factory, min_pages, parts=DEFAULT_SPLIT_PARTS, watchdog=None):
+    """
+    A SplitExporter for the given settings, or None if split mode is off or
+    the backend cannot run several instances side by side.
+    """
+    if not min_pages or parts < 2:
+        return None
+    backend_class = getattr(backend_factory, 'backend_class', None)
+    if backend_class is not None and not backend_class.supports_parallel:
+        print(f"⚠ The {backend_class.name} backend cannot run in parallel; documents will not be split")
+        return None
+    return SplitExporter(backend_factory, min_pages, parts, watchdog=watchdog)
+
+
+def add_split_arguments(parser):
+    """Add the split-export options to an argparse parser."""
+    parser.add_argument('--split-pages', type=int, default=DEFAULT_SPLIT_PAGES, metavar='N',
+                        help='Export documents of N or more pages in parallel page ranges on several '
+                             f'Word instances and merge the results, e.g. {SUGGESTED_SPLIT_PAGES}; '
+                             f'0 = never (default: {DEFAULT_SPLIT_PAGES})')
+    parser.add_argument('--split-parts', type=int, default=DEFAULT_SPLIT_PARTS, metavar='K',
+                        help=f'Page ranges (Word instances) per split document (default: {DEFAULT_SPLIT_PARTS})')
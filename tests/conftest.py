@@ -0,0 +1,55 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The modules live at the top of the repository, not in a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import conversion_backends  # noqa: E402
+
+WD_STATISTIC_PAGES = 2
+
+
+# Stand-ins for the parts of Word's COM object model the backend uses
+class StubDocument:
+    def __init__(self, pages=40):
+        self.pages = pages
+        self.exports = []
+        self.closed_with = None
+
+    def ExportAsFixedFormat(self, **kwargs):
+        self.exports.append(kwargs)
+
+    def ComputeStatistics(self, statistic):
+        assert statistic == WD_STATISTIC_PAGES
+        return self.pages
+
+    def Close(self, **kwargs):
+        self.closed_with = kwargs
+
+
+class StubDocuments:
+    def __init__(self):
+        self.opened = []
+
+    def Open(self, path, **kwargs):
+        document = StubDocument()
+        self.opened.append((path, kwargs, document))
+        return document
+
+
+class StubWord:
+    def __init__(self):
+        self.Documents = StubDocuments()
+        self.quit = False
+
+    def Quit(self):
+        self.quit = True
+
+
+@pytest.fixture
+def word(monkeypatch):
+    app = StubWord()
+    monkeypatch.setattr(conversion_backends, '_default_dispatch', lambda: app)
+    return app
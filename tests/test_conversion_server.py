@@ -0,0 +1,134 @@
+import http.client
+import json
+import threading
+import time
+import zipfile
+
+import pytest
+
+from conversion_backends import get_backend_factory
+from conversion_http import ConversionHTTPServer
+from conversion_server import ConversionService
+from export_profiles import export_options, DEFAULT_PROFILE
+
+FAKE_OPTIONS = {'launch_latency': 0, 'open_latency': 0, 'export_latency': 0,
+                'close_latency': 0, 'teardown_latency': 0}
+OPTIONS = export_options(DEFAULT_PROFILE)
+
+
+def _export(session, input_file, output_file):
+    session.convert(input_file, output_file, OPTIONS)
+
+
+def _docx_bytes(tmp_path, pages=3):
+    path = tmp_path / 'upload.docx'
+    with zipfile.ZipFile(path, 'w') as docx:
+        docx.writestr('docProps/app.xml', f'<Properties><Pages>{pages}</Pages></Properties>')
+    return path.read_bytes()
+
+
+class Server:
+    """A conversion server on a free local port, using the fake backend."""
+
+    def __init__(self, tmp_path, export=_export, **options):
+        self.service = ConversionService(export, get_backend_factory('fake', FAKE_OPTIONS),
+                                         work_dir=tmp_path / 'jobs', **options)
+        self.httpd = ConversionHTTPServer(('127.0.0.1', 0), self.service)
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, kwargs={'poll_interval': 0.05},
+                                       daemon=True)
+        self.thread.start()
+
+    def request(self, method, path, body=None):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=10)
+        try:
+            connection.request(method, path, body=body)
+            response = connection.getresponse()
+            return response.status, dict(response.getheaders()), response.read()
+        finally:
+            connection.close()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.service.close()
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = Server(tmp_path)
+    yield server
+    server.close()
+
+
+def test_sync_convert_returns_pdf(tmp_path, server):
+    status, headers, body = server.request('POST', '/convert?filename=report.docx', _docx_bytes(tmp_path))
+
+    assert status == 200
+    assert headers['Content-Type'] == 'application/pdf'
+    assert 'filename="report.pdf"' in headers['Content-Disposition']
+    assert body.startswith(b'%PDF')
+    assert int(headers['Content-Length']) == len(body)
+    # Synchronous jobs are discarded once the PDF is sent
+    assert server.request('GET', f"/jobs/{headers['X-Job-Id']}")[0] == 404
+
+
+def test_async_convert_poll_download_delete(tmp_path, server):
+    status, headers, body = server.request('POST', '/convert?filename=report.docx&async=1',
+                                           _docx_bytes(tmp_path))
+    assert status == 202
+    job = json.loads(body)
+    assert headers['Location'] == job['status_url'] == f"/jobs/{job['id']}"
+
+    deadline = time.monotonic() + 10
+    while True:
+        status, _, body = server.request('GET', job['status_url'])
+        assert status == 200
+        state = json.loads(body)
+        if state['status'] == 'done' or time.monotonic() > deadline:
+            break
+        assert state['status'] in ('queued', 'converting')
+        time.sleep(0.02)
+    assert state['status'] == 'done'
+    assert state['filename'] == 'report.docx'
+
+    status, headers, body = server.request('GET', job['pdf_url'])
+    assert status == 200
+    assert headers['Content-Type'] == 'application/pdf'
+    assert body.startswith(b'%PDF')
+
+    status, _, body = server.request('DELETE', job['status_url'])
+    assert status == 200
+    assert json.loads(body) == {'id': job['id'], 'deleted': True}
+    assert server.request('GET', job['status_url'])[0] == 404
+    assert server.request('GET', job['pdf_url'])[0] == 404
+
+
+def test_full_queue_answers_429(tmp_path):
+    release = threading.Event()
+
+    def blocking_export(session, input_file, output_file):
+        release.wait(10)
+        _export(session, input_file, output_file)
+
+    server = Server(tmp_path, export=blocking_export, workers=1, queue_size=1)
+    try:
+        upload = _docx_bytes(tmp_path)
+        status, _, body = server.request('POST', '/convert?filename=a.docx&async=1', upload)
+        assert status == 202
+        first = json.loads(body)
+        deadline = time.monotonic() + 10
+        while json.loads(server.request('GET', first['status_url'])[2])['status'] != 'converting':
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+
+        # The worker is busy and the one queue slot is taken
+        assert server.request('POST', '/convert?filename=b.docx&async=1', upload)[0] == 202
+        status, headers, body = server.request('POST', '/convert?filename=c.docx&async=1', upload)
+        assert status == 429
+        assert headers['Retry-After'] == '1'
+        assert json.loads(body) == {'error': 'Conversion queue is full'}
+        assert server.service.health()['jobs']['converting'] == 1
+    finally:
+        release.set()
+        server.close()
@@ -0,0 +1,130 @@
+import errno
+import zipfile
+
+import pytest
+
+import pdf_merge
+from conversion_backends import FakeBackend
+from export_profiles import export_options, DEFAULT_PROFILE
+from pdf_merge import PdfMergeError, PdfReader, merge_pdfs
+from split_export import page_ranges, part_options
+
+PAGES = 25
+
+
+def _make_docx(path, pages):
+    with zipfile.ZipFile(path, 'w') as docx:
+        docx.writestr('docProps/app.xml', f'<Properties><Pages>{pages}</Pages></Properties>')
+    return path
+
+
+def _export_parts(tmp_path, parts=3):
+    document = _make_docx(tmp_path / 'Report.docx', PAGES)
+    backend = FakeBackend(launch_latency=0, open_latency=0, export_latency=0,
+                          close_latency=0, teardown_latency=0)
+    backend.launch()
+    files = []
+    try:
+        options = export_options(DEFAULT_PROFILE)
+        for i, (first, last) in enumerate(page_ranges(PAGES, parts)):
+            part = tmp_path / f'part{i}.pdf'
+            backend.convert(document, part, part_options(options, first, last))
+            files.append(part)
+    finally:
+        backend.teardown()
+    return files
+
+
+def _outline_titles(reader, catalog):
+    outlines = reader.resolve(catalog[b'/Outlines'])
+    titles = []
+    item = outlines.get(b'/First')
+    while item is not None:
+        entry = reader.resolve(item)
+        titles.append(entry[b'/Title'])
+        item = entry.get(b'/Next')
+    return titles
+
+
+def test_merge_range_exports(tmp_path):
+    parts = _export_parts(tmp_path)
+    output = tmp_path / 'merged.pdf'
+
+    assert merge_pdfs(parts, output) == PAGES
+
+    with PdfReader(output) as reader:
+        catalog = reader.resolve(reader.trailer[b'/Root'])
+        pages = reader.resolve(catalog[b'/Pages'])
+        assert int(pages[b'/Count']) == PAGES
+        assert len(reader.resolve(pages[b'/Kids'])) == PAGES
+        assert _outline_titles(reader, catalog) == [b'(Section 1)', b'(Section 2)', b'(Section 3)']
+        info = reader.resolve(reader.trailer[b'/Info'])
+        assert info[b'/Title'] == b'(Report)'
+
+
+def test_merge_leaves_no_output_on_truncated_part(tmp_path):
+    parts = _export_parts(tmp_path)
+    data = parts[1].read_bytes()
+    parts[1].write_bytes(data[:len(data) // 2])
+    output = tmp_path / 'merged.pdf'
+
+    with pytest.raises(PdfMergeError, match='part1.pdf'):
+        merge_pdfs(parts, output)
+    assert not output.exists()
+
+
+@pytest.mark.parametrize('content', [
+    b'',
+    b'not a pdf at all',
+    b'%PDF-1.4\nstartxref\n99999\n%%EOF\n',
+])
+def test_merge_rejects_unreadable_input(tmp_path, content):
+    bad = tmp_path / 'bad.pdf'
+    bad.write_bytes(content)
+
+    with pytest.raises(PdfMergeError):
+        merge_pdfs([bad], tmp_path / 'merged.pdf')
+
+
+def test_merge_rejects_malformed_page_tree(tmp_path):
+    parts = _export_parts(tmp_path)
+    data = parts[0].read_bytes()
+    parts[0].write_bytes(data.replace(b'/Kids [', b'/Kids <<', 1))
+
+    with pytest.raises(PdfMergeError):
+        merge_pdfs(parts, tmp_path / 'merged.pdf')
+
+
+def test_merge_removes_temp_file_when_writing_fails(tmp_path, monkeypatch):
+    parts = _export_parts(tmp_path)
+    output = tmp_path / 'merged.pdf'
+    writes = []
+
+    def write(self, data):
+        writes.append(data)
+        if len(writes) > 3:
+            raise OSError(errno.ENOSPC, 'No space left on device')
+        self.f.write(data)
+
+    monkeypatch.setattr(pdf_merge._Writer, 'write', write)
+
+    with pytest.raises(OSError):
+        merge_pdfs(parts, output)
+    assert not output.exists()
+    assert list(tmp_path.glob('*.merging')) == []
+
+
+def test_merge_reports_malformed_object_while_writing(tmp_path, monkeypatch):
+    parts = _export_parts(tmp_path)
+    output = tmp_path / 'merged.pdf'
+
+    def renumber(value, offset):
+        raise TypeError('unexpected object')
+
+    # Objects are only renumbered once the merged file is being written
+    monkeypatch.setattr(pdf_merge, '_renumber', renumber)
+
+    with pytest.raises(PdfMergeError, match='merged.pdf'):
+        merge_pdfs(parts, output)
+    assert not output.exists()
+    assert list(tmp_path.glob('*.merging')) == []
@@ -0,0 +1,68 @@
+import pytest
+
+from conversion_backends import WordCOMBackend
+from export_profiles import export_options, DEFAULT_PROFILE
+from split_export import WD_EXPORT_FROM_TO, part_options
+
+WD_EXPORT_FORMAT_PDF = 17
+WD_EXPORT_ALL_DOCUMENT = 0
+
+
+@pytest.fixture
+def session(word):
+    backend = WordCOMBackend()
+    backend.launch()
+    yield backend
+    backend.teardown()
+
+
+def test_launch_configures_hidden_word(word, session):
+    assert session.word is word
+    assert word.Visible is False
+    assert word.DisplayAlerts == 0
+
+
+def test_convert_exports_whole_document(tmp_path, word, session):
+    input_file = tmp_path / 'Report.docx'
+    output_file = tmp_path / 'Report.pdf'
+
+    session.convert(input_file, output_file, export_options(DEFAULT_PROFILE))
+
+    [(path, open_kwargs, document)] = word.Documents.opened
+    assert path == str(input_file)
+    assert open_kwargs == {'ReadOnly': True}
+    [kwargs] = document.exports
+    assert kwargs['OutputFileName'] == str(output_file)
+    assert kwargs['ExportFormat'] == WD_EXPORT_FORMAT_PDF
+    assert kwargs['Range'] == WD_EXPORT_ALL_DOCUMENT
+    assert kwargs == {'OutputFileName': str(output_file), **export_options(DEFAULT_PROFILE)}
+    assert document.closed_with == {'SaveChanges': False}
+
+
+def test_convert_exports_page_range(tmp_path, word, session):
+    output_file = tmp_path / 'part02.pdf'
+
+    session.convert(tmp_path / 'Manual.docx', output_file,
+                    part_options(export_options(DEFAULT_PROFILE), 11, 20))
+
+    [(_, _, document)] = word.Documents.opened
+    [kwargs] = document.exports
+    assert kwargs['OutputFileName'] == str(output_file)
+    assert kwargs['Range'] == WD_EXPORT_FROM_TO
+    assert kwargs['From'] == 11
+    assert kwargs['To'] == 20
+    assert kwargs['DocStructureTags'] is False
+    assert kwargs['ExportFormat'] == WD_EXPORT_FORMAT_PDF
+
+
+def test_page_count_uses_word_statistics(tmp_path, session):
+    document = session.open(tmp_path / 'Manual.docx')
+    assert session.page_count(document) == 40
+
+
+def test_teardown_quits_word(word):
+    backend = WordCOMBackend()
+    backend.launch()
+    backend.teardown()
+    assert word.quit
+    assert backend.word is None
@@ -0,0 +1,88 @@
+import zipfile
+
+import pytest
+
+from conversion_backends import WordCOMBackend, get_backend_factory
+from word_pool import WordPool
+
+FAKE_OPTIONS = {'launch_latency': 0, 'open_latency': 0, 'export_latency': 0,
+                'close_latency': 0, 'teardown_latency': 0}
+
+
+@pytest.fixture
+def document(tmp_path):
+    path = tmp_path / 'Report.docx'
+    with zipfile.ZipFile(path, 'w') as docx:
+        docx.writestr('docProps/app.xml', '<Properties><Pages>3</Pages></Properties>')
+    return path
+
+
+def _pool(**options):
+    backend_options = dict(FAKE_OPTIONS, **options.pop('backend_options', {}))
+    return WordPool(backend_factory=get_backend_factory('fake', backend_options), **options)
+
+
+def _convert(pool, document, failed=False):
+    session = pool.acquire()
+    session.convert(document, document.with_suffix('.pdf'), {})
+    pool.release(session, failed=failed)
+    return session
+
+
+def test_session_is_reused(document):
+    with _pool() as pool:
+        first = _convert(pool, document)
+        second = _convert(pool, document)
+
+        assert second is first
+        assert first.is_running
+        assert pool.launches == 1
+        assert pool.recycles == 0
+
+
+def test_session_recycled_after_max_documents(document):
+    with _pool(max_documents=2) as pool:
+        first = _convert(pool, document)
+        assert _convert(pool, document) is first
+        assert not first.is_running
+        assert pool.session is None
+
+        assert _convert(pool, document) is not first
+        assert pool.launches == 2
+        assert pool.recycles == 1
+
+
+def test_session_recycled_above_max_memory(document):
+    backend_options = {'base_memory_mb': 100, 'memory_per_document_mb': 60}
+    with _pool(max_memory_mb=200, backend_options=backend_options) as pool:
+        first = _convert(pool, document)
+        assert first.is_running
+        _convert(pool, document)
+        assert not first.is_running
+
+        _convert(pool, document)
+        assert pool.launches == 2
+        assert pool.recycles == 1
+
+
+def test_session_torn_down_after_failure(document):
+    with _pool() as pool:
+        first = _convert(pool, document, failed=True)
+        assert not first.is_running
+        assert pool.session is None
+
+        assert _convert(pool, document) is not first
+        assert pool.launches == 2
+        assert pool.recycles == 1
+
+
+def test_close_quits_word(word, document):
+    pool = WordPool(backend_factory=WordCOMBackend)
+    session = pool.acquire()
+    session.convert(document, document.with_suffix('.pdf'), {})
+    pool.release(session)
+    assert not word.quit
+
+    pool.close()
+    assert word.quit
+    assert pool.session is None
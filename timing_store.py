@@ -0,0 +1,468 @@
+"""
+Timing Store
+Keeps a history of conversions in a local SQLite database (document size,
+page count, embedded media, backend, export profile, time per stage and
+outcome) and fits a duration model on it. Conversion time estimates and
+batch schedules use the model, and watchdog time limits are raised for
+documents it predicts to be slow, so predictions improve with every run
+instead of starting from the same rough guess.
+
+The history is only kept when asked for (--timings, or "timings" in the
+configuration file).
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from conversion_trace import take_stage_timings
+from conversion_watchdog import ConversionTimeout
+from docx_preflight import inspect_document
+
+
+DEFAULT_TIMINGS_PATH = Path.home() / '.word_to_pdf_timings.db'
+
+# Outcomes of a recorded conversion
+CONVERTED = 'converted'
+CACHED = 'cached'
+FAILED = 'failed'
+TIMED_OUT = 'timeout'
+
+# Stages that make up the time Word spends on a document. Starting Word and
+# waiting for it to quit are excluded, as they depend on pooling, not on the document.
+WORD_STAGES = ('open', 'export', 'close')
+
+# Recorded conversions needed before the fitted model replaces the
+# pre-flight heuristic, and how many of the most recent ones it is fitted on
+MIN_SAMPLES = 5
+HISTORY_LIMIT = 2000
+
+# Keeps the fit solvable when a measure never varies (e.g. no document has images)
+_RIDGE = 1e-6
+
+DEFAULT_STATS_DAYS = 14
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversions (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    input_path TEXT NOT NULL,
+    size_bytes INTEGER,
+    pages INTEGER,
+    words INTEGER,
+    media_bytes INTEGER,
+    content_bytes INTEGER,
+    tables INTEGER,
+    tracked_changes INTEGER,
+    backend TEXT NOT NULL,
+    export_profile TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    convert_seconds REAL,
+    stages TEXT,
+    outcome TEXT NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS conversions_model ON conversions (backend, export_profile, outcome, id);
+CREATE INDEX IF NOT EXISTS conversions_time ON conversions (finished_at);
+"""
+
+
+def _features(pages, media_bytes, content_bytes):
+    """Model inputs: constant, pages, MB of embedded media, MB of document XML."""
+    return (1.0, float(pages or 0), (media_bytes or 0) / (1024 * 1024), (content_bytes or 0) / (1024 * 1024))
+
+
+def _solve(matrix, vector):
+    """Solve matrix * x = vector by Gaussian elimination with partial pivoting."""
+    size = len(vector)
+    rows = [list(row) + [value] for row, value in zip(matrix, vector)]
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda row: abs(rows[row][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        if rows[col][col] == 0:
+            return None
+        for row in range(col + 1, size):
+            factor = rows[row][col] / rows[col][col]
+            for k in range(col, size + 1):
+                rows[row][k] -= factor * rows[col][k]
+    solution = [0.0] * size
+    for row in reversed(range(size)):
+        rest = sum(rows[row][k] * solution[k] for k in range(row + 1, size))
+        solution[row] = (rows[row][size] - rest) / rows[row][row]
+    return solution
+
+
+class DurationModel:
+    """
+    Predicts how long Word takes to open, export and close a document.
+
+    seconds = base + per page + per MB of embedded media + per MB of document
+    XML, fitted by least squares to recent successful conversions with the
+    same backend and export profile. A measure whose fitted cost comes out
+    negative is dropped. A document converted before with the same size is
+    predicted to take as long as it did last time. Until MIN_SAMPLES
+    conversions are recorded, the pre-flight heuristic is used instead.
+
+    Args:
+        history (iterable): (input_path, size_bytes, pages, media_bytes,
+            content_bytes, convert_seconds) of earlier conversions, oldest first
+    """
+
+    def __init__(self, history=()):
+        self.samples = 0
+        self.coefficients = None
+        self.typical_error = None
+        self._last = {}
+        self._fastest = 0.0
+        self._fit(list(history))
+
+    @property
+    def trained(self):
+        """True once enough conversions were recorded to use the fitted model."""
+        return self.coefficients is not None
+
+    def _fit(self, history):
+        points = []
+        for input_path, size, pages, media, content, seconds in history:
+            self._last[(input_path, size)] = seconds
+            points.append((_features(pages, media, content), seconds))
+        self.samples = len(points)
+        if self.samples < MIN_SAMPLES:
+            return
+
+        active = list(range(len(points[0][0])))
+        while True:
+            coefficients = self._least_squares(points, active)
+            if coefficients is None:
+                return
+            negative = [i for i in active[1:] if coefficients[i] < 0]
+            if not negative:
+                break
+            active = [i for i in active if i not in negative]
+        self.coefficients = coefficients
+        self._fastest = min(seconds for _, seconds in points)
+
+        errors = sorted(abs(self._fitted(x) - seconds) / seconds
+                        for x, seconds in points if seconds > 0)
+        if errors:
+            self.typical_error = errors[len(errors) // 2]
+
+    @staticmethod
+    def _least_squares(points, active):
+        """Coefficients minimizing the squared error, using only the `active` measures."""
+        count = len(active)
+        matrix = [[0.0] * count for _ in range(count)]
+        vector = [0.0] * count
+        for x, seconds in points:
+            for i, a in enumerate(active):
+                vector[i] += x[a] * seconds
+                for j, b in enumerate(active):
+                    matrix[i][j] += x[a] * x[b]
+        for i in range(1, count):
+            matrix[i][i] += _RIDGE * (matrix[i][i] or 1.0)
+        solution = _solve(matrix, vector)
+        if solution is None:
+            return None
+        coefficients = [0.0] * len(points[0][0])
+        for a, value in zip(active, solution):
+            coefficients[a] = value
+        return coefficients
+
+    def _fitted(self, features):
+        seconds = sum(c * x for c, x in zip(self.coefficients, features))
+        return max(seconds, self._fastest)
+
+    def predict(self, info, input_file=None):
+        """
+        Predicted conversion time of an inspected document.
+
+        Args:
+            info (DocumentInfo): Pre-flight inspection of the document
+            input_file (Path, optional): The document, to look up earlier
+                conversions of the same file
+
+        Returns:
+            float: Predicted seconds
+        """
+        if input_file is not None:
+            last = self._last.get((str(Path(input_file).resolve()), info.size_bytes))
+            if last is not None:
+                return last
+        if not self.trained:
+            return info.estimate_seconds()
+        return self._fitted(_features(info.pages, info.media_bytes, info.content_bytes))
+
+    def estimate(self, input_file):
+        """
+        Predicted conversion time of a document, from a quick inspection
+        (zip directory and saved page count only).
+
+        Args:
+            input_file (Path): Word document
+
+        Returns:
+            float: Predicted seconds
+        """
+        return self.predict(inspect_document(input_file, scan_body=False), input_file)
+
+    def describe(self):
+        """One-line description of the fitted model."""
+        if not self.trained:
+            return f"not trained yet ({self.samples} of {MIN_SAMPLES} conversions recorded)"
+        base, per_page, per_media_mb, per_content_mb = self.coefficients
+        error = f", typical error ±{self.typical_error:.0%}" if self.typical_error is not None else ""
+        return (f"{base:.2f}s + {per_page:.3f}s/page + {per_media_mb:.2f}s/MB of images + "
+                f"{per_content_mb:.2f}s/MB of text ({self.samples} conversions{error})")
+
+
+class TimingStore:
+    """
+    SQLite history of conversions, and duration models fitted on it.
+
+    Every record is committed straight away, so an interrupted batch keeps
+    what it learned. Safe to share between worker threads; several
+    processes (e.g. the GUI and a batch run) can use the same file.
+
+    Args:
+        path (str): Database file (created if missing)
+    """
+
+    def __init__(self, path=DEFAULT_TIMINGS_PATH):
+        self.path = Path(path)
+        self._connection = None
+        self._models = {}
+        self._warned = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open the database on first use (call with the lock held)."""
+        if self._connection is None:
+            import sqlite3
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def record(self, input_file, duration, error=None, backend='', export_profile=''):
+        """
+        Record one conversion. Must be called on the thread that converted the
+        document, right after it finished, to pick up its stage timings.
+        Usable as a BatchResult on_record callback with functools.partial.
+
+        Args:
+            input_file (Path): Converted document
+            duration (float): Seconds the whole document took
+            error (Exception, optional): Why the conversion failed
+            backend (str): Conversion backend name
+            export_profile (str): Export profile name
+        """
+        import sqlite3
+
+        stages = take_stage_timings()
+        stages.pop('document', None)
+        exported = 'export' in stages
+        if error is not None:
+            outcome = TIMED_OUT if isinstance(error, ConversionTimeout) else FAILED
+        else:
+            outcome = CONVERTED if exported else CACHED
+        convert_seconds = sum(stages.get(stage, 0.0) for stage in WORD_STAGES) if exported else None
+        try:
+            info = inspect_document(input_file)
+        except OSError:
+            info = None
+
+        row = (
+            time.time(), str(Path(input_file).resolve()),
+            info and info.size_bytes, info and info.pages, info and info.words,
+            info and info.media_bytes, info and info.content_bytes, info and info.tables,
+            info and int(info.tracked_changes), backend, export_profile, round(duration, 3),
+            convert_seconds if convert_seconds is None else round(convert_seconds, 3),
+            json.dumps({stage: round(seconds, 3) for stage, seconds in stages.items()}),
+            outcome, str(error)[:500] if error is not None else None,
+        )
+        with self._lock:
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "INSERT INTO conversions (finished_at, input_path, size_bytes, pages, words, "
+                        "media_bytes, content_bytes, tables, tracked_changes, backend, export_profile, "
+                        "seconds, convert_seconds, stages, outcome, error) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            except sqlite3.Error as e:
+                # Losing a timing is not worth failing a conversion over
+                if not self._warned:
+                    self._warned = True
+                    print(f"⚠ Could not record conversion timings in {self.path}: {e}")
+
+    @contextmanager
+    def timed(self, input_file, backend, export_profile):
+        """
+        Record the conversion done inside the block, whether it succeeds or
+        fails. Nothing is recorded if it is interrupted (e.g. with Ctrl+C).
+        """
+        take_stage_timings()
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.record(input_file, time.perf_counter() - start, e, backend, export_profile)
+            raise
+        self.record(input_file, time.perf_counter() - start, None, backend, export_profile)
+
+    def model(self, backend, export_profile):
+        """
+        Duration model fitted on the recent conversions with a backend and
+        export profile. Fitted once per store; later records are used by the next run.
+
+        Returns:
+            DurationModel: The model (untrained if there is too little history)
+        """
+        import sqlite3
+
+        key = (backend, export_profile)
+        with self._lock:
+            if key not in self._models:
+                try:
+                    rows = self._connect().execute(
+                        "SELECT input_path, size_bytes, pages, media_bytes, content_bytes, convert_seconds "
+                        "FROM conversions WHERE backend = ? AND export_profile = ? AND outcome = ? "
+                        "AND convert_seconds IS NOT NULL ORDER BY id DESC LIMIT ?",
+                        (backend, export_profile, CONVERTED, HISTORY_LIMIT)).fetchall()
+                except sqlite3.Error as e:
+                    print(f"⚠ Could not read conversion timings from {self.path}: {e}")
+                    rows = []
+                self._models[key] = DurationModel(reversed(rows))
+            return self._models[key]
+
+    def daily_stats(self, days=DEFAULT_STATS_DAYS):
+        """
+        Conversions per day, backend and export profile over the last `days` days.
+
+        Returns:
+            list: Dicts with day, backend, export_profile, documents, converted,
+                cached, failed, timed_out, seconds, pages and size_bytes (the
+                last three summed over the converted documents)
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT date(finished_at, 'unixepoch', 'localtime') AS day, backend, export_profile, "
+                "COUNT(*), SUM(outcome = ?), SUM(outcome = ?), SUM(outcome = ?), SUM(outcome = ?), "
+                "SUM(CASE WHEN outcome = ? THEN seconds END), SUM(CASE WHEN outcome = ? THEN pages END), "
+                "SUM(CASE WHEN outcome = ? THEN size_bytes END) "
+                "FROM conversions WHERE finished_at >= ? "
+                "GROUP BY day, backend, export_profile ORDER BY day, backend, export_profile",
+                (CONVERTED, CACHED, FAILED, TIMED_OUT, CONVERTED, CONVERTED, CONVERTED,
+                 time.time() - days * 86400)).fetchall()
+        names = ('day', 'backend', 'export_profile', 'documents', 'converted', 'cached',
+                 'failed', 'timed_out', 'seconds', 'pages', 'size_bytes')
+        return [dict(zip(names, row)) for row in rows]
+
+    def stage_averages(self, days=DEFAULT_STATS_DAYS):
+        """
+        Average seconds per converted document spent in each stage over the last `days` days.
+
+        Returns:
+            dict: Stage name -> average seconds, slowest first
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT stages FROM conversions WHERE outcome = ? AND finished_at >= ?",
+                (CONVERTED, time.time() - days * 86400)).fetchall()
+        totals = {}
+        for (stages,) in rows:
+            for stage, seconds in json.loads(stages or '{}').items():
+                totals[stage] = totals.get(stage, 0.0) + seconds
+        averages = {stage: seconds / len(rows) for stage, seconds in totals.items()}
+        return dict(sorted(averages.items(), key=lambda item: item[1], reverse=True))
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def print_stats(timings, days=DEFAULT_STATS_DAYS):
+    """Print conversion throughput per day, where the time goes and the fitted models."""
+    rows = timings.daily_stats(days)
+    print(f"Timing history: {timings.path}")
+    if not rows:
+        print(f"No conversions recorded in the last {days} day(s)")
+        return
+
+    print(f"\nLast {days} day(s), per Word instance:")
+    print(f"{'Day':<12}{'Backend/profile':<20}{'Docs':>6}{'Failed':>8}{'Timeouts':>10}"
+          f"{'s/doc':>8}{'Pages/min':>11}{'MB/min':>8}")
+    for row in rows:
+        converted = row['converted']
+        minutes = (row['seconds'] or 0) / 60
+        per_doc = f"{row['seconds'] / converted:.1f}" if converted else "-"
+        pages_per_min = f"{row['pages'] / minutes:.0f}" if minutes and row['pages'] else "-"
+        mb_per_min = f"{row['size_bytes'] / (1024 * 1024) / minutes:.1f}" if minutes else "-"
+        print(f"{row['day']:<12}{row['backend'] + '/' + row['export_profile']:<20}{row['documents']:>6}"
+              f"{row['failed']:>8}{row['timed_out']:>10}{per_doc:>8}{pages_per_min:>11}{mb_per_min:>8}")
+    cached = sum(row['cached'] for row in rows)
+    if cached:
+        print(f"  (plus {cached} document(s) served from the conversion cache)")
+
+    averages = timings.stage_averages(days)
+    if averages:
+        print("\nAverage seconds per converted document by stage:")
+        for stage, seconds in averages.items():
+            print(f"  {stage:<20}{seconds:8.2f}s")
+
+    print("\nDuration models:")
+    for backend, export_profile in sorted({(row['backend'], row['export_profile']) for row in rows}):
+        print(f"  {backend}/{export_profile}: {timings.model(backend, export_profile).describe()}")
+
+
+def add_timing_arguments(parser):
+    """Add the timing history options to an argparse parser."""
+    parser.add_argument('--timings', nargs='?', const=str(DEFAULT_TIMINGS_PATH), metavar='FILE',
+                        help='Record conversion timings in an SQLite history and predict conversion '
+                             f'times from it (default file: {DEFAULT_TIMINGS_PATH}); off by default')
+    parser.add_argument('--stats', nargs='?', type=int, const=DEFAULT_STATS_DAYS, metavar='DAYS',
+                        help='Show conversion throughput per day from the timing history and exit '
+                             f'(default: last {DEFAULT_STATS_DAYS} days)')
+
+
+def timings_from_args(args):
+    """
+    Open the TimingStore selected by command-line arguments.
+
+    Returns:
+        TimingStore or None: None unless --timings (or --stats) was given
+    """
+    if args.timings is None and args.stats is None:
+        return None
+    return TimingStore(args.timings or DEFAULT_TIMINGS_PATH)
+
+
+def timings_from_config(config):
+    """
+    Open the TimingStore selected by configuration file settings.
+
+    Returns:
+        TimingStore or None: None unless timings are turned on in the config
+    """
+    if not config.get('timings', False):
+        return None
+    return TimingStore(config.get('timings_db') or DEFAULT_TIMINGS_PATH)
+
+
+def run_stats_command(args, timings):
+    """
+    Handle --stats.
+
+    Returns:
+        bool: True if the statistics were shown and the program should exit
+    """
+    if args.stats is None:
+        return False
+    print_stats(timings, args.stats)
+    return True
@@ -0,0 +1,198 @@
+"""
+Word Application Pool
+Keeps Microsoft Word sessions warm across many conversions instead of
+launching and quitting Word for every document.
+"""
+
+import queue
+import threading
+from conversion_backends import get_backend_factory, com_apartment
+from conversion_trace import span
+
+
+# Default recycling policy for pooled Word sessions
+DEFAULT_MAX_DOCUMENTS = 200
+DEFAULT_MAX_MEMORY_MB = 1024
+
+# Seconds a pre-warmed Word session may sit unused before it is quit
+DEFAULT_IDLE_TIMEOUT = 300
+
+_PREWARM = object()
+_STOP = object()
+
+
+class WordPool:
+    """
+    Keeps a warm conversion backend session (normally Word) for the thread
+    that owns the pool.
+
+    The session is recycled (quit and relaunched on next use) after it has
+    converted `max_documents` files or its memory use exceeds `max_memory_mb`.
+    It is also discarded after a failed conversion, since Word may be left in
+    a bad state. COM objects are bound to the apartment that created them, so
+    a pool must only be used from a single thread; give each worker its own.
+
+    Args:
+        max_documents (int): Recycle after this many documents (0 = never)
+        max_memory_mb (float): Recycle when Word uses more memory than this (0 = never)
+        backend_factory (callable, optional): Returns a new, unlaunched
+            ConversionBackend. Defaults to the Word COM backend; pass the fake
+            backend, or a factory producing stubbed sessions, for testing.
+    """
+
+    def __init__(self, max_documents=DEFAULT_MAX_DOCUMENTS, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                 backend_factory=None):
+        self.max_documents = max_documents
+        self.max_memory_mb = max_memory_mb
+        self.backend_factory = backend_factory or get_backend_factory()
+        self.session = None
+        self.launches = 0
+        self.recycles = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def acquire(self):
+        """
+        Get the warm Word session, launching a new one if needed.
+
+        Returns:
+            ConversionBackend: A running backend session
+        """
+        if self.session is None or not self.session.is_running:
+            print("Opening Microsoft Word (pooled session)...")
+            with span('launch'):
+                self.session = self.backend_factory().launch()
+            self.launches += 1
+        return self.session
+
+    def release(self, session, failed=False):
+        """
+        Return a session to the pool after a conversion, recycling it if needed.
+
+        Args:
+            session (ConversionBackend): Session obtained from acquire()
+            failed (bool): True if the conversion raised an error
+        """
+        reason = None
+        if failed:
+            reason = "conversion failed"
+        elif self.max_documents and session.documents_converted >= self.max_documents:
+            reason = f"{session.documents_converted} documents converted"
+        elif self.max_memory_mb:
+            memory_mb = session.memory_mb()
+            if memory_mb is not None and memory_mb > self.max_memory_mb:
+                reason = f"memory use {memory_mb:.0f} MB"
+
+        if reason:
+            print(f"Recycling Word session ({reason})...")
+            with span('teardown', reason=reason):
+                session.teardown()
+            self.recycles += 1
+            if session is self.session:
+                self.session = None
+
+    def close(self):
+        """Quit the pooled Word session, if any."""
+        if self.session is not None:
+            with span('teardown'):
+                self.session.teardown()
+            self.session = None
+
+
+class WordWarmer:
+    """
+    A conversion thread that launches Word before it is needed.
+
+    prewarm() starts Word in the background, so it is already running when
+    the first conversion arrives. Conversions are submitted as functions and
+    run on the same thread, since COM objects can only be used from the
+    apartment that created them. Word is quit once it has been idle for
+    `idle_timeout` seconds, and launched again by the next prewarm() or
+    conversion.
+
+    Args:
+        backend_factory (callable, optional): Backend factory (default: Word via COM)
+        idle_timeout (float): Quit Word after this many idle seconds (0 = never)
+        max_documents (int): Recycle Word after this many documents (0 = never)
+        max_memory_mb (float): Recycle Word above this memory use (0 = never)
+        name (str): Name of the conversion thread
+    """
+
+    def __init__(self, backend_factory=None, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 max_documents=DEFAULT_MAX_DOCUMENTS, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                 name='conversion'):
+        self.backend_factory = backend_factory or get_backend_factory()
+        self.idle_timeout = idle_timeout
+        self.pool = WordPool(max_documents=max_documents, max_memory_mb=max_memory_mb,
+                             backend_factory=self.backend_factory)
+        self._tasks = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def is_warm(self):
+        """True if a Word session is running and ready for the next conversion."""
+        return self.pool.session is not None
+
+    def prewarm(self):
+        """Launch Word in the background if it is not already running."""
+        self._tasks.put(_PREWARM)
+
+    def submit(self, func):
+        """
+        Run func(pool) on the conversion thread, after any earlier submissions.
+
+        Args:
+            func (callable): Called with the WordPool; use pool.acquire() and
+                pool.release() to get the warm session
+
+        Returns:
+            Future: Resolves to func's return value
+        """
+        from concurrent.futures import Future
+
+        future = Future()
+        self._tasks.put((func, future))
+        return future
+
+    def _run(self):
+        with com_apartment(self.backend_factory):
+            try:
+                while True:
+                    timeout = self.idle_timeout if self.is_warm and self.idle_timeout else None
+                    try:
+                        task = self._tasks.get(timeout=timeout)
+                    except queue.Empty:
+                        print(f"Closing Word after {self.idle_timeout:g}s idle...")
+                        self.pool.close()
+                        continue
+
+                    if task is _STOP:
+                        break
+                    if task is _PREWARM:
+                        try:
+                            with span('prewarm'):
+                                self.pool.acquire()
+                        except Exception as e:
+                            print(f"⚠ Could not start Word in the background: {e}")
+                        continue
+
+                    func, future = task
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        future.set_result(func(self.pool))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                self.pool.close()
+
+    def close(self, timeout=None):
+        """Quit Word and stop the conversion thread once earlier submissions finish."""
+        self._tasks.put(_STOP)
+        self._thread.join(timeout)
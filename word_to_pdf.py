@@ -7,17 +7,62 @@ import os
 import sys
 import json
 import argparse
+import time
 from pathlib import Path
-from docx2pdf import convert
+from conversion_backends import get_backend_factory, com_apartment, parse_backend_options, add_backend_arguments
+from parallel_batch import run_parallel_batch, BatchResult
+from batch_manifest import BatchManifest
+from batch_journal import BatchJournal
+from batch_dedup import BatchDeduplicator, add_dedup_argument
+from output_index import add_index_argument, index_from_args, index_from_config
+from file_scanner import iter_word_files, WORD_EXTENSIONS
+from conversion_cache import add_cache_arguments, cache_from_args, cache_from_config, run_cache_command
+from conversion_trace import span, tracing, add_trace_argument
+from docx_preflight import inspect_document, describe, eta_progress
+from folder_watcher import (watch_folder, add_watch_arguments, DEFAULT_SETTLE_SECONDS,
+                            DEFAULT_POLL_INTERVAL)
 
 
-def convert_word_to_pdf(input_path, output_path=None):
+DEFAULT_BACKEND = 'docx2pdf'
+
+# PDF export options for backends that drive Word directly (docx2pdf uses its own)
+EXPORT_OPTIONS = {'ExportFormat': 17}  # wdExportFormatPDF
+
+
+def _cache_options(backend):
+    """Options that identify how a cached PDF was produced."""
+    return {'backend': backend, **EXPORT_OPTIONS}
+
+
+def _output_path_for(word_file, input_dir, output_folder, recursive):
+    """Determine the output PDF path for a Word file found in a batch."""
+    if output_folder:
+        output_dir = Path(output_folder)
+        # Preserve subfolder structure if recursive
+        if recursive:
+            relative_path = word_file.relative_to(input_dir)
+            return output_dir / relative_path.with_suffix('.pdf')
+        return output_dir / word_file.with_suffix('.pdf').name
+    return word_file.with_suffix('.pdf')
+
+
+def _export_with_session(session, input_file, output_file):
+    """Export one document as PDF on a worker's own backend instance."""
+    session.convert(input_file.resolve(), output_file.resolve(), EXPORT_OPTIONS)
+
+
+def convert_word_to_pdf(input_path, output_path=None, cache=None, backend=DEFAULT_BACKEND,
+                        backend_options=None, index=None):
     """
     Convert a Word document to PDF.
     
     Args:
         input_path (str): Path to the input Word document
         output_path (str, optional): Path for the output PDF. If None, uses same name with .pdf extension
+        cache (ConversionCache, optional): Reuse a cached PDF if this document was already converted
+        backend (str): Conversion backend name ('docx2pdf', 'word', or 'fake' for testing)
+        backend_options (dict, optional): Settings passed to the backend
+        index (OutputIndex, optional): Record the produced PDF for find_pdf.py
     
     Returns:
         str: Path to the generated PDF file
@@ -29,8 +74,8 @@ def convert_word_to_pdf(input_path, output_path=None):
         raise FileNotFoundError(f"Input file not found: {input_path}")
     
     # Check if input file is a Word document
-    if input_file.suffix.lower() not in ['.docx', '.doc']:
-        raise ValueError(f"Input file must be a Word document (.docx or .doc): {input_path}")
+    if input_file.suffix.lower() not in WORD_EXTENSIONS:
+        raise ValueError(f"Input file must be a Word document (.docx, .doc or .docm): {input_path}")
     
     # Determine output path
     if output_path is None:
@@ -46,13 +91,36 @@ def convert_word_to_pdf(input_path, output_path=None):
     print(f"Converting: {input_file.name} -> {output_file.name}")
     print(f"File size: {file_size_mb:.2f} MB")
     
-    if file_size_mb > 10:
-        print("⚠ Large file detected. This may take several minutes. Please be patient...")
+    # Pre-flight: page count, images and tables predict how long Word will take
+    with span('preflight', file=input_file.name):
+        estimate = describe(inspect_document(input_file))
     
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.key_for(input_file, _cache_options(backend))
+        if cache.materialize(cache_key, output_file):
+            print(f"✓ Reused cached PDF: {output_file}")
+            if index is not None:
+                index.record(input_file, output_file)
+            return str(output_file)
+    
+    backend_factory = get_backend_factory(backend, backend_options)
     try:
         # Perform conversion
-        print("Starting conversion (this may appear stuck at 0% for large files)...")
-        convert(str(input_file), str(output_file))
+        print("Starting conversion...")
+        with com_apartment(backend_factory):
+            with span('launch'):
+                session = backend_factory().launch()
+            try:
+                with eta_progress(estimate):
+                    session.convert(input_file.resolve(), output_file.resolve(), EXPORT_OPTIONS)
+            finally:
+                with span('teardown'):
+                    session.teardown()
+        if cache_key is not None:
+            cache.store(cache_key, output_file)
+        if index is not None:
+            index.record(input_file, output_file)
         print(f"✓ Successfully converted to: {output_file}")
         return str(output_file)
     except Exception as e:
@@ -60,7 +128,10 @@ def convert_word_to_pdf(input_path, output_path=None):
         raise
 
 
-def batch_convert(input_folder, output_folder=None, recursive=False):
+def batch_convert(input_folder, output_folder=None, recursive=False, workers=1, cache=None,
+                  incremental=False, delete_orphans=False, include=None, exclude=None,
+                  backend=DEFAULT_BACKEND, backend_options=None, resume=False, dedup=True,
+                  index=None):
     """
     Convert all Word documents in a folder to PDF.
     
@@ -68,50 +139,165 @@ def batch_convert(input_folder, output_folder=None, recursive=False):
         input_folder (str): Path to folder containing Word documents
         output_folder (str, optional): Path to output folder. If None, PDFs are saved in input folder
         recursive (bool): If True, search for Word files recursively in subfolders
+        workers (int): Number of parallel workers, each with its own Word instance
+            (needs a backend that supports it, e.g. 'word'; docx2pdf does not)
+        cache (ConversionCache, optional): Reuse cached PDFs for unchanged documents
+        incremental (bool): If True, only convert documents that are new or changed
+            since the last run, as recorded in a manifest in the output folder
+        delete_orphans (bool): In incremental mode, delete PDFs whose source
+            document no longer exists
+        include (list, optional): Glob patterns documents must match
+        exclude (list, optional): Glob patterns for documents and folders to skip
+        backend (str): Conversion backend name ('docx2pdf', 'word', or 'fake' for testing)
+        backend_options (dict, optional): Settings passed to the backend
+        resume (bool): Continue an interrupted run: skip documents the journal
+            in the output folder records as done, and re-convert the ones that
+            were in progress
+        dedup (bool): Convert byte-identical documents once and give the other
+            copies the same PDF (hardlink, reflink or copy)
+        index (OutputIndex, optional): Record every produced PDF for find_pdf.py
+    
+    Returns:
+        BatchResult: Success/failure/skip counts and per-document durations
     """
     input_dir = Path(input_folder)
     
     if not input_dir.exists() or not input_dir.is_dir():
         raise NotADirectoryError(f"Input folder not found: {input_folder}")
     
-    # Find all Word documents
-    if recursive:
-        word_files = list(input_dir.rglob('*.docx')) + list(input_dir.rglob('*.doc'))
-    else:
-        word_files = list(input_dir.glob('*.docx')) + list(input_dir.glob('*.doc'))
+    backend_factory = get_backend_factory(backend, backend_options)
+    if workers > 1 and not backend_factory.backend_class.supports_parallel:
+        # docx2pdf attaches to the shared Word instance; switching backends
+        # behind the user's back would change the PDFs with the worker count
+        raise ValueError(f"The '{backend}' backend cannot convert in parallel; "
+                         f"use --backend word with --workers, or --workers 1")
+    
+    # Stream Word documents into the conversion loop as they are found
+    print(f"Scanning {input_folder} for Word documents...")
+    print("-" * 60)
+    word_files = iter_word_files(input_dir, recursive, include, exclude)
+    jobs = ((word_file, _output_path_for(word_file, input_dir, output_folder, recursive))
+            for word_file in word_files)
+    
+    manifest = None
+    if incremental:
+        manifest = BatchManifest(input_dir, Path(output_folder) if output_folder else input_dir)
+        jobs = manifest.pending(jobs)
+    
+    def on_success(input_file, output_file):
+        if manifest is not None:
+            manifest.record(input_file, output_file)
+        if index is not None:
+            index.record(input_file, output_file)
+    
+    # Write-ahead journal so an interrupted run can be resumed
+    journal = BatchJournal(input_dir, Path(output_folder) if output_folder else input_dir)
+    journal.open(resume)
+    jobs = journal.pending(jobs)
+    
+    # Byte-identical copies are held back and get their first copy's PDF afterwards
+    deduplicator = BatchDeduplicator() if dedup else None
+    if deduplicator is not None:
+        jobs = deduplicator.pending(jobs)
+    
+    def on_record(input_file, duration, error):
+        journal.record_result(input_file, duration, error)
+        if deduplicator is not None:
+            deduplicator.record_result(input_file, duration, error)
+    
+    result = BatchResult(on_record=on_record)
+    
+    try:
+        if workers > 1:
+            print(f"Converting with {workers} parallel workers...")
+            result = run_parallel_batch(jobs, _export_with_session, workers,
+                                        backend_factory=backend_factory,
+                                        cache=cache, cache_options=_cache_options(backend),
+                                        on_success=on_success, on_start=journal.mark_in_progress,
+                                        on_record=on_record)
+        else:
+            for word_file, output_file in jobs:
+                journal.mark_in_progress(word_file, output_file)
+                start = time.perf_counter()
+                try:
+                    with span('document', file=word_file.name):
+                        convert_word_to_pdf(word_file, output_file, cache=cache,
+                                            backend=backend, backend_options=backend_options)
+                    if on_success is not None:
+                        on_success(word_file, output_file)
+                    result.record(word_file, time.perf_counter() - start)
+                except Exception as e:
+                    result.record(word_file, time.perf_counter() - start, e)
+                    continue
+        if deduplicator is not None:
+            deduplicator.fan_out(result, on_success)
+        # The run reached the end; the journal is only needed to retry failures
+        journal.finish()
+    finally:
+        journal.close()
+        if manifest is not None:
+            manifest.remove_orphans(delete_pdfs=delete_orphans)
+            manifest.save()
     
-    if not word_files:
+    result.skipped = journal.skipped
+    if manifest is not None:
+        result.skipped += manifest.skipped
+    if result.total == 0:
         print(f"No Word documents found in: {input_folder}")
-        return
+        return result
     
-    print(f"Found {len(word_files)} Word document(s) to convert")
     print("-" * 60)
+    print(f"Conversion complete: {result.successful} successful, {result.failed} failed")
+    if manifest is not None or resume:
+        print(f"Unchanged or already converted (skipped): {result.skipped}")
+    if journal.requeued:
+        print(f"Interrupted and re-converted: {journal.requeued}")
+    if deduplicator is not None and deduplicator.saved:
+        print(f"Conversions saved by deduplication: {deduplicator.saved} (identical copies given the same PDF)")
+    if cache is not None:
+        print(f"Cache hits: {cache.hits}, misses: {cache.misses}")
     
-    successful = 0
-    failed = 0
-    
-    for word_file in word_files:
-        try:
-            # Determine output path
-            if output_folder:
-                output_dir = Path(output_folder)
-                # Preserve subfolder structure if recursive
-                if recursive:
-                    relative_path = word_file.relative_to(input_dir)
-                    output_file = output_dir / relative_path.with_suffix('.pdf')
-                else:
-                    output_file = output_dir / word_file.with_suffix('.pdf').name
-            else:
-                output_file = word_file.with_suffix('.pdf')
-            
-            convert_word_to_pdf(word_file, output_file)
-            successful += 1
-        except Exception as e:
-            failed += 1
-            continue
+    return result
+
+
+def watch_convert(input_folder, output_folder=None, recursive=False, cache=None,
+                  include=None, exclude=None, backend=DEFAULT_BACKEND, backend_options=None,
+                  settle_seconds=DEFAULT_SETTLE_SECONDS, poll_interval=DEFAULT_POLL_INTERVAL,
+                  force_polling=False, index=None):
+    """
+    Watch a folder and convert Word documents as they are added or changed.
+    Runs until Ctrl+C.
     
-    print("-" * 60)
-    print(f"Conversion complete: {successful} successful, {failed} failed")
+    Args:
+        input_folder (str): Folder to watch
+        output_folder (str, optional): Path to output folder. If None, PDFs are saved in input folder
+        recursive (bool): If True, also watch subfolders
+        cache (ConversionCache, optional): Reuse cached PDFs for unchanged documents
+        include (list, optional): Glob patterns documents must match
+        exclude (list, optional): Glob patterns for documents and folders to skip
+        backend (str): Conversion backend name. Use 'word' to keep Word running
+            between documents; docx2pdf starts Word for every document.
+        backend_options (dict, optional): Settings passed to the backend
+        settle_seconds (float): Wait until a document's size and modification time
+            have not changed for this long before converting it
+        poll_interval (float): Seconds between folder scans when inotify is unavailable
+        force_polling (bool): Scan the folder periodically even on Linux
+        index (OutputIndex, optional): Record every produced PDF for find_pdf.py
+    
+    Returns:
+        BatchResult: Counts and durations of the conversions done while watching
+    """
+    input_dir = Path(input_folder).resolve()
+    return watch_folder(
+        input_dir,
+        lambda word_file: _output_path_for(word_file, input_dir, output_folder, recursive),
+        _export_with_session,
+        backend_factory=get_backend_factory(backend, backend_options),
+        recursive=recursive, include=include, exclude=exclude,
+        manifest_dir=output_folder, cache=cache, cache_options=_cache_options(backend),
+        settle_seconds=settle_seconds, poll_interval=poll_interval, force_polling=force_polling,
+        on_success=index.record if index is not None else None
+    )
 
 
 def load_config(config_file='config.json'):
@@ -143,12 +329,19 @@ def run_from_config(config_file='config.json'):
     
     Args:
         config_file (str): Path to the configuration file
+    
+    Returns:
+        BatchResult or str: Batch result in batch mode, otherwise the PDF path
     """
     print(f"Loading configuration from: {config_file}")
     config = load_config(config_file)
     
     batch_mode = config.get('batch_mode', False)
     recursive = config.get('recursive', False)
+    cache = cache_from_config(config)
+    backend = config.get('backend', DEFAULT_BACKEND)
+    backend_options = config.get('backend_options')
+    index = index_from_config(config)
     
     if batch_mode:
         # Batch conversion mode
@@ -158,8 +351,24 @@ def run_from_config(config_file='config.json'):
         if not input_folder:
             raise ValueError("'input_folder' must be specified in config for batch mode")
         
+        if config.get('watch', False):
+            return watch_convert(input_folder, output_folder, recursive, cache=cache,
+                                 include=config.get('include'), exclude=config.get('exclude'),
+                                 backend=backend, backend_options=backend_options,
+                                 settle_seconds=config.get('settle_seconds', DEFAULT_SETTLE_SECONDS),
+                                 poll_interval=config.get('poll_interval', DEFAULT_POLL_INTERVAL),
+                                 force_polling=config.get('force_polling', False),
+                                 index=index)
+        
         print(f"Batch Mode: {'Recursive' if recursive else 'Non-recursive'}")
-        batch_convert(input_folder, output_folder, recursive)
+        return batch_convert(input_folder, output_folder, recursive,
+                             workers=config.get('workers', 1), cache=cache,
+                             incremental=config.get('incremental', False),
+                             delete_orphans=config.get('delete_orphans', False),
+                             include=config.get('include'), exclude=config.get('exclude'),
+                             backend=backend, backend_options=backend_options,
+                             resume=config.get('resume', False),
+                             dedup=config.get('dedup', True), index=index)
     else:
         # Single file conversion mode
         input_file = config.get('input_file', '')
@@ -168,7 +377,9 @@ def run_from_config(config_file='config.json'):
         if not input_file:
             raise ValueError("'input_file' must be specified in config")
         
-        convert_word_to_pdf(input_file, output_file)
+        return convert_word_to_pdf(input_file, output_file, cache=cache,
+                                   backend=backend, backend_options=backend_options,
+                                   index=index)
 
 
 def main():
@@ -195,6 +406,25 @@ Examples:
   
   # Convert all Word files recursively with output folder
   python word_to_pdf.py input_folder/ --batch -o output_folder/ --recursive
+  
+  # Convert a folder using 8 parallel Word instances
+  python word_to_pdf.py input_folder/ --batch --workers 8 --backend word
+  
+  # Only convert documents added or changed since the last run
+  python word_to_pdf.py input_folder/ --batch -o output_folder/ --incremental
+  
+  # Continue a batch that was interrupted (crash, reboot or Ctrl+C)
+  python word_to_pdf.py input_folder/ --batch -o output_folder/ --resume
+  
+  # Reuse PDFs of documents that were converted before
+  python word_to_pdf.py input_folder/ --batch --cache
+  python word_to_pdf.py --cache-stats
+  
+  # Record where a batch spends its time (open in chrome://tracing or ui.perfetto.dev)
+  python word_to_pdf.py input_folder/ --batch --workers 4 --backend word --trace trace.json
+  
+  # Keep running and convert documents as they are dropped into a folder
+  python word_to_pdf.py input_folder/ -o output_folder/ --watch --backend word
         """
     )
     
@@ -204,25 +434,64 @@ Examples:
     parser.add_argument('--recursive', action='store_true', help='Search for Word files recursively in subfolders (use with --batch)')
     parser.add_argument('--config', nargs='?', const='config.json', metavar='CONFIG_FILE', 
                         help='Use configuration file (default: config.json)')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='Number of parallel conversion workers in batch mode (default: 1)')
+    parser.add_argument('--include', action='append', metavar='PATTERN',
+                        help='Only convert documents matching this glob pattern (repeatable)')
+    parser.add_argument('--exclude', action='append', metavar='PATTERN',
+                        help='Skip documents and folders matching this glob pattern (repeatable)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only convert documents that are new or changed since the last batch run')
+    parser.add_argument('--delete-orphans', action='store_true',
+                        help='With --incremental, delete PDFs whose source document was removed')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted batch run where it stopped')
+    add_dedup_argument(parser)
+    add_index_argument(parser)
+    add_watch_arguments(parser)
+    add_cache_arguments(parser)
+    add_backend_arguments(parser, default=DEFAULT_BACKEND)
+    add_trace_argument(parser)
     
     args = parser.parse_args()
+    cache = cache_from_args(args)
+    index = index_from_args(args)
     
     try:
-        # Check if config mode is requested
-        if args.config is not None:
-            run_from_config(args.config)
-        elif args.input:
-            # Command-line mode
-            if args.batch:
-                # Batch conversion mode
-                batch_convert(args.input, args.output, args.recursive)
+        if cache is not None and run_cache_command(args, cache):
+            return
+        backend_options = parse_backend_options(args.backend_option)
+        with tracing(args.trace):
+            # Check if config mode is requested
+            if args.config is not None:
+                run_from_config(args.config)
+            elif args.input:
+                # Command-line mode
+                if args.watch:
+                    # Watch mode: convert documents as they arrive
+                    watch_convert(args.input, args.output, args.recursive, cache=cache,
+                                  include=args.include, exclude=args.exclude,
+                                  backend=args.backend, backend_options=backend_options,
+                                  settle_seconds=args.settle_seconds,
+                                  poll_interval=args.poll_interval,
+                                  force_polling=args.force_polling, index=index)
+                elif args.batch:
+                    # Batch conversion mode
+                    batch_convert(args.input, args.output, args.recursive,
+                                  workers=args.workers, cache=cache,
+                                  incremental=args.incremental, delete_orphans=args.delete_orphans,
+                                  include=args.include, exclude=args.exclude,
+                                  backend=args.backend, backend_options=backend_options,
+                                  resume=args.resume, dedup=not args.no_dedup, index=index)
+                else:
+                    # Single file conversion mode
+                    convert_word_to_pdf(args.input, args.output, cache=cache,
+                                        backend=args.backend, backend_options=backend_options,
+                                        index=index)
             else:
-                # Single file conversion mode
-                convert_word_to_pdf(args.input, args.output)
-        else:
-            parser.print_help()
-            print("\nError: Either provide input file/folder or use --config option", file=sys.stderr)
-            sys.exit(1)
+                parser.print_help()
+                print("\nError: Either provide input file/folder or use --config option", file=sys.stderr)
+                sys.exit(1)
     except Exception as e:
         print(f"\nError: {str(e)}", file=sys.stderr)
         sys.exit(1)
@@ -8,12 +8,63 @@ import sys
 import json
 import argparse
 import time
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-import win32com.client
-import pythoncom
+from conversion_backends import (DEFAULT_BACKEND, get_backend_factory, com_apartment,
+                                 wait_for_release, unshare_output, parse_backend_options,
+                                 add_backend_arguments)
+from word_pool import WordPool, DEFAULT_MAX_DOCUMENTS, DEFAULT_MAX_MEMORY_MB
+from parallel_batch import run_parallel_batch, BatchResult
+from batch_manifest import BatchManifest
+from batch_journal import BatchJournal
+from batch_dedup import BatchDeduplicator, add_dedup_argument
+from output_index import add_index_argument, index_from_args, index_from_config
+from file_scanner import iter_word_files, WORD_EXTENSIONS
+from conversion_cache import add_cache_arguments, cache_from_args, cache_from_config, run_cache_command
+from conversion_trace import span, tracing, add_trace_argument
+from conversion_server import serve, add_server_arguments
+from conversion_watchdog import (Watchdog, add_timeout_arguments, DEFAULT_TIMEOUT_SECONDS,
+                                 DEFAULT_TIMEOUT_PER_MB)
+from job_scheduler import schedule_jobs, add_schedule_argument, DEFAULT_SCHEDULE
+from export_profiles import export_options, add_profile_argument, DEFAULT_PROFILE
+from docx_preflight import inspect_document, describe, eta_progress
+from timing_store import (DurationModel, add_timing_arguments, timings_from_args, timings_from_config,
+                          run_stats_command)
+from split_export import split_exporter, add_split_arguments, DEFAULT_SPLIT_PAGES, DEFAULT_SPLIT_PARTS
+from folder_watcher import (watch_folder, add_watch_arguments, DEFAULT_SETTLE_SECONDS,
+                            DEFAULT_POLL_INTERVAL)
 
 
-def convert_word_to_pdf_advanced(input_path, output_path=None):
+# ExportAsFixedFormat parameters for best quality and layout preservation
+# (the 'print' profile; see export_profiles.py for the others)
+EXPORT_OPTIONS = export_options(DEFAULT_PROFILE)
+
+
+def _cache_options(backend, options=EXPORT_OPTIONS):
+    """Options that identify how a cached PDF was produced."""
+    return {'backend': backend, **options}
+
+
+def _print_troubleshooting(error_msg):
+    """Print helpful suggestions for common Word COM errors."""
+    if "0x800A03EC" in error_msg or "Command failed" in error_msg:
+        print("\n⚠ Troubleshooting suggestions:")
+        print("  1. Close any open Word documents and try again")
+        print("  2. Check if the document is password-protected or corrupted")
+        print("  3. Try opening the document in Word manually first")
+        print("  4. Restart your computer if the issue persists")
+    elif "0x80010001" in error_msg:
+        print("\n⚠ Word COM interface is busy. Please:")
+        print("  1. Close all Word windows")
+        print("  2. Wait a moment and try again")
+
+
+def convert_word_to_pdf_advanced(input_path, output_path=None, pool=None, cache=None,
+                                 backend=DEFAULT_BACKEND, backend_options=None, watchdog=None,
+                                 split_pages=DEFAULT_SPLIT_PAGES, split_parts=DEFAULT_SPLIT_PARTS,
+                                 splitter=None, export_profile=DEFAULT_PROFILE, duration_model=None,
+                                 index=None):
     """
     Convert a Word document to PDF using direct COM interface with optimal settings.
     This method preserves images, drawings, and layout better than docx2pdf.
@@ -21,19 +72,42 @@ def convert_word_to_pdf_advanced(input_path, output_path=None):
     Args:
         input_path (str): Path to the input Word document
         output_path (str, optional): Path for the output PDF
+        pool (WordPool, optional): Pool providing a warm Word session. When given,
+            Word is kept running after the conversion and COM must already be
+            initialized on the calling thread.
+        cache (ConversionCache, optional): Reuse a cached PDF if this document was
+            already converted with the same export options
+        backend (str): Conversion backend name ('word', or 'fake' for testing).
+            When a pool is given it must match the pool's backend.
+        backend_options (dict, optional): Settings passed to the backend
+        watchdog (Watchdog, optional): Stops Word if the document runs past its
+            time limit, raising ConversionTimeout
+        split_pages (int): Export documents of this many pages or more in parallel
+            page ranges on several Word instances and merge them (0 = never)
+        split_parts (int): Page ranges (Word instances) per split document
+        splitter (SplitExporter, optional): Shared split exporter to use instead
+            of split_pages/split_parts, keeping its helper instances warm
+            across documents
+        export_profile (str): PDF settings: 'print' (full quality), 'screen'
+            (downsampled images, smaller files) or 'archive' (PDF/A)
+        duration_model (DurationModel, optional): Predicts the conversion time
+            shown before converting from earlier conversions (default: the
+            pre-flight heuristic)
+        index (OutputIndex, optional): Record the produced PDF for find_pdf.py
     
     Returns:
         str: Path to the generated PDF file
     """
     input_file = Path(input_path).resolve()
+    options = export_options(export_profile)
     
     # Check if input file exists
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
     
     # Check if input file is a Word document
-    if input_file.suffix.lower() not in ['.docx', '.doc']:
-        raise ValueError(f"Input file must be a Word document (.docx or .doc): {input_path}")
+    if input_file.suffix.lower() not in WORD_EXTENSIONS:
+        raise ValueError(f"Input file must be a Word document (.docx, .doc or .docm): {input_path}")
     
     # Determine output path
     if output_path is None:
@@ -49,99 +123,213 @@ def convert_word_to_pdf_advanced(input_path, output_path=None):
     print(f"Output: {output_file.name}")
     print(f"File size: {file_size_mb:.2f} MB")
     
-    if file_size_mb > 10:
-        print("⚠ Large file detected. This may take several minutes. Please be patient...")
+    # Pre-flight: page count, images and tables predict how long Word will take
+    with span('preflight', file=input_file.name):
+        info = inspect_document(input_file)
+    estimate = describe(info, duration_model.predict(info, input_file) if duration_model is not None else None)
     
-    # Initialize COM
-    pythoncom.CoInitialize()
-    word = None
-    doc = None
+    cache_key = None
+    if cache is not None:
+        with span('cache lookup', category='cache'):
+            cache_key = cache.key_for(input_file, _cache_options(backend, options))
+            cached = cache.materialize(cache_key, output_file)
+        if cached:
+            print(f"✓ Reused cached PDF: {output_file}")
+            if index is not None:
+                index.record(input_file, output_file)
+            return str(output_file)
     
-    try:
-        print("Opening Microsoft Word...")
-        # Create Word application instance
-        word = win32com.client.DispatchEx("Word.Application")
-        
-        # Configure Word for better performance and reliability
-        word.Visible = False  # Run in background
-        word.DisplayAlerts = 0  # Don't show alerts (wdAlertsNone = 0)
-        
-        print(f"Opening document...")
-        # Open the document
-        doc = word.Documents.Open(str(input_file), ReadOnly=True)
-        
-        print("Converting to PDF (preserving all formatting, images, and drawings)...")
-        
-        # ExportAsFixedFormat parameters for best quality and layout preservation
-        # wdExportFormatPDF = 17
-        # wdExportOptimizeForPrint = 0 (best quality)
-        # wdExportAllDocument = 0
-        # wdExportDocumentContent = 0
-        # wdExportCreateNoBookmarks = 0
-        # wdExportCreateHeadingBookmarks = 1
-        
-        doc.ExportAsFixedFormat(
-            OutputFileName=str(output_file),
-            ExportFormat=17,  # wdExportFormatPDF
-            OpenAfterExport=False,
-            OptimizeFor=0,  # wdExportOptimizeForPrint (best quality)
-            Range=0,  # wdExportAllDocument
-            From=1,
-            To=1,
-            Item=0,  # wdExportDocumentContent
-            IncludeDocProps=True,
-            KeepIRM=True,
-            CreateBookmarks=1,  # wdExportCreateHeadingBookmarks
-            DocStructureTags=True,
-            BitmapMissingFonts=True,
-            UseISO19005_1=False
-        )
-        
-        print(f"✓ Successfully converted to: {output_file}")
-        print(f"✓ All images, drawings, and formatting preserved!")
-        
+    if pool is not None:
+        with eta_progress(estimate):
+            _convert_with_pool(pool, input_file, output_file, watchdog, splitter, options)
+        if cache_key is not None:
+            with span('cache store', category='cache'):
+                cache.store(cache_key, output_file)
+        if index is not None:
+            index.record(input_file, output_file)
         return str(output_file)
+    
+    backend_factory = get_backend_factory(backend, backend_options)
+    own_splitter = None
+    if splitter is None:
+        splitter = own_splitter = split_exporter(backend_factory, split_pages, split_parts, watchdog)
+    with com_apartment(backend_factory):
+        session = None
+        document = None
+        exported = False
         
+        try:
+            print("Opening Microsoft Word...")
+            # Start a hidden Word instance configured for unattended conversion
+            with span('launch'):
+                session = backend_factory().launch()
+            
+            with _time_limit(watchdog, session, input_file), eta_progress(estimate):
+                print(f"Opening document...")
+                with span('open', file=input_file.name):
+                    document = session.open(input_file)
+                
+                print("Converting to PDF (preserving all formatting, images, and drawings)...")
+                with span('export', file=input_file.name):
+                    _export_document(session, input_file, document, output_file, splitter, options)
+            exported = True
+            
+            if cache_key is not None:
+                with span('cache store', category='cache'):
+                    cache.store(cache_key, output_file)
+            
+            if index is not None:
+                index.record(input_file, output_file)
+            
+            print(f"✓ Successfully converted to: {output_file}")
+            print(f"✓ All images, drawings, and formatting preserved!")
+            
+            return str(output_file)
+            
+        except Exception as e:
+            error_msg = str(e)
+            print(f"\n✗ Error during conversion: {error_msg}")
+            
+            _print_troubleshooting(error_msg)
+            raise
+            
+        finally:
+            # Clean up COM objects
+            print("Cleaning up...")
+            if document is not None:
+                try:
+                    with span('close', file=input_file.name):
+                        session.close(document)
+                except:
+                    pass
+            if session is not None:
+                pid = session.pid
+                with span('teardown'):
+                    session.teardown()
+                
+                # Wait until Word has released the files (usually a few milliseconds)
+                with span('wait for release') as wait:
+                    wait['result'] = wait_for_release(input_file, output_file if exported else None, pid)
+            if own_splitter is not None:
+                own_splitter.close()
+
+
+def _time_limit(watchdog, session, input_file):
+    """The watchdog's time limit for a conversion, or no limit without a watchdog."""
+    return watchdog.guard(session, input_file) if watchdog is not None else nullcontext()
+
+
+def _export_document(session, input_file, document, output_file, splitter=None, options=EXPORT_OPTIONS):
+    """Export an opened document, in parallel page ranges if `splitter` finds it long enough."""
+    unshare_output(output_file)
+    if splitter is not None:
+        splitter.export(session, input_file, document, output_file, options)
+    else:
+        session.export(document, output_file, options)
+
+
+def _convert_with_pool(pool, input_file, output_file, watchdog=None, splitter=None,
+                       options=EXPORT_OPTIONS):
+    """Convert using a warm Word session from `pool`, without quitting Word."""
+    session = pool.acquire()
+    try:
+        print("Converting to PDF (preserving all formatting, images, and drawings)...")
+        with _time_limit(watchdog, session, input_file):
+            _export_with_session(session, input_file, output_file, splitter, options)
     except Exception as e:
         error_msg = str(e)
         print(f"\n✗ Error during conversion: {error_msg}")
-        
-        # Provide helpful error messages
-        if "0x800A03EC" in error_msg or "Command failed" in error_msg:
-            print("\n⚠ Troubleshooting suggestions:")
-            print("  1. Close any open Word documents and try again")
-            print("  2. Check if the document is password-protected or corrupted")
-            print("  3. Try opening the document in Word manually first")
-            print("  4. Restart your computer if the issue persists")
-        elif "0x80010001" in error_msg:
-            print("\n⚠ Word COM interface is busy. Please:")
-            print("  1. Close all Word windows")
-            print("  2. Wait a moment and try again")
-        
+        _print_troubleshooting(error_msg)
+        pool.release(session, failed=True)
         raise
+    
+    pool.release(session)
+    print(f"✓ Successfully converted to: {output_file}")
+    print(f"✓ All images, drawings, and formatting preserved!")
+
+
+def _output_path_for(word_file, input_dir, output_folder, recursive):
+    """Determine the output PDF path for a Word file found in a batch."""
+    if output_folder:
+        output_dir = Path(output_folder)
+        # Preserve subfolder structure if recursive
+        if recursive:
+            relative_path = word_file.relative_to(input_dir)
+            return output_dir / relative_path.with_suffix('.pdf')
+        return output_dir / word_file.with_suffix('.pdf').name
+    return word_file.with_suffix('.pdf')
+
+
+def _export_with_session(session, input_file, output_file, splitter=None, options=EXPORT_OPTIONS):
+    """Export one document on a worker's Word session, split into page ranges if it is long."""
+    if splitter is not None:
+        splitter.convert(session, input_file.resolve(), output_file.resolve(), options)
+    else:
+        session.convert(input_file.resolve(), output_file.resolve(), options)
+
+
+def _convert_recorded(input_path, output_path, timings, timeout=DEFAULT_TIMEOUT_SECONDS,
+                      timeout_per_mb=DEFAULT_TIMEOUT_PER_MB, backend=DEFAULT_BACKEND,
+                      export_profile=DEFAULT_PROFILE, **options):
+    """
+    Convert one document with a time limit, predicting its conversion time
+    from `timings` (TimingStore, optional) and recording it there.
+    Other options are passed to convert_word_to_pdf_advanced().
+    """
+    model = timings.model(backend, export_profile) if timings is not None else None
+    recorded = timings.timed(input_path, backend, export_profile) if timings is not None else nullcontext()
+    with Watchdog(timeout, timeout_per_mb, model) as watchdog, recorded:
+        return convert_word_to_pdf_advanced(input_path, output_path, backend=backend, watchdog=watchdog,
+                                            export_profile=export_profile, duration_model=model,
+                                            **options)
+
+
+def _convert_sequentially(jobs, pool, cache, backend, backend_options, on_success,
+                          on_start=None, on_record=None, watchdog=None, splitter=None,
+                          export_profile=DEFAULT_PROFILE, duration_model=None):
+    """
+    Convert batch jobs one at a time.
+
+    Returns:
+        BatchResult: Success/failure counts and per-document durations
+    """
+    result = BatchResult(on_record=on_record)
+    
+    for i, (word_file, output_file) in enumerate(jobs, 1):
+        print(f"\n[{i}] Processing: {word_file.name}")
+        print("-" * 70)
         
-    finally:
-        # Clean up COM objects
-        print("Cleaning up...")
-        if doc:
-            try:
-                doc.Close(SaveChanges=False)
-            except:
-                pass
-        if word:
-            try:
-                word.Quit()
-            except:
-                pass
-        
-        # Give Word time to fully close
-        time.sleep(1)
-        
-        # Uninitialize COM
-        pythoncom.CoUninitialize()
+        if on_start is not None:
+            on_start(word_file, output_file)
+        start = time.perf_counter()
+        try:
+            with span('document', file=word_file.name):
+                convert_word_to_pdf_advanced(word_file, output_file, pool=pool, cache=cache,
+                                             backend=backend, backend_options=backend_options,
+                                             watchdog=watchdog, splitter=splitter,
+                                             export_profile=export_profile,
+                                             duration_model=duration_model)
+            if on_success is not None:
+                on_success(word_file, output_file)
+            result.record(word_file, time.perf_counter() - start)
+            
+        except Exception as e:
+            result.record(word_file, time.perf_counter() - start, e)
+            print(f"✗ Failed: {word_file.name}")
+            continue
+    
+    return result
 
 
-def batch_convert_advanced(input_folder, output_folder=None, recursive=False):
+def batch_convert_advanced(input_folder, output_folder=None, recursive=False, pooled=False,
+                           max_documents=DEFAULT_MAX_DOCUMENTS, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                           workers=1, cache=None, incremental=False, delete_orphans=False,
+                           include=None, exclude=None, backend=DEFAULT_BACKEND,
+                           backend_options=None, resume=False,
+                           timeout=DEFAULT_TIMEOUT_SECONDS, timeout_per_mb=DEFAULT_TIMEOUT_PER_MB,
+                           schedule=DEFAULT_SCHEDULE, split_pages=DEFAULT_SPLIT_PAGES,
+                           split_parts=DEFAULT_SPLIT_PARTS, export_profile=DEFAULT_PROFILE,
+                           timings=None, dedup=True, index=None):
     """
     Convert all Word documents in a folder to PDF using advanced method.
     
@@ -149,63 +337,221 @@ def batch_convert_advanced(input_folder, output_folder=None, recursive=False):
         input_folder (str): Path to folder containing Word documents
         output_folder (str, optional): Path to output folder
         recursive (bool): If True, search for Word files recursively
+        pooled (bool): If True, keep Word running across documents instead of
+            launching and quitting it for every file
+        max_documents (int): In pooled mode, recycle Word after this many documents (0 = never)
+        max_memory_mb (float): In pooled mode, recycle Word above this memory use (0 = never)
+        workers (int): Number of parallel workers, each with its own Word instance.
+            Workers always keep their Word session warm.
+        cache (ConversionCache, optional): Reuse cached PDFs for unchanged documents
+        incremental (bool): If True, only convert documents that are new or changed
+            since the last run, as recorded in a manifest in the output folder
+        delete_orphans (bool): In incremental mode, delete PDFs whose source
+            document no longer exists
+        include (list, optional): Glob patterns documents must match
+        exclude (list, optional): Glob patterns for documents and folders to skip
+        backend (str): Conversion backend name ('word', or 'fake' for testing)
+        backend_options (dict, optional): Settings passed to the backend
+        resume (bool): Continue an interrupted run: skip documents the journal
+            in the output folder records as done, and re-convert the ones that
+            were in progress
+        timeout (float): Stop Word and fail a document after this many seconds,
+            plus `timeout_per_mb` per MB of input (0 = no limit). The batch
+            continues on a fresh Word instance.
+        timeout_per_mb (float): Extra seconds allowed per MB of input
+        schedule (str): Conversion order: 'fifo' (scan order), 'largest' (longest
+            predicted conversion first) or 'smallest' (shortest first). Predictions
+            use page count, embedded media and size, fitted to `timings`.
+        split_pages (int): Export documents of this many pages or more in parallel
+            page ranges on extra Word instances and merge them (0 = never)
+        split_parts (int): Page ranges (Word instances) per split document
+        export_profile (str): PDF settings: 'print' (full quality), 'screen'
+            (downsampled images, smaller files) or 'archive' (PDF/A)
+        timings (TimingStore, optional): History of earlier conversions. Its
+            duration model drives the estimates, time limits and schedule, and
+            every document of this run is recorded in it.
+        dedup (bool): Convert byte-identical documents once and give the other
+            copies the same PDF (hardlink, reflink or copy)
+        index (OutputIndex, optional): Record every produced PDF for find_pdf.py
+    
+    Returns:
+        BatchResult: Success/failure/skip counts and per-document durations
     """
     input_dir = Path(input_folder)
+    options = export_options(export_profile)
     
     if not input_dir.exists() or not input_dir.is_dir():
         raise NotADirectoryError(f"Input folder not found: {input_folder}")
     
-    # Find all Word documents
-    if recursive:
-        word_files = list(input_dir.rglob('*.docx')) + list(input_dir.rglob('*.doc'))
-    else:
-        word_files = list(input_dir.glob('*.docx')) + list(input_dir.glob('*.doc'))
+    # Stream Word documents into the conversion loop as they are found
+    print(f"Scanning {input_folder} for Word documents...")
+    print("=" * 70)
+    word_files = iter_word_files(input_dir, recursive, include, exclude)
+    jobs = ((word_file, _output_path_for(word_file, input_dir, output_folder, recursive))
+            for word_file in word_files)
     
-    if not word_files:
-        print(f"No Word documents found in: {input_folder}")
-        return
+    manifest = None
+    if incremental:
+        manifest = BatchManifest(input_dir, Path(output_folder) if output_folder else input_dir)
+        jobs = manifest.pending(jobs)
     
-    print(f"Found {len(word_files)} Word document(s) to convert")
-    print("=" * 70)
+    def on_success(input_file, output_file):
+        if manifest is not None:
+            manifest.record(input_file, output_file)
+        if index is not None:
+            index.record(input_file, output_file)
     
-    successful = 0
-    failed = 0
-    failed_files = []
+    # Write-ahead journal so an interrupted run can be resumed
+    journal = BatchJournal(input_dir, Path(output_folder) if output_folder else input_dir)
+    journal.open(resume)
+    jobs = journal.pending(jobs)
     
-    for i, word_file in enumerate(word_files, 1):
-        print(f"\n[{i}/{len(word_files)}] Processing: {word_file.name}")
-        print("-" * 70)
-        
-        try:
-            # Determine output path
-            if output_folder:
-                output_dir = Path(output_folder)
-                if recursive:
-                    relative_path = word_file.relative_to(input_dir)
-                    output_file = output_dir / relative_path.with_suffix('.pdf')
-                else:
-                    output_file = output_dir / word_file.with_suffix('.pdf').name
-            else:
-                output_file = word_file.with_suffix('.pdf')
-            
-            convert_word_to_pdf_advanced(word_file, output_file)
-            successful += 1
-            
-        except Exception as e:
-            failed += 1
-            failed_files.append(word_file.name)
-            print(f"✗ Failed: {word_file.name}")
-            continue
+    # Byte-identical copies are held back and get their first copy's PDF afterwards
+    deduplicator = BatchDeduplicator() if dedup else None
+    if deduplicator is not None:
+        jobs = deduplicator.pending(jobs)
+    
+    # Timings of earlier runs predict conversion times; this run's improve the next prediction
+    model = timings.model(backend, export_profile) if timings is not None else DurationModel()
+    jobs = schedule_jobs(jobs, schedule, model, workers)
+    
+    def on_record(input_file, duration, error):
+        journal.record_result(input_file, duration, error)
+        if timings is not None:
+            timings.record(input_file, duration, error, backend, export_profile)
+        if deduplicator is not None:
+            deduplicator.record_result(input_file, duration, error)
+    
+    backend_factory = get_backend_factory(backend, backend_options)
+    watchdog = Watchdog(timeout, timeout_per_mb, model)
+    splitter = split_exporter(backend_factory, split_pages, split_parts, watchdog)
+    result = BatchResult()
+    pool = None
+    
+    try:
+        if workers > 1:
+            print(f"Converting with {workers} parallel workers...")
+            export = partial(_export_with_session, splitter=splitter, options=options)
+            result = run_parallel_batch(jobs, export, workers,
+                                        max_documents=max_documents, max_memory_mb=max_memory_mb,
+                                        backend_factory=backend_factory,
+                                        cache=cache, cache_options=_cache_options(backend, options),
+                                        on_success=on_success, on_start=journal.mark_in_progress,
+                                        on_record=on_record, watchdog=watchdog)
+        elif pooled:
+            # One COM apartment and one warm Word session for the whole batch
+            with com_apartment(backend_factory), \
+                    WordPool(max_documents=max_documents, max_memory_mb=max_memory_mb,
+                             backend_factory=backend_factory) as pool:
+                result = _convert_sequentially(jobs, pool, cache, backend, backend_options,
+                                               on_success, journal.mark_in_progress,
+                                               on_record, watchdog, splitter, export_profile, model)
+                print("\nClosing pooled Word session...")
+        else:
+            result = _convert_sequentially(jobs, None, cache, backend, backend_options,
+                                           on_success, journal.mark_in_progress,
+                                           on_record, watchdog, splitter, export_profile, model)
+        if deduplicator is not None:
+            deduplicator.fan_out(result, on_success)
+        # The run reached the end; the journal is only needed to retry failures
+        journal.finish()
+    finally:
+        if splitter is not None:
+            splitter.close()
+        watchdog.close()
+        journal.close()
+        if manifest is not None:
+            manifest.remove_orphans(delete_pdfs=delete_orphans)
+            manifest.save()
+    
+    result.skipped = journal.skipped
+    if manifest is not None:
+        result.skipped += manifest.skipped
+    if result.total == 0:
+        print(f"No Word documents found in: {input_folder}")
+        return result
     
     print("\n" + "=" * 70)
     print(f"Batch conversion complete:")
-    print(f"  ✓ Successful: {successful}")
-    print(f"  ✗ Failed: {failed}")
+    print(f"  ✓ Successful: {result.successful}")
+    print(f"  ✗ Failed: {result.failed}")
+    if manifest is not None or resume:
+        print(f"  ↷ Unchanged or already converted (skipped): {result.skipped}")
+    if journal.requeued:
+        print(f"  ↻ Interrupted and re-converted: {journal.requeued}")
+    if result.timed_out:
+        print(f"  ⏱ Timed out: {result.timed_out} (Word stopped and restarted {watchdog.kills} time(s))")
+    if splitter is not None and splitter.documents_split:
+        print(f"  Split into page ranges: {splitter.documents_split} (up to {splitter.parts} Word instances each)")
+    if deduplicator is not None and deduplicator.saved:
+        print(f"  Conversions saved by deduplication: {deduplicator.saved} (identical copies given the same PDF)")
+    if pool is not None:
+        print(f"  Word launches: {pool.launches} (recycled {pool.recycles} time(s))")
+    if cache is not None:
+        print(f"  Cache hits: {cache.hits}, misses: {cache.misses}")
     
-    if failed_files:
+    if result.failed_files:
         print(f"\nFailed files:")
-        for fname in failed_files:
-            print(f"  - {fname}")
+        limits = dict(result.timed_out_files)
+        for fname in result.failed_files:
+            if fname in limits:
+                print(f"  - {fname} (timed out after {limits[fname]:.0f}s)")
+            else:
+                print(f"  - {fname}")
+    
+    return result
+
+
+def watch_convert_advanced(input_folder, output_folder=None, recursive=False,
+                           max_documents=DEFAULT_MAX_DOCUMENTS, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                           cache=None, include=None, exclude=None, backend=DEFAULT_BACKEND,
+                           backend_options=None, settle_seconds=DEFAULT_SETTLE_SECONDS,
+                           poll_interval=DEFAULT_POLL_INTERVAL, force_polling=False,
+                           timeout=DEFAULT_TIMEOUT_SECONDS, timeout_per_mb=DEFAULT_TIMEOUT_PER_MB,
+                           export_profile=DEFAULT_PROFILE, index=None):
+    """
+    Watch a folder and convert Word documents as they are added or changed,
+    on a Word session kept warm between documents. Runs until Ctrl+C.
+    
+    Args:
+        input_folder (str): Folder to watch
+        output_folder (str, optional): Path to output folder
+        recursive (bool): If True, also watch subfolders
+        max_documents (int): Recycle Word after this many documents (0 = never)
+        max_memory_mb (float): Recycle Word above this memory use (0 = never)
+        cache (ConversionCache, optional): Reuse cached PDFs for unchanged documents
+        include (list, optional): Glob patterns documents must match
+        exclude (list, optional): Glob patterns for documents and folders to skip
+        backend (str): Conversion backend name ('word', or 'fake' for testing)
+        backend_options (dict, optional): Settings passed to the backend
+        settle_seconds (float): Wait until a document's size and modification time
+            have not changed for this long before converting it
+        poll_interval (float): Seconds between folder scans when inotify is unavailable
+        force_polling (bool): Scan the folder periodically even on Linux (needed for
+            network shares changed from other machines)
+        timeout (float): Stop Word and fail a document after this many seconds,
+            plus `timeout_per_mb` per MB of input (0 = no limit)
+        timeout_per_mb (float): Extra seconds allowed per MB of input
+        export_profile (str): PDF settings: 'print', 'screen' or 'archive'
+        index (OutputIndex, optional): Record every produced PDF for find_pdf.py
+    
+    Returns:
+        BatchResult: Counts and durations of the conversions done while watching
+    """
+    input_dir = Path(input_folder).resolve()
+    options = export_options(export_profile)
+    with Watchdog(timeout, timeout_per_mb) as watchdog:
+        return watch_folder(
+            input_dir,
+            lambda word_file: _output_path_for(word_file, input_dir, output_folder, recursive),
+            partial(_export_with_session, options=options),
+            backend_factory=get_backend_factory(backend, backend_options),
+            recursive=recursive, include=include, exclude=exclude,
+            manifest_dir=output_folder, cache=cache, cache_options=_cache_options(backend, options),
+            settle_seconds=settle_seconds, poll_interval=poll_interval, force_polling=force_polling,
+            max_documents=max_documents, max_memory_mb=max_memory_mb, watchdog=watchdog,
+            on_success=index.record if index is not None else None
+        )
 
 
 def load_config(config_file='config.json'):
@@ -230,6 +576,16 @@ def run_from_config(config_file='config.json'):
     
     batch_mode = config.get('batch_mode', False)
     recursive = config.get('recursive', False)
+    cache = cache_from_config(config)
+    backend = config.get('backend', DEFAULT_BACKEND)
+    backend_options = config.get('backend_options')
+    timeout = config.get('timeout', DEFAULT_TIMEOUT_SECONDS)
+    timeout_per_mb = config.get('timeout_per_mb', DEFAULT_TIMEOUT_PER_MB)
+    split_pages = config.get('split_pages', DEFAULT_SPLIT_PAGES)
+    split_parts = config.get('split_parts', DEFAULT_SPLIT_PARTS)
+    export_profile = config.get('export_profile', DEFAULT_PROFILE)
+    timings = timings_from_config(config)
+    index = index_from_config(config)
     
     if batch_mode:
         input_folder = config.get('input_folder', '')
@@ -238,8 +594,50 @@ def run_from_config(config_file='config.json'):
         if not input_folder:
             raise ValueError("'input_folder' must be specified in config for batch mode")
         
+        if config.get('watch', False):
+            return watch_convert_advanced(
+                input_folder, output_folder, recursive,
+                max_documents=config.get('recycle_after', DEFAULT_MAX_DOCUMENTS),
+                max_memory_mb=config.get('max_memory_mb', DEFAULT_MAX_MEMORY_MB),
+                cache=cache,
+                include=config.get('include'),
+                exclude=config.get('exclude'),
+                backend=backend,
+                backend_options=backend_options,
+                settle_seconds=config.get('settle_seconds', DEFAULT_SETTLE_SECONDS),
+                poll_interval=config.get('poll_interval', DEFAULT_POLL_INTERVAL),
+                force_polling=config.get('force_polling', False),
+                timeout=timeout,
+                timeout_per_mb=timeout_per_mb,
+                export_profile=export_profile,
+                index=index
+            )
+        
         print(f"Batch Mode: {'Recursive' if recursive else 'Non-recursive'}")
-        batch_convert_advanced(input_folder, output_folder, recursive)
+        return batch_convert_advanced(
+            input_folder, output_folder, recursive,
+            pooled=config.get('pooled', False),
+            max_documents=config.get('recycle_after', DEFAULT_MAX_DOCUMENTS),
+            max_memory_mb=config.get('max_memory_mb', DEFAULT_MAX_MEMORY_MB),
+            workers=config.get('workers', 1),
+            cache=cache,
+            incremental=config.get('incremental', False),
+            delete_orphans=config.get('delete_orphans', False),
+            include=config.get('include'),
+            exclude=config.get('exclude'),
+            backend=backend,
+            backend_options=backend_options,
+            resume=config.get('resume', False),
+            timeout=timeout,
+            timeout_per_mb=timeout_per_mb,
+            schedule=config.get('schedule', DEFAULT_SCHEDULE),
+            split_pages=split_pages,
+            split_parts=split_parts,
+            export_profile=export_profile,
+            timings=timings,
+            dedup=config.get('dedup', True),
+            index=index
+        )
     else:
         input_file = config.get('input_file', '')
         output_file = config.get('output_file', None)
@@ -247,7 +645,10 @@ def run_from_config(config_file='config.json'):
         if not input_file:
             raise ValueError("'input_file' must be specified in config")
         
-        convert_word_to_pdf_advanced(input_file, output_file)
+        return _convert_recorded(input_file, output_file, timings, timeout, timeout_per_mb,
+                                 backend=backend, export_profile=export_profile, cache=cache,
+                                 backend_options=backend_options, split_pages=split_pages,
+                                 split_parts=split_parts, index=index)
 
 
 def main():
@@ -271,6 +672,53 @@ Examples:
   
   # Batch convert folder
   python word_to_pdf_advanced.py input_folder/ --batch
+  
+  # Batch convert keeping Word running, recycled every 100 documents
+  python word_to_pdf_advanced.py input_folder/ --batch --pool --recycle-after 100
+  
+  # Batch convert with 8 parallel Word instances
+  python word_to_pdf_advanced.py input_folder/ --batch --workers 8
+  
+  # Only convert documents added or changed since the last run
+  python word_to_pdf_advanced.py input_folder/ --batch -o output_folder/ --incremental
+  
+  # Start the longest conversions first so parallel workers finish together
+  python word_to_pdf_advanced.py input_folder/ --batch --workers 8 --schedule largest
+  
+  # Continue a batch that was interrupted (crash, reboot or Ctrl+C)
+  python word_to_pdf_advanced.py input_folder/ --batch -o output_folder/ --resume
+  
+  # Reuse PDFs of documents that were converted before
+  python word_to_pdf_advanced.py input_folder/ --batch --cache
+  python word_to_pdf_advanced.py --cache-stats
+  
+  # Exercise the batch pipeline without Word using the simulated backend
+  python word_to_pdf_advanced.py input_folder/ --batch --backend fake --backend-option export_latency=0.5
+  
+  # Record where a batch spends its time (open in chrome://tracing or ui.perfetto.dev)
+  python word_to_pdf_advanced.py input_folder/ --batch --workers 4 --trace trace.json
+  
+  # Keep running and convert documents as they are dropped into a folder
+  python word_to_pdf_advanced.py input_folder/ -o output_folder/ --watch
+  
+  # Export 300+ page manuals in 4 page ranges on 4 Word instances at once
+  python word_to_pdf_advanced.py manual.docx --split-pages 300 --split-parts 4
+  
+  # Smaller PDFs for on-screen reading (downsampled images)
+  python word_to_pdf_advanced.py input_folder/ --batch --export-profile screen
+  
+  # Record conversion timings (~/.word_to_pdf_timings.db) to improve estimates
+  python word_to_pdf_advanced.py input_folder/ --batch --timings
+  
+  # Conversion throughput per day over the last 30 days, from the timing history
+  python word_to_pdf_advanced.py --stats 30
+  
+  # Give up on (and stop Word for) any document that takes over 5 minutes
+  python word_to_pdf_advanced.py input_folder/ --batch --timeout 300 --timeout-per-mb 0
+  
+  # Serve conversions over HTTP on localhost:8765 with 4 Word instances
+  python word_to_pdf_advanced.py --serve --workers 4
+  curl --data-binary @report.docx -o report.pdf "http://127.0.0.1:8765/convert?filename=report.docx"
         """
     )
     
@@ -280,24 +728,106 @@ Examples:
     parser.add_argument('--recursive', action='store_true', help='Search for Word files recursively')
     parser.add_argument('--config', nargs='?', const='config.json', metavar='CONFIG_FILE',
                         help='Use configuration file (default: config.json)')
+    parser.add_argument('--pool', action='store_true',
+                        help='Keep Word running across documents in batch mode')
+    parser.add_argument('--recycle-after', type=int, default=DEFAULT_MAX_DOCUMENTS, metavar='N',
+                        help=f'Restart pooled Word after N documents, 0 = never (default: {DEFAULT_MAX_DOCUMENTS})')
+    parser.add_argument('--max-memory-mb', type=float, default=DEFAULT_MAX_MEMORY_MB, metavar='MB',
+                        help=f'Restart pooled Word above this memory use, 0 = never (default: {DEFAULT_MAX_MEMORY_MB})')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='Number of parallel conversion workers in batch mode (default: 1)')
+    parser.add_argument('--include', action='append', metavar='PATTERN',
+                        help='Only convert documents matching this glob pattern (repeatable)')
+    parser.add_argument('--exclude', action='append', metavar='PATTERN',
+                        help='Skip documents and folders matching this glob pattern (repeatable)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only convert documents that are new or changed since the last batch run')
+    parser.add_argument('--delete-orphans', action='store_true',
+                        help='With --incremental, delete PDFs whose source document was removed')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted batch run where it stopped')
+    add_schedule_argument(parser)
+    add_timeout_arguments(parser)
+    add_split_arguments(parser)
+    add_profile_argument(parser)
+    add_dedup_argument(parser)
+    add_index_argument(parser)
+    add_watch_arguments(parser)
+    add_server_arguments(parser)
+    add_cache_arguments(parser)
+    add_backend_arguments(parser)
+    add_trace_argument(parser)
+    add_timing_arguments(parser)
     
     args = parser.parse_args()
+    cache = cache_from_args(args)
+    timings = timings_from_args(args)
+    index = index_from_args(args)
     
     try:
-        if args.config is not None:
-            run_from_config(args.config)
-        elif args.input:
-            if args.batch:
-                batch_convert_advanced(args.input, args.output, args.recursive)
+        if cache is not None and run_cache_command(args, cache):
+            return
+        if run_stats_command(args, timings):
+            return
+        backend_options = parse_backend_options(args.backend_option)
+        with tracing(args.trace):
+            if args.serve:
+                options = export_options(args.export_profile)
+                with Watchdog(args.timeout, args.timeout_per_mb) as watchdog:
+                    serve(partial(_export_with_session, options=options),
+                          get_backend_factory(args.backend, backend_options),
+                          host=args.host, port=args.port, workers=args.workers,
+                          queue_size=args.queue_size, max_upload_mb=args.max_upload_mb,
+                          cache=cache, cache_options=_cache_options(args.backend, options),
+                          max_documents=args.recycle_after, max_memory_mb=args.max_memory_mb,
+                          watchdog=watchdog)
+            elif args.config is not None:
+                run_from_config(args.config)
+            elif args.input:
+                if args.watch:
+                    watch_convert_advanced(args.input, args.output, args.recursive,
+                                           max_documents=args.recycle_after,
+                                           max_memory_mb=args.max_memory_mb, cache=cache,
+                                           include=args.include, exclude=args.exclude,
+                                           backend=args.backend, backend_options=backend_options,
+                                           settle_seconds=args.settle_seconds,
+                                           poll_interval=args.poll_interval,
+                                           force_polling=args.force_polling,
+                                           timeout=args.timeout,
+                                           timeout_per_mb=args.timeout_per_mb,
+                                           export_profile=args.export_profile, index=index)
+                elif args.batch:
+                    batch_convert_advanced(args.input, args.output, args.recursive, pooled=args.pool,
+                                           max_documents=args.recycle_after,
+                                           max_memory_mb=args.max_memory_mb,
+                                           workers=args.workers, cache=cache,
+                                           incremental=args.incremental,
+                                           delete_orphans=args.delete_orphans,
+                                           include=args.include, exclude=args.exclude,
+                                           backend=args.backend, backend_options=backend_options,
+                                           resume=args.resume, timeout=args.timeout,
+                                           timeout_per_mb=args.timeout_per_mb,
+                                           schedule=args.schedule, split_pages=args.split_pages,
+                                           split_parts=args.split_parts,
+                                           export_profile=args.export_profile,
+                                           timings=timings, dedup=not args.no_dedup,
+                                           index=index)
+                else:
+                    _convert_recorded(args.input, args.output, timings, args.timeout,
+                                      args.timeout_per_mb, backend=args.backend,
+                                      export_profile=args.export_profile, cache=cache,
+                                      backend_options=backend_options,
+                                      split_pages=args.split_pages, split_parts=args.split_parts,
+                                      index=index)
             else:
-                convert_word_to_pdf_advanced(args.input, args.output)
-        else:
-            parser.print_help()
-            print("\nError: Either provide input file/folder or use --config option", file=sys.stderr)
-            sys.exit(1)
+                parser.print_help()
+                print("\nError: Either provide input file/folder or use --config option", file=sys.stderr)
+                sys.exit(1)
             
     except KeyboardInterrupt:
         print("\n\n⚠ Conversion cancelled by user")
+        if args.batch and not args.serve:
+            print("  Run the same command with --resume to continue where it stopped")
         sys.exit(1)
     except Exception as e:
         print(f"\nError: {str(e)}", file=sys.stderr)
@@ -6,18 +6,44 @@ Uses the advanced conversion method for perfect layout preservation
 
 import os
 import sys
+import argparse
 import time
-import threading
+from contextlib import nullcontext
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import win32com.client
-import pythoncom
+from conversion_backends import (DEFAULT_BACKEND, get_backend_factory, wait_for_release,
+                                 unshare_output, parse_backend_options, add_backend_arguments)
+from conversion_trace import span, tracing, add_trace_argument
+from gui_queue import ConversionQueueWindow
+from word_pool import WordWarmer, DEFAULT_IDLE_TIMEOUT
+from docx_preflight import inspect_document, format_duration, WORD_START_SECONDS
+from export_profiles import export_options, DEFAULT_PROFILE
+from timing_store import TimingStore, DEFAULT_TIMINGS_PATH
+from output_index import OutputIndex
+
+
+# Full-quality PDF export settings (the 'print' profile)
+EXPORT_OPTIONS = export_options(DEFAULT_PROFILE)
 
 
 class WordToPDFConverterGUI:
-    def __init__(self, root):
+    def __init__(self, root, backend=DEFAULT_BACKEND, backend_options=None,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT, prewarm=True, timings=None):
         self.root = root
+        self.backend = backend
+        self.backend_factory = get_backend_factory(backend, backend_options)
+        # Conversion history (TimingStore, optional); predicts how long the
+        # next document will take
+        self.timings = timings
+        # Produced PDFs, so find_pdf.py can list them without scanning folders
+        self.index = OutputIndex()
+        
+        # Conversions run on one background thread that starts Word ahead of
+        # time, so clicking Convert does not wait for Word to launch
+        self.word = WordWarmer(self.backend_factory, idle_timeout=idle_timeout)
+        if prewarm:
+            self.word.prewarm()
         self.root.title("Word to PDF Converter")
         self.root.geometry("700x550")
         self.root.resizable(False, False)
@@ -32,7 +58,11 @@ class WordToPDFConverterGUI:
         self.input_file = tk.StringVar()
         self.output_file = tk.StringVar()
         self.status_text = tk.StringVar(value="Ready to convert")
+        self.eta_text = tk.StringVar()
+        self.eta_started = None
+        self.eta_seconds = None
         self.is_converting = False
+        self.queue_window = None
         
         # Configure colors
         self.bg_color = "#f0f0f0"
@@ -162,9 +192,12 @@ class WordToPDFConverterGUI:
         )
         auto_check.pack(anchor=tk.W, pady=(0, 20))
         
-        # Convert button
+        # Convert buttons
+        buttons_frame = tk.Frame(content_frame, bg=self.bg_color)
+        buttons_frame.pack(pady=20)
+        
         self.convert_btn = tk.Button(
-            content_frame,
+            buttons_frame,
             text="🚀 Convert to PDF",
             command=self.start_conversion,
             font=("Segoe UI", 14, "bold"),
@@ -175,18 +208,43 @@ class WordToPDFConverterGUI:
             padx=40,
             pady=15
         )
-        self.convert_btn.pack(pady=20)
+        self.convert_btn.pack(side=tk.LEFT, padx=5)
+        
+        queue_btn = tk.Button(
+            buttons_frame,
+            text="📚 Convert Many...",
+            command=self.open_queue,
+            font=("Segoe UI", 11, "bold"),
+            bg=self.secondary_color,
+            fg="white",
+            relief=tk.FLAT,
+            cursor="hand2",
+            padx=20,
+            pady=17
+        )
+        queue_btn.pack(side=tk.LEFT, padx=5)
         
         # Progress section
         progress_frame = tk.Frame(content_frame, bg=self.bg_color)
         progress_frame.pack(fill=tk.X, pady=(10, 0))
         
+        # Filled in by elapsed time against the document's estimated conversion time
         self.progress_bar = ttk.Progressbar(
             progress_frame,
-            mode='indeterminate',
+            mode='determinate',
+            maximum=100,
             length=400
         )
-        self.progress_bar.pack(fill=tk.X, pady=(0, 10))
+        self.progress_bar.pack(fill=tk.X, pady=(0, 2))
+        
+        # Time remaining
+        tk.Label(
+            progress_frame,
+            textvariable=self.eta_text,
+            font=("Segoe UI", 9),
+            bg=self.bg_color,
+            fg=self.text_color
+        ).pack(anchor=tk.E, pady=(0, 6))
         
         # Status label
         self.status_label = tk.Label(
@@ -268,7 +326,7 @@ class WordToPDFConverterGUI:
         filename = filedialog.askopenfilename(
             title="Select Word Document",
             filetypes=[
-                ("Word Documents", "*.docx *.doc"),
+                ("Word Documents", "*.docx *.doc *.docm"),
                 ("All Files", "*.*")
             ]
         )
@@ -276,6 +334,9 @@ class WordToPDFConverterGUI:
         if filename:
             self.input_file.set(filename)
             
+            # Start Word now (if it is not running) so it is ready by the time Convert is clicked
+            self.word.prewarm()
+            
             # Auto-generate output filename if enabled
             if self.auto_output.get():
                 output = str(Path(filename).with_suffix('.pdf'))
@@ -301,6 +362,22 @@ class WordToPDFConverterGUI:
         if filename:
             self.output_file.set(filename)
     
+    def open_queue(self):
+        """Open the conversion queue window for converting many files and folders"""
+        if self.queue_window is not None and not self.queue_window.closing:
+            self.queue_window.window.deiconify()
+            self.queue_window.window.lift()
+            return
+        colors = {
+            'bg': self.bg_color,
+            'primary': self.primary_color,
+            'secondary': self.secondary_color,
+            'danger': self.danger_color,
+            'text': self.text_color,
+        }
+        self.queue_window = ConversionQueueWindow(self.root, self.backend_factory, colors,
+                                                  on_success=self.index.record)
+    
     def start_conversion(self):
         """Start the conversion process in a separate thread"""
         if self.is_converting:
@@ -339,13 +416,13 @@ class WordToPDFConverterGUI:
         # Start conversion in separate thread
         self.is_converting = True
         self.convert_btn.config(state='disabled', bg="#cccccc")
-        self.progress_bar.start(10)
+        self.progress_bar['value'] = 0
+        self.eta_text.set("Estimating conversion time...")
         
-        thread = threading.Thread(target=self.convert_file, daemon=True)
-        thread.start()
+        self.word.submit(self.convert_file)
     
-    def convert_file(self):
-        """Convert Word file to PDF (runs in separate thread)"""
+    def convert_file(self, pool):
+        """Convert Word file to PDF (runs on the conversion thread, with its warm Word pool)"""
         try:
             input_path = Path(self.input_file.get())
             output_path = Path(self.output_file.get())
@@ -353,94 +430,87 @@ class WordToPDFConverterGUI:
             # Update status
             self.update_status(f"Opening {input_path.name}...")
             
-            # Get file size
-            file_size_mb = input_path.stat().st_size / (1024 * 1024)
-            
-            if file_size_mb > 10:
-                self.update_status(f"Converting large file ({file_size_mb:.1f} MB)... This may take several minutes.")
+            # Pre-flight: pages, images and tables, and how long similar documents
+            # took before, give the estimate that drives the progress bar
+            with span('preflight', file=input_path.name):
+                info = inspect_document(input_path)
+            if self.timings is not None:
+                estimate = self.timings.model(self.backend, DEFAULT_PROFILE).predict(info, input_path)
             else:
-                self.update_status(f"Converting {input_path.name}...")
+                estimate = info.estimate_seconds()
+            if pool.session is None:
+                estimate += WORD_START_SECONDS
+            self.root.after(0, lambda: self.start_eta(estimate))
+            self.update_status(f"Converting {input_path.name} ({info.summary()})...")
             
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
-            word = None
-            doc = None
-            
-            try:
-                # Create Word application
-                self.update_status("Starting Microsoft Word...")
-                word = win32com.client.DispatchEx("Word.Application")
-                word.Visible = False
-                word.DisplayAlerts = 0
-                
-                # Open document
-                self.update_status(f"Opening document...")
-                doc = word.Documents.Open(str(input_path.resolve()), ReadOnly=True)
-                
-                # Convert to PDF
-                self.update_status("Converting to PDF with optimized settings...")
-                self.update_status("Preserving all images, drawings, and formatting...")
-                
-                # Create output directory if needed
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Export as PDF with best quality settings
-                doc.ExportAsFixedFormat(
-                    OutputFileName=str(output_path.resolve()),
-                    ExportFormat=17,  # wdExportFormatPDF
-                    OpenAfterExport=False,
-                    OptimizeFor=0,  # wdExportOptimizeForPrint (best quality)
-                    Range=0,  # wdExportAllDocument
-                    From=1,
-                    To=1,
-                    Item=0,  # wdExportDocumentContent
-                    IncludeDocProps=True,
-                    KeepIRM=True,
-                    CreateBookmarks=1,  # wdExportCreateHeadingBookmarks
-                    DocStructureTags=True,
-                    BitmapMissingFonts=True,
-                    UseISO19005_1=False
-                )
-                
-                self.update_status("Cleaning up...")
-                
-            finally:
-                # Clean up COM objects properly to release file locks
-                self.update_status("Releasing file locks and cleaning up...")
-                
-                # Close document
-                if doc:
-                    try:
-                        doc.Close(SaveChanges=False)
-                        # Release COM reference
-                        doc = None
-                    except Exception as e:
-                        print(f"Warning: Error closing document: {e}")
+            recorded = (self.timings.timed(input_path, self.backend, DEFAULT_PROFILE)
+                        if self.timings is not None else nullcontext())
+            with span('convert', file=input_path.name), recorded:
+                document = None
+                exported = False
                 
-                # Quit Word
-                if word:
-                    try:
-                        word.Quit()
-                        # Release COM reference
-                        word = None
-                    except Exception as e:
-                        print(f"Warning: Error quitting Word: {e}")
+                # Word is normally already running, started in the background
+                if pool.session is None:
+                    self.update_status("Starting Microsoft Word...")
+                session = pool.acquire()
                 
-                # Force garbage collection to release COM objects
-                import gc
-                gc.collect()
-                
-                # Give Word time to fully close and release files
-                time.sleep(2)
-                
-                # Uninitialize COM
                 try:
-                    pythoncom.CoUninitialize()
-                except:
-                    pass
+                    # Open document
+                    self.update_status(f"Opening document...")
+                    with span('open', file=input_path.name):
+                        document = session.open(input_path.resolve())
+                    
+                    # Convert to PDF
+                    self.update_status("Converting to PDF with optimized settings...")
+                    self.update_status("Preserving all images, drawings, and formatting...")
+                    
+                    # Create output directory if needed
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    
+                    # Export as PDF with best quality settings
+                    with span('export', file=input_path.name):
+                        unshare_output(output_path)
+                        session.export(document, output_path.resolve(), EXPORT_OPTIONS)
+                    exported = True
+                    
+                    self.update_status("Cleaning up...")
+                    
+                finally:
+                    # Close the document to release its file lock; Word stays running
+                    self.update_status("Releasing file locks and cleaning up...")
+                    
+                    if document is not None:
+                        try:
+                            with span('close', file=input_path.name):
+                                session.close(document)
+                            # Release COM reference
+                            document = None
+                        except Exception as e:
+                            print(f"Warning: Error closing document: {e}")
+                    
+                    # Keep Word warm for the next file, unless it has to be restarted.
+                    # Tearing the session down clears its pid, so read it first.
+                    pid = session.pid
+                    pool.release(session, failed=not exported)
+                    if pool.session is session:
+                        pid = None
+                    session = None
+                    
+                    # Wait until Word has released the files (usually a few milliseconds)
+                    pdf_path = output_path if exported else None
+                    with span('wait for release') as wait:
+                        wait['result'] = wait_for_release(input_path, pdf_path, pid, timeout=0.5)
+                    if wait['result'] == 'timeout':
+                        # Stray COM references can keep Word alive; collect them and wait again
+                        import gc
+                        with span('gc.collect'):
+                            gc.collect()
+                        with span('wait for release') as wait:
+                            wait['result'] = wait_for_release(input_path, pdf_path, pid, timeout=1.5)
             
             # Verify the PDF was actually created
             if output_path.exists():
+                self.index.record(input_path, output_path)
                 file_size = output_path.stat().st_size / (1024 * 1024)
                 self.conversion_complete(str(output_path), file_size)
             else:
@@ -449,6 +519,31 @@ class WordToPDFConverterGUI:
         except Exception as e:
             self.conversion_error(str(e))
     
+    def start_eta(self, estimate_seconds):
+        """Start filling the progress bar towards the estimated finish (main thread)"""
+        self.eta_started = time.monotonic()
+        self.eta_seconds = max(estimate_seconds, 1.0)
+        self.tick_eta()
+    
+    def tick_eta(self):
+        """Update the progress bar and time remaining until the conversion finishes"""
+        if not self.is_converting or self.eta_started is None:
+            return
+        elapsed = time.monotonic() - self.eta_started
+        # Hold short of the end until the PDF has actually been written
+        self.progress_bar['value'] = min(95, 100 * elapsed / self.eta_seconds)
+        if elapsed < self.eta_seconds:
+            self.eta_text.set(f"About {format_duration(self.eta_seconds - elapsed)} remaining")
+        else:
+            self.eta_text.set(f"{format_duration(elapsed)} elapsed, taking longer than estimated...")
+        self.root.after(250, self.tick_eta)
+    
+    def stop_eta(self, finished):
+        """Fill or reset the progress bar when the conversion ends"""
+        self.eta_started = None
+        self.progress_bar['value'] = 100 if finished else 0
+        self.eta_text.set("")
+    
     def update_status(self, message):
         """Update status message (thread-safe)"""
         self.root.after(0, lambda: self.status_text.set(message))
@@ -456,7 +551,7 @@ class WordToPDFConverterGUI:
     def conversion_complete(self, output_path, file_size=0):
         """Handle successful conversion (thread-safe)"""
         def update_ui():
-            self.progress_bar.stop()
+            self.stop_eta(finished=True)
             self.is_converting = False
             self.convert_btn.config(state='normal', bg=self.primary_color)
             
@@ -481,7 +576,7 @@ class WordToPDFConverterGUI:
     def conversion_error(self, error_message):
         """Handle conversion error (thread-safe)"""
         def update_ui():
-            self.progress_bar.stop()
+            self.stop_eta(finished=False)
             self.is_converting = False
             self.convert_btn.config(state='normal', bg=self.primary_color)
             self.status_text.set(f"❌ Conversion failed")
@@ -521,6 +616,12 @@ class WordToPDFConverterGUI:
                     f"Neither the file nor folder exists:\n{output_path}"
                 )
     
+    def close(self):
+        """Quit the background Word instance once any running conversion has finished"""
+        self.word.close()
+        if self.timings is not None:
+            self.timings.close()
+    
     def open_pdf_file(self):
         """Open the generated PDF file"""
         if self.output_file.get():
@@ -544,9 +645,30 @@ class WordToPDFConverterGUI:
 
 def main():
     """Main function to run the GUI application"""
-    root = tk.Tk()
-    app = WordToPDFConverterGUI(root)
-    root.mainloop()
+    parser = argparse.ArgumentParser(description='Word to PDF Converter GUI')
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT, metavar='SECONDS',
+                        help=f'Quit the background Word instance after this many idle seconds, '
+                             f'0 = never (default: {DEFAULT_IDLE_TIMEOUT})')
+    parser.add_argument('--no-prewarm', action='store_true',
+                        help='Do not start Word at startup; start it when a file is selected instead')
+    parser.add_argument('--timings', nargs='?', const=str(DEFAULT_TIMINGS_PATH), metavar='FILE',
+                        help='Record conversion timings and learn estimates from them '
+                             f'(default file: {DEFAULT_TIMINGS_PATH})')
+    add_backend_arguments(parser)
+    add_trace_argument(parser)
+    args, _ = parser.parse_known_args()
+    
+    # Spans from every conversion in this session are written when the window closes
+    with tracing(args.trace):
+        root = tk.Tk()
+        app = WordToPDFConverterGUI(root, backend=args.backend,
+                                    backend_options=parse_backend_options(args.backend_option),
+                                    idle_timeout=args.idle_timeout, prewarm=not args.no_prewarm,
+                                    timings=TimingStore(args.timings) if args.timings else None)
+        try:
+            root.mainloop()
+        finally:
+            app.close()
 
 
 if __name__ == "__main__":